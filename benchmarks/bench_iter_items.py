@@ -0,0 +1,81 @@
+"""Compares peak memory and time to first item of get_items and iter_items.
+
+The response body is streamed in 64 KiB chunks from an in-process
+transport, so the numbers reflect the client and not the network.
+
+Run from the repository root:
+
+    python benchmarks/bench_iter_items.py
+"""
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_serializer import summary_items  # noqa: E402
+from onepasswordconnectsdk.client import Client  # noqa: E402
+
+ITEM_COUNT = 50000
+CHUNK_SIZE = 64 * 1024
+VAULT_ID = "hfnjvi6aymbsnfc2xeeoheizda"
+
+
+def new_client(body):
+    def chunks():
+        for i in range(0, len(body), CHUNK_SIZE):
+            yield body[i:i + CHUNK_SIZE]
+
+    def handler(request):
+        return httpx.Response(200, content=chunks())
+
+    client = Client("https://mock_host", "jwt_token")
+    client.session = httpx.Client(base_url="https://mock_host", transport=httpx.MockTransport(handler))
+    return client
+
+
+def measure(name, consume, body):
+    client = new_client(body)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    first, count = consume(client)
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<12} {count} items  peak {peak / 2 ** 20:8.2f} MiB  "
+        f"first item {(first - start) * 1000:8.2f} ms  total {total * 1000:8.2f} ms"
+    )
+
+
+def consume_list(client):
+    items = client.get_items(VAULT_ID)
+    first = time.perf_counter()
+    count = 0
+    for _ in items:
+        count += 1
+    return first, count
+
+
+def consume_iterator(client):
+    first = None
+    count = 0
+    for _ in client.iter_items(VAULT_ID):
+        if first is None:
+            first = time.perf_counter()
+        count += 1
+    return first, count
+
+
+if __name__ == "__main__":
+    body = json.dumps(summary_items(ITEM_COUNT)).encode()
+    print(f"{len(body) / 2 ** 20:.1f} MiB response body")
+    measure("get_items", consume_list, body)
+    measure("iter_items", consume_iterator, body)
@@ -0,0 +1,48 @@
+"""Measures memory use and construction time of deserialized models.
+
+Run from the repository root:
+
+    python benchmarks/bench_models.py
+"""
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_serializer import large_item, summary_items  # noqa: E402
+from onepasswordconnectsdk.serializer import Serializer  # noqa: E402
+
+SUMMARY_COUNT = 5000
+ITEM_COUNT = 100
+FIELD_COUNT = 300
+
+
+def measure(name, payload, response_type, number):
+    body = json.dumps(payload).encode()
+    serializer = Serializer("json")
+    data = serializer.decode(body)
+
+    gc.collect()
+    tracemalloc.start()
+    result = serializer.to_model(data, response_type)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    seconds = min(timeit.repeat(lambda: serializer.to_model(data, response_type), number=number, repeat=5))
+    print(f"{name:<40} {size / 2 ** 20:8.2f} MiB  {seconds / number * 1000:8.2f} ms to construct")
+
+
+if __name__ == "__main__":
+    measure(f"list[SummaryItem] ({SUMMARY_COUNT} items)", summary_items(SUMMARY_COUNT), "list[SummaryItem]", 3)
+    measure(
+        f"list[Item] ({ITEM_COUNT} x {FIELD_COUNT} fields)",
+        [large_item(FIELD_COUNT) for _ in range(ITEM_COUNT)],
+        "list[Item]",
+        3,
+    )
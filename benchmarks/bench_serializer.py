@@ -0,0 +1,152 @@
+"""Measures Serializer.deserialize throughput on large listings and items,
+next to the recursive deserializer it replaced.
+
+Run from the repository root:
+
+    python benchmarks/bench_serializer.py
+"""
+import datetime
+import json
+import re
+import sys
+import timeit
+from pathlib import Path
+
+from dateutil.parser import parse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import onepasswordconnectsdk  # noqa: E402
+from onepasswordconnectsdk.serializer import Serializer  # noqa: E402
+
+SUMMARY_COUNT = 5000
+FIELD_COUNT = 300
+
+
+class ReferenceSerializer:
+    """The recursive deserializer used before converters were compiled per type"""
+    PRIMITIVE_TYPES = (float, bool, bytes, str, int)
+    NATIVE_TYPES_MAPPING = {
+        "int": int,
+        "float": float,
+        "str": str,
+        "bool": bool,
+        "date": datetime.date,
+        "datetime": datetime.datetime,
+        "object": object,
+    }
+
+    def deserialize(self, response, response_type):
+        try:
+            data = json.loads(response)
+        except ValueError:
+            data = response
+        return self._deserialize(data, response_type)
+
+    def _deserialize(self, data, klass):
+        if data is None:
+            return None
+
+        if type(klass) == str:
+            if klass.startswith("list["):
+                sub_kls = re.match(r"list\[(.*)\]", klass).group(1)
+                return [self._deserialize(sub_data, sub_kls) for sub_data in data]
+            if klass.startswith("dict("):
+                sub_kls = re.match(r"dict\(([^,]*), (.*)\)", klass).group(2)
+                return {k: self._deserialize(v, sub_kls) for k, v in data.items()}
+            if klass in self.NATIVE_TYPES_MAPPING:
+                klass = self.NATIVE_TYPES_MAPPING[klass]
+            else:
+                klass = getattr(onepasswordconnectsdk.models, klass)
+
+        if klass in self.PRIMITIVE_TYPES:
+            try:
+                return klass(data)
+            except UnicodeEncodeError:
+                return str(data)
+            except TypeError:
+                return data
+        elif klass == object:
+            return data
+        elif klass == datetime.date:
+            return parse(data).date()
+        elif klass == datetime.datetime:
+            return parse(data)
+        return self._deserialize_model(data, klass)
+
+    def _deserialize_model(self, data, klass):
+        has_discriminator = hasattr(klass, "get_real_child_model") and klass.discriminator_value_class_map
+        if not klass.openapi_types and not has_discriminator:
+            return data
+
+        kwargs = {}
+        if klass.openapi_types is not None and isinstance(data, (list, dict)):
+            for attr, attr_type in klass.openapi_types.items():
+                if klass.attribute_map[attr] in data:
+                    kwargs[attr] = self._deserialize(data[klass.attribute_map[attr]], attr_type)
+
+        instance = klass(**kwargs)
+        if has_discriminator:
+            klass_name = instance.get_real_child_model(data)
+            if klass_name:
+                instance = self._deserialize(data, klass_name)
+        return instance
+
+
+def summary_items(count):
+    return [
+        {
+            "id": f"item{i:022d}",
+            "title": f"Item {i}",
+            "version": i % 50,
+            "vault": {"id": "hfnjvi6aymbsnfc2xeeoheizda"},
+            "category": "LOGIN",
+            "tags": ["ops", "db"],
+            "urls": [{"primary": True, "href": f"https://host{i}.example.com"}],
+            "lastEditedBy": "DOIHOHSV2NHK5HMSOLCWJUXFDM",
+            "createdAt": "2020-10-29T17:52:17Z",
+            "updatedAt": "2020-11-10T14:05:53Z",
+        }
+        for i in range(count)
+    ]
+
+
+def large_item(field_count):
+    return {
+        "id": "wepiqdxdzncjtnvmv5fegud4qy",
+        "title": "Certificates",
+        "version": 3,
+        "vault": {"id": "hfnjvi6aymbsnfc2xeeoheizda"},
+        "category": "SERVER",
+        "sections": [{"id": f"section{i}", "label": f"Section {i}"} for i in range(10)],
+        "fields": [
+            {
+                "id": f"field{i}",
+                "type": "CONCEALED",
+                "label": f"label {i}",
+                "value": "x" * 64,
+                "section": {"id": f"section{i % 10}"},
+            }
+            for i in range(field_count)
+        ],
+        "createdAt": "2020-10-29T17:52:17Z",
+        "updatedAt": "2020-11-10T14:05:53Z",
+    }
+
+
+def timed(serializer, body, response_type, number):
+    """Returns the best time in seconds per payload over five runs"""
+    return min(timeit.repeat(lambda: serializer.deserialize(body, response_type), number=number, repeat=5)) / number
+
+
+def bench(name, payload, response_type, number):
+    body = json.dumps(payload).encode()
+    reference = timed(ReferenceSerializer(), body, response_type, number)
+    compiled = timed(Serializer(), body, response_type, number)
+    print(f"{name:<34} {reference * 1000:10.2f} ms {compiled * 1000:10.2f} ms {reference / compiled:8.1f}x")
+
+
+if __name__ == "__main__":
+    print(f"{'payload':<34} {'reference':>13} {'compiled':>13} {'speedup':>9}")
+    bench(f"list[SummaryItem] ({SUMMARY_COUNT} items)", summary_items(SUMMARY_COUNT), "list[SummaryItem]", 3)
+    bench(f"Item ({FIELD_COUNT} fields)", large_item(FIELD_COUNT), "Item", 50)
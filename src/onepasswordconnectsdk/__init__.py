@@ -1,11 +1,15 @@
 from onepasswordconnectsdk import client
 from onepasswordconnectsdk import models
+from onepasswordconnectsdk.config import aload
+from onepasswordconnectsdk.config import aload_dict
 from onepasswordconnectsdk.config import load
 from onepasswordconnectsdk.config import load_dict
 from onepasswordconnectsdk.client import new_client
 from onepasswordconnectsdk.client import new_client_from_environment
 
 __all__ = [
+    "aload",
+    "aload_dict",
     "client",
     "load",
     "load_dict",
@@ -1,103 +1,256 @@
 """Python AsyncClient for connecting to 1Password Connect"""
+import asyncio
 import httpx
-from httpx import HTTPError
-from typing import Dict, List, Union, Optional
+from collections import Counter
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Set, Tuple, Union, Optional
 import os
+import time
 
 from onepasswordconnectsdk.serializer import Serializer
+from onepasswordconnectsdk.sessions import SHARED_SESSIONS
+from onepasswordconnectsdk.singleflight import AsyncSingleFlight
+from onepasswordconnectsdk.cache import NOT_FOUND
 from onepasswordconnectsdk.config import ClientConfig
-from onepasswordconnectsdk.utils import build_headers, is_valid_uuid, PathBuilder, get_timeout
+from onepasswordconnectsdk.json_stream import aiter_json_array
+from onepasswordconnectsdk.utils import (
+    HEALTH_PATH,
+    HEARTBEAT_PATH,
+    JSON_CONTENT_TYPE,
+    atomic_write,
+    build_headers,
+    decode_response,
+    is_unavailable,
+    is_valid_uuid,
+    gather_concurrently,
+    PathBuilder,
+    get_timeout,
+)
 from onepasswordconnectsdk.errors import (
+    FailedToRetrieveHealthException,
     FailedToRetrieveItemException,
     FailedToRetrieveVaultException,
 )
-from onepasswordconnectsdk.models import File, Item, ItemVault, SummaryItem, Vault
+from onepasswordconnectsdk.models import BulkReport, File, FileDownload, Item, ItemResult, ItemVault, SummaryItem, Vault
 
 
 class AsyncClient:
     """Python Async Client Class"""
 
-    def __init__(self, url: str, token: str, config: Optional[ClientConfig] = None) -> None:
+    def __init__(self, url: str, token: str, config: Optional[ClientConfig] = None, shared: bool = False) -> None:
         """Initialize async client
 
         Args:
             url (str): The url of the 1Password Connect API
             token (str): The 1Password Service Account token
             config (Optional[ClientConfig]): Optional configuration for httpx client
+            shared (bool): Whether to share the HTTP session, and its connection pool, with the
+                other shared async clients created with the same url, token and config
         """
         self.url = url
         self.token = token
         self.config = config
-        self.session = self.create_session(url, token)
-        self.serializer = Serializer()
+        self._closed = False
+        self._session_key = (AsyncClient, url, token, config) if shared else None
+        if shared:
+            self.session = SHARED_SESSIONS.acquire(self._session_key, lambda: self.create_session(url, token))
+        else:
+            self.session = self.create_session(url, token)
+        self.serializer = Serializer(config.json_backend) if config else Serializer()
+        self.item_cache = config.item_cache if config else None
+        self.title_cache = config.title_cache if config else None
+        self.conditional_cache = config.conditional_cache if config else None
+        self.persistent_cache = config.persistent_cache if config else None
+        self.retry_policy = config.retry if config else None
+        self.rate_limiter = config.rate_limiter if config else None
+        self.coalescer = AsyncSingleFlight() if config and config.coalesce_requests else None
+        # Set by new_client(..., warm=True) to the task warming up the client
+        self.warmup_task: Optional[asyncio.Task] = None
+        # Background refreshes of stale cached items, referenced until they complete
+        self._refresh_tasks: Set[asyncio.Task] = set()
 
     def create_session(self, url: str, token: str) -> httpx.AsyncClient:
         headers = self.build_headers(token)
         timeout = get_timeout()
 
-        if self.config:
-            client_args = self.config.get_client_args(url, headers, timeout)
-            return httpx.AsyncClient(**client_args)
-
-        return httpx.AsyncClient(base_url=url, headers=headers, timeout=timeout)
+        client_args = (self.config or ClientConfig()).get_client_args(url, headers, timeout)
+        return httpx.AsyncClient(**client_args)
 
     def build_headers(self, token: str) -> Dict[str, str]:
         return build_headers(token)
 
+    async def aclose(self) -> None:
+        """Closes the HTTP session, or releases this client's reference to a shared one"""
+        if self._closed:
+            return
+        self._closed = True
+        session = self.session if self._session_key is None else SHARED_SESSIONS.release(self._session_key)
+        if session is not None:
+            await session.aclose()
+
     async def __aexit__(self):
-        await self.session.aclose()
+        await self.aclose()
+
+    async def warmup(self, connections: int = 1, health: bool = True) -> Optional[dict]:
+        """Opens pooled connections and checks the server ahead of the first real request
+
+        Sends `connections` heartbeat requests at once, which makes the pool
+        open up to as many connections, paying DNS, TCP and TLS setup now.
+
+        Args:
+            connections (int): The number of heartbeat requests sent at once
+            health (bool): Whether to also fetch the server health
+
+        Raises:
+            FailedToRetrieveHealthException: Thrown when a HTTP error is returned
+            from the 1Password Connect API
+
+        Returns:
+            Optional[dict]: The server health, when requested
+        """
+        results = await gather_concurrently((self._heartbeat() for _ in range(connections)), connections)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        if not health:
+            return None
+        response = await self.build_request("GET", HEALTH_PATH)
+        return decode_response(self.serializer, response, HEALTH_PATH, FailedToRetrieveHealthException, "retrieve health")
+
+    async def _heartbeat(self) -> None:
+        response = await self.build_request("GET", HEARTBEAT_PATH)
+        decode_response(self.serializer, response, HEARTBEAT_PATH, FailedToRetrieveHealthException, "retrieve heartbeat")
 
     async def get_file(self, file_id: str, item_id: str, vault_id: str) -> File:
         url = PathBuilder().vaults(vault_id).items(item_id).files(file_id).build()
-        response = await self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to retrieve item. Received {response.status_code}\
-                                     for {url} with message: {response.json().get('message')}"
-            )
-        return self.serializer.deserialize(response.content, "File")
+        return await self._get(url, FailedToRetrieveItemException, "retrieve item", "File")
 
     async def get_files(self, item_id: str, vault_id: str) -> List[File]:
         url = PathBuilder().vaults(vault_id).items(item_id).files().build()
-        response = await self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to retrieve item. Received {response.status_code}\
-                             for {url} with message: {response.json().get('message')}"
-            )
-        return self.serializer.deserialize(response.content, "list[File]")
+        return await self._get(url, FailedToRetrieveItemException, "retrieve item", "list[File]")
 
     async def get_file_content(self, file_id: str, item_id: str, vault_id: str, content_path: str = None) -> Union[bytes, str]:
         url = content_path
         if content_path is None:
             url = PathBuilder().vaults(vault_id).items(item_id).files(file_id).content().build()
         response = await self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to retrieve items. Received {response.status_code} \
-                     for {url} with message: {response.json().get('message')}"
-            )
+        if not response.is_success:
+            decode_response(self.serializer, response, url, FailedToRetrieveItemException, "retrieve items")
         return response.content
 
     async def download_file(self, file_id: str, item_id: str, vault_id: str, path: str) -> None:
+        """Downloads a file's contents into the given directory
+
+        The content is streamed into a temporary file next to the
+        destination, which is renamed into place once the download has
+        completed, so memory use does not grow with the size of the file.
+
+        Args:
+            file_id (str): The id of the file
+            item_id (str): The id of the item the file belongs to
+            vault_id (str): The id of the vault the item belongs to
+            path (str): The directory in which to write the file
+
+        Raises:
+            FailedToRetrieveItemException: Thrown when a HTTP error is returned
+            from the 1Password Connect API
+        """
         file_object = await self.get_file(file_id, item_id, vault_id)
-        filename = file_object.name or "1password_item_file.txt"
-        content = await self.get_file_content(file_id, item_id, vault_id, file_object.content_path)
-        global_path = os.path.join(path, filename)
+        await self._download(file_object, item_id, vault_id, self._download_path(file_object, path))
+
+    async def download_files(self, item_id: str, vault_id: str, path: str, concurrency: int = 4) -> List[FileDownload]:
+        """Downloads every file of an item into the given directory
+
+        The files are listed once and each file's content is then streamed
+        straight from its content path, with at most `concurrency` downloads
+        running at once. A failed download does not stop the others; it is
+        reported through the `error` of its result.
+
+        Files sharing a name, including unnamed ones, are written under that
+        name followed by their file id, so no download overwrites another.
+
+        Args:
+            item_id (str): The id of the item whose files to download
+            vault_id (str): The id of the vault the item belongs to
+            path (str): The directory in which to write the files
+            concurrency (int): The maximum number of simultaneous downloads
 
-        file = open(global_path, "wb")
-        file.write(content)
-        file.close()
+        Raises:
+            FailedToRetrieveItemException: Thrown when the files of the item
+            cannot be listed
+
+        Returns:
+            List[FileDownload]: The outcome of each download, in listing order
+        """
+        files = await self.get_files(item_id, vault_id)
+        destinations = self._download_paths(files, path)
+        results = await gather_concurrently(
+            (
+                self._download(file_object, item_id, vault_id, destination)
+                for file_object, destination in zip(files, destinations)
+            ),
+            concurrency,
+        )
+        return [
+            FileDownload(file_object, destination, error=result)
+            if isinstance(result, BaseException) else result
+            for file_object, destination, result in zip(files, destinations, results)
+        ]
+
+    async def _download(self, file_object: File, item_id: str, vault_id: str, destination: str) -> FileDownload:
+        url = file_object.content_path
+        if url is None:
+            url = PathBuilder().vaults(vault_id).items(item_id).files(file_object.id).content().build()
+
+        start = time.perf_counter()
+        bytes_written = await self._stream_to_file(url, destination)
+        return FileDownload(file_object, destination, bytes_written, time.perf_counter() - start)
+
+    @staticmethod
+    def _download_path(file_object: File, path: str) -> str:
+        return os.path.join(path, file_object.name or "1password_item_file.txt")
+
+    @classmethod
+    def _download_paths(cls, files: List[File], path: str) -> List[str]:
+        """Returns the destination of each file, adding the file id to names shared by several files"""
+        destinations = [cls._download_path(file_object, path) for file_object in files]
+        counts = Counter(destinations)
+        for index, (file_object, destination) in enumerate(zip(files, destinations)):
+            if counts[destination] > 1:
+                stem, extension = os.path.splitext(destination)
+                destinations[index] = f"{stem}-{file_object.id}{extension}"
+        return destinations
+
+    async def _stream_to_file(self, url: str, destination: str) -> int:
+        """Streams the body of a GET request into destination, returning the number of bytes written"""
+        async with self._stream_request("GET", url) as response:
+            if not response.is_success:
+                await response.aread()
+                decode_response(self.serializer, response, url, FailedToRetrieveItemException, "retrieve items")
+
+            # the temporary file, its writes and the final rename all run on a
+            # worker thread, so a large download does not stall the event loop
+            writer = atomic_write(destination)
+            file = await asyncio.to_thread(writer.__enter__)
+            try:
+                async for chunk in response.aiter_bytes():
+                    await asyncio.to_thread(file.write, chunk)
+                bytes_written = file.tell()
+            except BaseException as e:
+                await asyncio.to_thread(writer.__exit__, type(e), e, e.__traceback__)
+                raise
+            await asyncio.to_thread(writer.__exit__, None, None, None)
+            return bytes_written
 
     async def get_item(self, item: str, vault: str) -> Item:
         """Get a specific item
 
+        With a persistent cache configured, a recently stored copy of the
+        item is returned without contacting the server, and an older one is
+        returned when the server is unavailable.
+
         Args:
             item (str): the id or title of the item to be fetched
             vault (str): the id or name of the vault in which to get the item from
@@ -109,12 +262,42 @@ class AsyncClient:
         Returns:
             Item object: The found item
         """
+        cache = self.persistent_cache
+        if cache is None:
+            return await self._resolve_item(item, vault)
 
-        vault_id = vault
-        if not is_valid_uuid(vault):
-            vault = await self.get_vault_by_title(vault)
-            vault_id = vault.id
-
+        stored = await asyncio.to_thread(cache.get, vault, item)
+        if stored is not None:
+            return stored
+        try:
+            found = await self._resolve_item(item, vault)
+        except Exception as e:
+            stored = await asyncio.to_thread(cache.fallback, vault, item) if is_unavailable(e) else None
+            if stored is None:
+                raise
+            return stored
+        await asyncio.to_thread(cache.set, vault, item, found)
+        return found
+
+    async def _resolve_item(self, item: str, vault: str) -> Item:
+        if is_valid_uuid(vault):
+            return await self._resolve_item_in_vault(item, vault)
+
+        cached_id = self._get_cached_vault_id(vault)
+        vault_id = cached_id or (await self.get_vault_by_title(vault)).id
+        try:
+            return await self._resolve_item_in_vault(item, vault_id)
+        except FailedToRetrieveItemException as exc:
+            if cached_id is None or exc.status_code != 404:
+                raise
+            # the vault may have been deleted, or recreated under the same name, since its id was cached
+            self._forget_vault_id(vault)
+            vault_id = (await self.get_vault_by_title(vault)).id
+            if vault_id == cached_id:
+                raise
+        return await self._resolve_item_in_vault(item, vault_id)
+
+    async def _resolve_item_in_vault(self, item: str, vault_id: str) -> Item:
         if not is_valid_uuid(item):
             return await self.get_item_by_title(item, vault_id)
         try:
@@ -138,17 +321,60 @@ class AsyncClient:
         Returns:
             Item object: The found item
         """
+        if self.item_cache is not None:
+            cached_item, refresh = self.item_cache.lookup(vault_id, item_id)
+            if refresh:
+                self._refresh_item(item_id, vault_id)
+            if cached_item is not None:
+                return cached_item
+
+        return await self._fetch_item(item_id, vault_id)
+
+    async def _fetch_item(self, item_id: str, vault_id: str) -> Item:
         url = PathBuilder().vaults(vault_id).items(item_id).build()
-        response = await self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to retrieve item. Received {response.status_code}\
-                     for {url} with message: {response.json().get('message')}",
-                status_code=response.status_code,
-            )
-        return self.serializer.deserialize(response.content, "Item")
+        item = await self._get(url, FailedToRetrieveItemException, "retrieve item", "Item")
+        if self.item_cache is not None:
+            self.item_cache.set(vault_id, item_id, item)
+        return item
+
+    def _refresh_item(self, item_id: str, vault_id: str) -> None:
+        """Fetches a fresh copy of a stale cached item on a background task"""
+        async def refresh() -> None:
+            error = None
+            try:
+                await self._fetch_item(item_id, vault_id)
+            except Exception as e:
+                error = e
+            finally:
+                self.item_cache.finish_refresh(vault_id, item_id, error)
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def get_items_by_ids(self, item_ids: List[str], vault_id: str, concurrency: int = 8) -> List[ItemResult]:
+        """Get several items by uuid, fetching at most `concurrency` of them at once
+
+        A failed fetch does not abort the batch; it is reported through the
+        `error` of that item's result.
+
+        Args:
+            item_ids (List[str]): The ids of the items to be fetched
+            vault_id (str): The id of the vault in which to get the items from
+            concurrency (int): The maximum number of simultaneous requests
+
+        Returns:
+            List[ItemResult]: The result for each id, in the order of item_ids
+        """
+        item_ids = list(item_ids)
+        results = await gather_concurrently(
+            (self.get_item_by_id(item_id, vault_id) for item_id in item_ids),
+            concurrency,
+        )
+        return [
+            ItemResult(item_id, error=result) if isinstance(result, BaseException) else ItemResult(item_id, result)
+            for item_id, result in zip(item_ids, results)
+        ]
 
     async def get_item_by_title(self, title: str, vault_id: str) -> Item:
         """Get a specific item by title
@@ -164,24 +390,49 @@ class AsyncClient:
         Returns:
             Item object: The found item
         """
+        item_id = None
+        if self.title_cache is not None:
+            item_id = self.title_cache.get_item_id(vault_id, title)
+            if item_id is NOT_FOUND:
+                raise FailedToRetrieveItemException(
+                    f"Found 0 items in vault {vault_id} with \
+                    title {title}"
+                )
+        if item_id is None and self.item_cache is not None:
+            item_id = self.item_cache.get_item_id(vault_id, title)
+        if item_id is not None:
+            try:
+                item = await self.get_item_by_id(item_id, vault_id)
+            except FailedToRetrieveItemException as exc:
+                if exc.status_code != 404:
+                    raise
+            else:
+                if item.title == title:
+                    if self.item_cache is not None:
+                        self.item_cache.set_item_id(vault_id, title, item_id)
+                    return item
+            if self.title_cache is not None:
+                self.title_cache.invalidate_item(vault_id, title)
+            if self.item_cache is not None:
+                self.item_cache.set_item_id(vault_id, title, None)
+
         filter_query = f'title eq "{title}"'
         url = PathBuilder().vaults(vault_id).items().query("filter", filter_query).build()
-        response = await self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to retrieve items. Received {response.status_code} \
-                     for {url} with message: {response.json().get('message')}"
-            )
+        data = await self._get(url, FailedToRetrieveItemException, "retrieve items")
 
-        if len(response.json()) != 1:
+        if len(data) != 1:
+            if self.title_cache is not None and len(data) == 0:
+                self.title_cache.set_item_id(vault_id, title, None)
             raise FailedToRetrieveItemException(
-                f"Found {len(response.json())} items in vault {vault_id} with \
+                f"Found {len(data)} items in vault {vault_id} with \
                     title {title}"
             )
 
-        item_summary = self.serializer.deserialize(response.content, "list[SummaryItem]")[0]
+        item_summary = self.serializer.to_model(data[0], "SummaryItem")
+        if self.title_cache is not None:
+            self.title_cache.set_item_id(vault_id, title, item_summary.id)
+        if self.item_cache is not None:
+            self.item_cache.set_item_id(vault_id, title, item_summary.id)
         return await self.get_item_by_id(item_summary.id, vault_id)
 
     async def get_items(self, vault_id: str, filter_query: str = None) -> List[SummaryItem]:
@@ -201,16 +452,38 @@ class AsyncClient:
             url = PathBuilder().vaults(vault_id).items().build()
         else:
             url = PathBuilder().vaults(vault_id).items().query("filter", filter_query).build()
-        response = await self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to retrieve items. Received {response.status_code} \
-                     for {url} with message: {response.json().get('message')}"
-            )
+        return await self._get(url, FailedToRetrieveItemException, "retrieve items", "list[SummaryItem]")
+
+    async def aiter_items(self, vault_id: str, filter_query: str = None) -> AsyncIterator[SummaryItem]:
+        """Yields the item summaries for the specified vault while the response is received
+
+        Unlike get_items, the response is parsed incrementally and never held
+        in memory as a whole, which keeps memory bounded for very large vaults.
+
+        Args:
+            vault_id (str): The id of the vault in which to get the items from
+            filter_query (str): A optional query statement. `title eq "Example Item"`
+
+        Raises:
+            FailedToRetrieveItemException: Thrown when a HTTP error is returned
+            from the 1Password Connect API
+            FailedToDeserializeException: Thrown when the response is not a JSON array
 
-        return self.serializer.deserialize(response.content, "list[SummaryItem]")
+        Yields:
+            SummaryItem: The summarized items, in the order the API returns them
+        """
+        if filter_query is None:
+            url = PathBuilder().vaults(vault_id).items().build()
+        else:
+            url = PathBuilder().vaults(vault_id).items().query("filter", filter_query).build()
+
+        async with self._stream_request("GET", url) as response:
+            if not response.is_success:
+                await response.aread()
+                decode_response(self.serializer, response, url, FailedToRetrieveItemException, "retrieve items")
+
+            async for data in aiter_json_array(response.aiter_text()):
+                yield self.serializer.to_model(data, SummaryItem)
 
     async def delete_item(self, item_id: str, vault_id: str) -> None:
         """Deletes a specified item from a specified vault
@@ -226,13 +499,13 @@ class AsyncClient:
         """
         url = PathBuilder().vaults(vault_id).items(item_id).build()
         response = await self.build_request("DELETE", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to delete item. Received {response.status_code}\
-                     for {url} with message: {response.json().get('message')}"
-            )
+        if self.item_cache is not None:
+            self.item_cache.invalidate(vault_id, item_id)
+        if self.persistent_cache is not None:
+            await asyncio.to_thread(self.persistent_cache.invalidate, vault_id, item_id)
+        if self.conditional_cache is not None:
+            self.conditional_cache.invalidate(url)
+        decode_response(self.serializer, response, url, FailedToRetrieveItemException, "delete item")
 
     async def create_item(self, vault_id: str, item: Item) -> Item:
         """Creates an item at the specified vault
@@ -251,14 +524,10 @@ class AsyncClient:
 
         url = PathBuilder().vaults(vault_id).items().build()
         response = await self.build_request("POST", url, item)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to post item. Received {response.status_code}\
-                    for {url} with message: {response.json().get('message')}"
-            )
-        return self.serializer.deserialize(response.content, "Item")
+        if self.title_cache is not None and item.title is not None:
+            self.title_cache.invalidate_item(vault_id, item.title)
+        data = decode_response(self.serializer, response, url, FailedToRetrieveItemException, "post item")
+        return self.serializer.to_model(data, "Item")
 
     async def update_item(self, item_uuid: str, vault_id: str, item: Item) -> Item:
         """Update the specified item at the specified vault.
@@ -280,14 +549,109 @@ class AsyncClient:
         item.vault = ItemVault(id=vault_id)
 
         response = await self.build_request("PUT", url, item)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to post item. Received {response.status_code}\
-                    for {url} with message: {response.json().get('message')}"
-            )
-        return self.serializer.deserialize(response.content, "Item")
+        if self.conditional_cache is not None:
+            self.conditional_cache.invalidate(url)
+        if self.persistent_cache is not None:
+            await asyncio.to_thread(self.persistent_cache.invalidate, vault_id, item_uuid)
+        if self.title_cache is not None and item.title is not None:
+            self.title_cache.invalidate_item(vault_id, item.title)
+        if not response.is_success and self.item_cache is not None:
+            self.item_cache.invalidate(vault_id, item_uuid)
+        data = decode_response(self.serializer, response, url, FailedToRetrieveItemException, "post item")
+        updated_item = self.serializer.to_model(data, "Item")
+        if self.item_cache is not None:
+            self.item_cache.set(vault_id, item_uuid, updated_item)
+        return updated_item
+
+    async def create_items(
+        self, vault_id: str, items: List[Item], concurrency: int = 8, stop_on_error: bool = False
+    ) -> BulkReport:
+        """Creates several items at the specified vault, running at most `concurrency` requests at once
+
+        Args:
+            vault_id (str): The id of the vault in which add the items to
+            items (List[Item]): The items to create
+            concurrency (int): The maximum number of simultaneous requests
+            stop_on_error (bool): Whether to skip the operations that have not
+            started yet once one of them fails
+
+        Returns:
+            BulkReport: The result for each item, in the order of items. The
+            result of a created item holds the item returned by the API.
+        """
+        return await self._run_bulk(
+            [(item.id, partial(self.create_item, vault_id, item)) for item in items], concurrency, stop_on_error
+        )
+
+    async def update_items(
+        self, items: List[Item], vault_id: str, concurrency: int = 8, stop_on_error: bool = False
+    ) -> BulkReport:
+        """Updates several items at the specified vault, running at most `concurrency` requests at once
+
+        Args:
+            items (List[Item]): The updated items, each identified by its id
+            vault_id (str): The id of the vault in which to update the items
+            concurrency (int): The maximum number of simultaneous requests
+            stop_on_error (bool): Whether to skip the operations that have not
+            started yet once one of them fails
+
+        Returns:
+            BulkReport: The result for each item, in the order of items. The
+            result of an updated item holds the item returned by the API.
+        """
+        return await self._run_bulk(
+            [(item.id, partial(self.update_item, item.id, vault_id, item)) for item in items],
+            concurrency,
+            stop_on_error,
+        )
+
+    async def delete_items(
+        self, item_ids: List[str], vault_id: str, concurrency: int = 8, stop_on_error: bool = False
+    ) -> BulkReport:
+        """Deletes several items from the specified vault, running at most `concurrency` requests at once
+
+        Args:
+            item_ids (List[str]): The ids of the items to delete
+            vault_id (str): The id of the vault in which to delete the items
+            concurrency (int): The maximum number of simultaneous requests
+            stop_on_error (bool): Whether to skip the operations that have not
+            started yet once one of them fails
+
+        Returns:
+            BulkReport: The result for each id, in the order of item_ids
+        """
+        return await self._run_bulk(
+            [(item_id, partial(self.delete_item, item_id, vault_id)) for item_id in item_ids],
+            concurrency,
+            stop_on_error,
+        )
+
+    async def _run_bulk(
+        self, operations: List[Tuple[Optional[str], Callable[[], Awaitable]]], concurrency: int, stop_on_error: bool
+    ) -> BulkReport:
+        start = time.perf_counter()
+        failed = False
+
+        async def run(item_id: Optional[str], operation: Callable[[], Awaitable]) -> ItemResult:
+            nonlocal failed
+            if stop_on_error and failed:
+                return ItemResult(item_id, skipped=True)
+            try:
+                result = await operation()
+            except Exception as e:
+                failed = True
+                return ItemResult(item_id, error=e)
+            if isinstance(result, Item):
+                return ItemResult(result.id, result)
+            return ItemResult(item_id)
+
+        results = await gather_concurrently((run(item_id, operation) for item_id, operation in operations), concurrency)
+        # a cancelled operation is returned by gather as its CancelledError
+        results = [
+            ItemResult(item_id, error=result) if isinstance(result, BaseException) else result
+            for (item_id, _), result in zip(operations, results)
+        ]
+        return BulkReport(results, time.perf_counter() - start)
 
     async def get_vault(self, vault_id: str) -> Vault:
         """Returns the vault with the given vault_id
@@ -303,16 +667,7 @@ class AsyncClient:
             Vault: The specified vault
         """
         url = PathBuilder().vaults(vault_id).build()
-        response = await self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveVaultException(
-                f"Unable to retrieve vault. Received {response.status_code} \
-                     for {url} with message {response.json().get('message')}"
-            )
-
-        return self.serializer.deserialize(response.content, "Vault")
+        return await self._get(url, FailedToRetrieveVaultException, "retrieve vault", "Vault")
 
     async def get_vault_by_title(self, name: str) -> Vault:
         """Returns the vault with the given name
@@ -329,22 +684,42 @@ class AsyncClient:
         """
         filter_query = f'name eq "{name}"'
         url = PathBuilder().vaults().query("filter", filter_query).build()
-        response = await self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveVaultException(
-                f"Unable to retrieve vaults. Received {response.status_code} \
-                     for {url} with message {response.json().get('message')}"
-            )
+        data = await self._get(url, FailedToRetrieveVaultException, "retrieve vaults")
 
-        if len(response.json()) != 1:
+        if len(data) != 1:
+            if self.title_cache is not None and len(data) == 0:
+                self.title_cache.set_vault_id(name, None)
             raise FailedToRetrieveItemException(
-                f"Found {len(response.json())} vaults with \
+                f"Found {len(data)} vaults with \
                     name {name}"
             )
 
-        return self.serializer.deserialize(response.content, "list[Vault]")[0]
+        vault = self.serializer.to_model(data[0], "Vault")
+        if self.title_cache is not None:
+            self.title_cache.set_vault_id(name, vault.id)
+        if self.item_cache is not None:
+            self.item_cache.set_vault_id(name, vault.id)
+        return vault
+
+    def _get_cached_vault_id(self, name: str) -> Optional[str]:
+        if self.title_cache is not None:
+            vault_id = self.title_cache.get_vault_id(name)
+            if vault_id is NOT_FOUND:
+                raise FailedToRetrieveItemException(
+                    f"Found 0 vaults with \
+                    name {name}"
+                )
+            if vault_id is not None:
+                return vault_id
+        if self.item_cache is not None:
+            return self.item_cache.get_vault_id(name)
+        return None
+
+    def _forget_vault_id(self, name: str) -> None:
+        if self.title_cache is not None:
+            self.title_cache.invalidate_vault(name)
+        if self.item_cache is not None:
+            self.item_cache.set_vault_id(name, None)
 
     async def get_vaults(self) -> List[Vault]:
         """Returns all vaults for service account set in client
@@ -357,34 +732,83 @@ class AsyncClient:
             List[Vault]: All vaults for the service account in use
         """
         url = PathBuilder().vaults().build()
-        response = await self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveVaultException(
-                f"Unable to retrieve vaults. Received {response.status_code} \
-                     for {url} with message {response.json().get('message')}"
-            )
+        return await self._get(url, FailedToRetrieveVaultException, "retrieve vaults", "list[Vault]")
 
-        return self.serializer.deserialize(response.content, "list[Vault]")
+    async def _get(self, url: str, exception: type, action: str, response_type=None):
+        """GETs url and returns its decoded body, converted to response_type when given
 
-    def build_request(self, method: str, path: str, body=None) -> httpx.Response:
+        With request coalescing enabled, concurrent identical calls share a
+        single request and receive the same result.
+        """
+        if self.coalescer is not None:
+            return await self.coalescer.do((url, response_type), partial(self._fetch, url, exception, action, response_type))
+        return await self._fetch(url, exception, action, response_type)
+
+    async def _fetch(self, url: str, exception: type, action: str, response_type=None):
+        cache = self.conditional_cache
+        entry = cache.lookup(url, response_type) if cache is not None else None
+        response = await self.build_request("GET", url, headers=entry.headers if entry is not None else None)
+        if entry is not None and cache.revalidate(url, response_type, entry, response):
+            return entry.value
+
+        data = decode_response(self.serializer, response, url, exception, action)
+        value = data if response_type is None else self.serializer.to_model(data, response_type)
+        if cache is not None:
+            cache.store(url, response_type, response, value)
+        return value
+
+    async def build_request(self, method: str, path: str, body=None, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
         """Builds a http request
         Parameters:
         method (str): The rest method to be used
         path (str): The request path
         body (str): The request body
+        headers (dict): Additional request headers
 
         Returns:
         Response object: The request response
         """
 
         if body:
-            sanitized_body = self.serializer.sanitize_for_serialization(body)
-            response = self.session.request(method, path, json=sanitized_body)
+            content = self.serializer.serialize(body)
+            headers = {**JSON_CONTENT_TYPE, **headers} if headers else JSON_CONTENT_TYPE
+            request = self.session.build_request(method, path, content=content, headers=headers)
         else:
-            response = self.session.request(method, path)
-        return response
+            request = self.session.build_request(method, path, headers=headers)
+        return await self._send(request)
+
+    @asynccontextmanager
+    async def _stream_request(self, method: str, path: str) -> AsyncIterator[httpx.Response]:
+        """Sends a request without reading the response body, which is closed when the block exits"""
+        response = await self._send(self.session.build_request(method, path), stream=True)
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+    async def _send(self, request: httpx.Request, stream: bool = False) -> httpx.Response:
+        """Sends a request once the rate limiter allows it, retrying it for as long as the retry policy allows"""
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            try:
+                response = await self.session.send(request, stream=stream)
+            except httpx.TransportError as e:
+                if self.retry_policy is None:
+                    raise
+                delay = self.retry_policy.next_delay(request.method, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                if self.retry_policy is None:
+                    return response
+                delay = self.retry_policy.next_delay(request.method, attempt, response=response)
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
 
     def deserialize(self, response, response_type):
         return self.serializer.deserialize(response, response_type)
@@ -0,0 +1,458 @@
+"""In-memory caches used by the 1Password Connect clients"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+import httpx
+
+from onepasswordconnectsdk.models import Item
+
+_MISSING = object()
+
+# Returned by TitleCache lookups for names that are known not to exist
+NOT_FOUND = object()
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how a cache has been used"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class _TTLCache:
+    """A bounded, thread-safe LRU mapping whose entries expire after a TTL"""
+
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the cache counters"""
+        with self._lock:
+            return replace(self._stats)
+
+    def clear(self) -> None:
+        """Removes every entry from the cache"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def _peek(self, key: Hashable) -> Any:
+        """Returns a live value without touching the counters or LRU order"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            return _MISSING
+        return entry[1]
+
+    def _set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def _pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class ItemCache(_TTLCache):
+    """Caches full items by vault id and item id.
+
+    Entries are evicted in least-recently-used order once `maxsize` is
+    reached and are dropped once they are older than `ttl` seconds. An entry
+    is never replaced by an item carrying an older `version`, so a slow read
+    racing an update cannot put stale data back into the cache.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize item cache
+
+        Args:
+            maxsize (int): The maximum number of items kept in memory
+            ttl (float): The number of seconds an item stays valid
+            clock (Callable[[], float]): Monotonic time source, in seconds
+        """
+        super().__init__(maxsize, ttl, clock)
+
+    def get(self, vault_id: str, item_id: str) -> Optional[Item]:
+        """Returns the cached item, or None when it is missing or expired"""
+        value = self._get((vault_id, item_id))
+        return None if value is _MISSING else value
+
+    def lookup(self, vault_id: str, item_id: str) -> Tuple[Optional[Item], bool]:
+        """Returns the cached item and whether the caller should refresh it in the background"""
+        return self.get(vault_id, item_id), False
+
+    def finish_refresh(self, vault_id: str, item_id: str, error: Optional[BaseException] = None) -> None:
+        """Records the outcome of a background refresh requested by lookup"""
+
+    def get_vault_id(self, name: str) -> Optional[str]:
+        """Returns the id a vault name resolved to, when the cache keeps resolved names"""
+        return None
+
+    def set_vault_id(self, name: str, vault_id: Optional[str]) -> None:
+        """Remembers the id of a vault name; None forgets it"""
+
+    def get_item_id(self, vault_id: str, title: str) -> Optional[str]:
+        """Returns the id an item title resolved to, when the cache keeps resolved titles"""
+        return None
+
+    def set_item_id(self, vault_id: str, title: str, item_id: Optional[str]) -> None:
+        """Remembers the id of an item title; None forgets it"""
+
+    def set(self, vault_id: str, item_id: str, item: Item) -> None:
+        """Stores an item unless a newer version of it is already cached"""
+        key = (vault_id, item_id)
+        with self._lock:
+            current = self._peek(key)
+            if (
+                current is not _MISSING
+                and current.version is not None
+                and item.version is not None
+                and current.version > item.version
+            ):
+                return
+            self._set(key, item)
+
+    def invalidate(self, vault_id: str, item_id: str) -> None:
+        """Drops the cached copy of an item"""
+        self._pop((vault_id, item_id))
+
+
+@dataclass
+class StaleCacheStats(CacheStats):
+    """Counters of a StaleItemCache, including how stale the served items were"""
+    stale_hits: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+    total_staleness: float = 0.0
+    max_staleness: float = 0.0
+
+
+class StaleItemCache(ItemCache):
+    """An item cache serving stale items while they are refreshed in the background.
+
+    An item younger than `soft_ttl` seconds is served as is. An older one
+    is still served straight from memory, and the client fetches a fresh
+    copy in the background: on a thread for a Client, on a task for an
+    AsyncClient. Only one refresh per item runs at a time, and a failed
+    refresh leaves the stale item in place. Once an item is older than
+    `ttl` seconds it is dropped, so the next read waits for the server.
+
+    The ids that vault names and item titles resolved to are kept as well,
+    so reads by title are served from memory too. A title stays resolved
+    for as long as the item it resolved to still carries it; a vault name
+    is kept for `ttl` seconds.
+
+    `staleness` is how long an item had been past `soft_ttl` when served.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        soft_ttl: float = 30.0,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize stale item cache
+
+        Args:
+            maxsize (int): The maximum number of items kept in memory
+            soft_ttl (float): The number of seconds after which a served item is refreshed in the background
+            ttl (float): The number of seconds after which an item is no longer served
+            clock (Callable[[], float]): Monotonic time source, in seconds
+
+        Raises:
+            ValueError: Thrown when soft_ttl is not positive or greater than ttl
+        """
+        super().__init__(maxsize, ttl, clock)
+        if not 0 < soft_ttl <= ttl:
+            raise ValueError("soft_ttl must be greater than 0 and not greater than ttl")
+        self.soft_ttl = soft_ttl
+        self._stats = StaleCacheStats()
+        self._refreshing: Set[Hashable] = set()
+        self._resolved = _TTLCache(maxsize, ttl, clock)
+
+    @property
+    def stats(self) -> StaleCacheStats:
+        """A snapshot of the cache counters"""
+        return super().stats
+
+    def age(self, vault_id: str, item_id: str) -> Optional[float]:
+        """Returns the number of seconds since an item was fetched, or None when it is not cached"""
+        with self._lock:
+            entry = self._entries.get((vault_id, item_id))
+            if entry is None:
+                return None
+            return self._clock() - (entry[0] - self.ttl)
+
+    def lookup(self, vault_id: str, item_id: str) -> Tuple[Optional[Item], bool]:
+        """Returns the cached item and whether the caller should refresh it in the background
+
+        Only the first caller finding a stale item is asked to refresh it,
+        until finish_refresh is called for that item.
+        """
+        key = (vault_id, item_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None, False
+            expires_at, item = entry
+            now = self._clock()
+            if expires_at <= now:
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+
+            staleness = now - (expires_at - self.ttl) - self.soft_ttl
+            if staleness < 0:
+                return item, False
+            self._stats.stale_hits += 1
+            self._stats.total_staleness += staleness
+            self._stats.max_staleness = max(self._stats.max_staleness, staleness)
+            if key in self._refreshing:
+                return item, False
+            self._refreshing.add(key)
+            self._stats.refreshes += 1
+            return item, True
+
+    def finish_refresh(self, vault_id: str, item_id: str, error: Optional[BaseException] = None) -> None:
+        """Records the outcome of a background refresh requested by lookup"""
+        with self._lock:
+            self._refreshing.discard((vault_id, item_id))
+            if error is not None:
+                self._stats.refresh_failures += 1
+
+    def get_vault_id(self, name: str) -> Optional[str]:
+        """Returns the id a vault name resolved to, or None when it is not known"""
+        return self._get_id(("vault", name))
+
+    def set_vault_id(self, name: str, vault_id: Optional[str]) -> None:
+        """Remembers the id of a vault name; None forgets it"""
+        self._set_id(("vault", name), vault_id)
+
+    def get_item_id(self, vault_id: str, title: str) -> Optional[str]:
+        """Returns the id an item title resolved to, or None when it is not known"""
+        return self._get_id(("item", vault_id, title))
+
+    def set_item_id(self, vault_id: str, title: str, item_id: Optional[str]) -> None:
+        """Remembers the id of an item title; None forgets it"""
+        self._set_id(("item", vault_id, title), item_id)
+
+    def clear(self) -> None:
+        """Removes every item and resolved name from the cache"""
+        super().clear()
+        self._resolved.clear()
+
+    def _get_id(self, key: Hashable) -> Optional[str]:
+        with self._resolved._lock:
+            value = self._resolved._peek(key)
+        return None if value is _MISSING else value
+
+    def _set_id(self, key: Hashable, value: Optional[str]) -> None:
+        if value is None:
+            self._resolved._pop(key)
+            return
+        with self._resolved._lock:
+            self._resolved._set(key, value)
+
+
+class TitleCache(_TTLCache):
+    """Caches the ids that vault names and item titles resolve to.
+
+    Lookups that found nothing are remembered for `negative_ttl` seconds so
+    that repeated requests for a missing vault or item fail without a round
+    trip. Titles matching several vaults or items are never cached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        negative_ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize title cache
+
+        Args:
+            maxsize (int): The maximum number of resolved titles kept in memory
+            ttl (float): The number of seconds a resolved id stays valid
+            negative_ttl (float): The number of seconds a failed lookup is remembered
+            clock (Callable[[], float]): Monotonic time source, in seconds
+        """
+        super().__init__(maxsize, ttl, clock)
+        if negative_ttl < 0:
+            raise ValueError("negative_ttl must not be negative")
+        self.negative_ttl = negative_ttl
+
+    def get_vault_id(self, name: str) -> Any:
+        """Returns the id for a vault name, NOT_FOUND for a remembered miss
+        or None when the name has not been resolved yet"""
+        return self._lookup(("vault", name))
+
+    def set_vault_id(self, name: str, vault_id: Optional[str]) -> None:
+        """Remembers the id of a vault name; None records that no vault matched"""
+        self._store(("vault", name), vault_id)
+
+    def get_item_id(self, vault_id: str, title: str) -> Any:
+        """Returns the id for an item title, NOT_FOUND for a remembered miss
+        or None when the title has not been resolved yet"""
+        return self._lookup(("item", vault_id, title))
+
+    def set_item_id(self, vault_id: str, title: str, item_id: Optional[str]) -> None:
+        """Remembers the id of an item title; None records that no item matched"""
+        self._store(("item", vault_id, title), item_id)
+
+    def invalidate_vault(self, name: str) -> None:
+        """Forgets what a vault name resolved to"""
+        self._pop(("vault", name))
+
+    def invalidate_item(self, vault_id: str, title: str) -> None:
+        """Forgets what an item title resolved to"""
+        self._pop(("item", vault_id, title))
+
+    def _lookup(self, key: Hashable) -> Any:
+        value = self._get(key)
+        if value is _MISSING:
+            return None
+        return NOT_FOUND if value is None else value
+
+    def _store(self, key: Hashable, value: Optional[str]) -> None:
+        if value is None and self.negative_ttl == 0:
+            self._pop(key)
+            return
+        with self._lock:
+            self._set(key, value, ttl=self.negative_ttl if value is None else None)
+
+
+class _Validated:
+    """A deserialized GET response with the validators needed to revalidate it"""
+    __slots__ = ("value", "etag", "last_modified", "digest")
+
+    def __init__(self, value: Any, etag: Optional[str], last_modified: Optional[str], digest: bytes) -> None:
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = digest
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """The conditional request headers for revalidating this response"""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ConditionalCache(_TTLCache):
+    """Remembers deserialized GET responses so unchanged ones are not parsed again.
+
+    Responses are stored per path and response type along with their
+    `ETag` and `Last-Modified` validators, which are sent back on the next
+    request for the same path. A `304 Not Modified` response, or a full
+    response whose body is byte-for-byte identical to the stored one,
+    returns the stored object without decoding or deserializing anything.
+    Entries never expire since every read is revalidated with the server;
+    the least recently used ones are evicted once `maxsize` is reached.
+
+    The stored objects are returned to every caller, so they must be
+    treated as read-only.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initialize conditional cache
+
+        Args:
+            maxsize (int): The maximum number of responses kept in memory
+        """
+        super().__init__(maxsize, float("inf"))
+
+    def lookup(self, path: str, response_type: Any) -> Optional[_Validated]:
+        """Returns the stored response for a path, if any"""
+        with self._lock:
+            entry = self._peek((path, response_type))
+            return None if entry is _MISSING else entry
+
+    def revalidate(self, path: str, response_type: Any, entry: _Validated, response: httpx.Response) -> bool:
+        """Returns whether a response shows the stored entry is still current"""
+        if response.status_code == 304:
+            unchanged = True
+        elif response.is_success:
+            unchanged = _digest(response.content) == entry.digest
+        else:
+            unchanged = False
+
+        if not unchanged:
+            return False
+        with self._lock:
+            self._stats.hits += 1
+            if (path, response_type) in self._entries:
+                entry.etag = response.headers.get("ETag", entry.etag)
+                entry.last_modified = response.headers.get("Last-Modified", entry.last_modified)
+                self._entries.move_to_end((path, response_type))
+            return True
+
+    def store(self, path: str, response_type: Any, response: httpx.Response, value: Any) -> None:
+        """Remembers the deserialized value of a successful response"""
+        if not response.is_success:
+            return
+        entry = _Validated(
+            value,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            _digest(response.content),
+        )
+        with self._lock:
+            self._stats.misses += 1
+            self._set((path, response_type), entry)
+
+    def invalidate(self, path: str) -> None:
+        """Forgets the stored responses for a path"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                del self._entries[key]
+
+
+def _digest(body: bytes) -> bytes:
+    return hashlib.blake2b(body, digest_size=16).digest()
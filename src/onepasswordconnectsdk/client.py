@@ -1,21 +1,44 @@
 """Python Client for connecting to 1Password Connect"""
+import asyncio
 import httpx
-from httpx import HTTPError, USE_CLIENT_DEFAULT
+from collections import Counter
+from httpx import USE_CLIENT_DEFAULT
 import json
-from typing import Dict, List, Union, Optional
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union, Optional
 import os
+import threading
+import time
 
 from onepasswordconnectsdk.async_client import AsyncClient
+from onepasswordconnectsdk.cache import NOT_FOUND
 from onepasswordconnectsdk.config import ClientConfig
+from onepasswordconnectsdk.json_stream import iter_json_array
 from onepasswordconnectsdk.serializer import Serializer
-from onepasswordconnectsdk.utils import build_headers, is_valid_uuid, PathBuilder, get_timeout
+from onepasswordconnectsdk.sessions import SHARED_SESSIONS
+from onepasswordconnectsdk.singleflight import SingleFlight
+from onepasswordconnectsdk.utils import (
+    HEALTH_PATH,
+    HEARTBEAT_PATH,
+    JSON_CONTENT_TYPE,
+    atomic_write,
+    build_headers,
+    decode_response,
+    is_unavailable,
+    is_valid_uuid,
+    map_concurrently,
+    PathBuilder,
+    get_timeout,
+)
 from onepasswordconnectsdk.errors import (
+    FailedToRetrieveHealthException,
     FailedToRetrieveItemException,
     FailedToRetrieveVaultException,
     EnvironmentHostNotSetException,
     EnvironmentTokenNotSetException,
 )
-from onepasswordconnectsdk.models import File, Item, ItemVault, SummaryItem, Vault
+from onepasswordconnectsdk.models import BulkReport, File, FileDownload, Item, ItemResult, ItemVault, SummaryItem, Vault
 from onepasswordconnectsdk.models.constants import CONNECT_HOST_ENV_VARIABLE
 
 ENV_SERVICE_ACCOUNT_JWT_VARIABLE = "OP_CONNECT_TOKEN"
@@ -25,87 +48,202 @@ ENV_IS_ASYNC_CLIENT = "OP_CONNECT_CLIENT_ASYNC"
 class Client:
     """Python Client Class"""
 
-    def __init__(self, url: str, token: str, config: Optional[ClientConfig] = None) -> None:
+    def __init__(self, url: str, token: str, config: Optional[ClientConfig] = None, shared: bool = False) -> None:
         """Initialize client
 
         Args:
             url (str): The url of the 1Password Connect API
             token (str): The 1Password Service Account token
             config (Optional[ClientConfig]): Optional configuration for httpx client
+            shared (bool): Whether to share the HTTP session, and its connection pool, with the
+                other shared clients created with the same url, token and config
         """
         self.url = url
         self.token = token
         self.config = config
-        self.session = self.create_session(url, token)
-        self.serializer = Serializer()
+        self._closed = False
+        self._session_key = (Client, url, token, config) if shared else None
+        if shared:
+            self.session = SHARED_SESSIONS.acquire(self._session_key, lambda: self.create_session(url, token))
+        else:
+            self.session = self.create_session(url, token)
+        self.serializer = Serializer(config.json_backend) if config else Serializer()
+        self.item_cache = config.item_cache if config else None
+        self.title_cache = config.title_cache if config else None
+        self.conditional_cache = config.conditional_cache if config else None
+        self.persistent_cache = config.persistent_cache if config else None
+        self.retry_policy = config.retry if config else None
+        self.rate_limiter = config.rate_limiter if config else None
+        self.coalescer = SingleFlight() if config and config.coalesce_requests else None
 
     def create_session(self, url: str, token: str) -> httpx.Client:
         headers = self.build_headers(token)
         timeout = get_timeout()
 
-        if self.config:
-            client_args = self.config.get_client_args(url, headers, timeout)
-            return httpx.Client(**client_args)
-
-        return httpx.Client(base_url=url, headers=headers, timeout=timeout)
+        client_args = (self.config or ClientConfig()).get_client_args(url, headers, timeout)
+        return httpx.Client(**client_args)
 
     def build_headers(self, token: str) -> Dict[str, str]:
         return build_headers(token)
 
+    def close(self) -> None:
+        """Closes the HTTP session, or releases this client's reference to a shared one"""
+        if self._closed:
+            return
+        self._closed = True
+        session = self.session if self._session_key is None else SHARED_SESSIONS.release(self._session_key)
+        if session is not None:
+            session.close()
+
     def __del__(self) -> None:
-        self.session.close()
+        self.close()
+
+    def warmup(self, connections: int = 1, health: bool = True) -> Optional[dict]:
+        """Opens pooled connections and checks the server ahead of the first real request
+
+        Sends `connections` heartbeat requests at once, which makes the pool
+        open up to as many connections, paying DNS, TCP and TLS setup now.
+
+        Args:
+            connections (int): The number of heartbeat requests sent at once
+            health (bool): Whether to also fetch the server health
+
+        Raises:
+            FailedToRetrieveHealthException: Thrown when a HTTP error is returned
+            from the 1Password Connect API
+
+        Returns:
+            Optional[dict]: The server health, when requested
+        """
+        for future in map_concurrently(self._heartbeat, (() for _ in range(connections)), connections):
+            future.result()
+
+        if not health:
+            return None
+        response = self.build_request("GET", HEALTH_PATH)
+        return decode_response(self.serializer, response, HEALTH_PATH, FailedToRetrieveHealthException, "retrieve health")
+
+    def _heartbeat(self) -> None:
+        response = self.build_request("GET", HEARTBEAT_PATH)
+        decode_response(self.serializer, response, HEARTBEAT_PATH, FailedToRetrieveHealthException, "retrieve heartbeat")
 
     def get_file(self, file_id: str, item_id: str, vault_id: str) -> File:
         url = PathBuilder().vaults(vault_id).items(item_id).files(file_id).build()
-        response = self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to retrieve item. Received {response.status_code}\
-                                     for {url} with message: {response.json().get('message')}"
-            )
-        return self.serializer.deserialize(response.content, "File")
+        return self._get(url, FailedToRetrieveItemException, "retrieve item", "File")
 
     def get_files(self, item_id: str, vault_id: str) -> List[File]:
         url = PathBuilder().vaults(vault_id).items(item_id).files().build()
-        response = self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to retrieve item. Received {response.status_code}\
-                             for {url} with message: {response.json().get('message')}"
-            )
-        return self.serializer.deserialize(response.content, "list[File]")
+        return self._get(url, FailedToRetrieveItemException, "retrieve item", "list[File]")
 
     def get_file_content(self, file_id: str, item_id: str, vault_id: str, content_path: str = None) -> Union[bytes, str]:
         url = content_path
         if content_path is None:
             url = PathBuilder().vaults(vault_id).items(item_id).files(file_id).content().build()
         response = self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to retrieve items. Received {response.status_code} \
-                     for {url} with message: {response.json().get('message')}"
-            )
+        if not response.is_success:
+            decode_response(self.serializer, response, url, FailedToRetrieveItemException, "retrieve items")
         return response.content
 
     def download_file(self, file_id: str, item_id: str, vault_id: str, path: str) -> None:
+        """Downloads a file's contents into the given directory
+
+        The content is streamed into a temporary file next to the
+        destination, which is renamed into place once the download has
+        completed, so memory use does not grow with the size of the file.
+
+        Args:
+            file_id (str): The id of the file
+            item_id (str): The id of the item the file belongs to
+            vault_id (str): The id of the vault the item belongs to
+            path (str): The directory in which to write the file
+
+        Raises:
+            FailedToRetrieveItemException: Thrown when a HTTP error is returned
+            from the 1Password Connect API
+        """
         file_object = self.get_file(file_id, item_id, vault_id)
-        filename = file_object.name or "1password_item_file.txt"
-        content = self.get_file_content(file_id, item_id, vault_id, file_object.content_path)
-        global_path = os.path.join(path, filename)
+        self._download(file_object, item_id, vault_id, self._download_path(file_object, path))
+
+    def download_files(self, item_id: str, vault_id: str, path: str, concurrency: int = 4) -> List[FileDownload]:
+        """Downloads every file of an item into the given directory
 
-        file = open(global_path, "wb")
-        file.write(content)
-        file.close()
+        The files are listed once and each file's content is then streamed
+        straight from its content path, with at most `concurrency` downloads
+        running at once. A failed download does not stop the others; it is
+        reported through the `error` of its result.
+
+        Files sharing a name, including unnamed ones, are written under that
+        name followed by their file id, so no download overwrites another.
+
+        Args:
+            item_id (str): The id of the item whose files to download
+            vault_id (str): The id of the vault the item belongs to
+            path (str): The directory in which to write the files
+            concurrency (int): The maximum number of simultaneous downloads
+
+        Raises:
+            FailedToRetrieveItemException: Thrown when the files of the item
+            cannot be listed
+
+        Returns:
+            List[FileDownload]: The outcome of each download, in listing order
+        """
+        files = self.get_files(item_id, vault_id)
+        destinations = self._download_paths(files, path)
+        futures = map_concurrently(
+            self._download,
+            ((file_object, item_id, vault_id, destination) for file_object, destination in zip(files, destinations)),
+            concurrency,
+        )
+        return [
+            FileDownload(file_object, destination, error=future.exception())
+            if future.exception() else future.result()
+            for file_object, destination, future in zip(files, destinations, futures)
+        ]
+
+    def _download(self, file_object: File, item_id: str, vault_id: str, destination: str) -> FileDownload:
+        url = file_object.content_path
+        if url is None:
+            url = PathBuilder().vaults(vault_id).items(item_id).files(file_object.id).content().build()
+
+        start = time.perf_counter()
+        bytes_written = self._stream_to_file(url, destination)
+        return FileDownload(file_object, destination, bytes_written, time.perf_counter() - start)
+
+    @staticmethod
+    def _download_path(file_object: File, path: str) -> str:
+        return os.path.join(path, file_object.name or "1password_item_file.txt")
+
+    @classmethod
+    def _download_paths(cls, files: List[File], path: str) -> List[str]:
+        """Returns the destination of each file, adding the file id to names shared by several files"""
+        destinations = [cls._download_path(file_object, path) for file_object in files]
+        counts = Counter(destinations)
+        for index, (file_object, destination) in enumerate(zip(files, destinations)):
+            if counts[destination] > 1:
+                stem, extension = os.path.splitext(destination)
+                destinations[index] = f"{stem}-{file_object.id}{extension}"
+        return destinations
+
+    def _stream_to_file(self, url: str, destination: str) -> int:
+        """Streams the body of a GET request into destination, returning the number of bytes written"""
+        with self._stream_request("GET", url) as response:
+            if not response.is_success:
+                response.read()
+                decode_response(self.serializer, response, url, FailedToRetrieveItemException, "retrieve items")
+
+            with atomic_write(destination) as file:
+                for chunk in response.iter_bytes():
+                    file.write(chunk)
+                return file.tell()
 
     def get_item(self, item: str, vault: str) -> Item:
         """Get a specific item
 
+        With a persistent cache configured, a recently stored copy of the
+        item is returned without contacting the server, and an older one is
+        returned when the server is unavailable.
+
         Args:
             item (str): the id or title of the item to be fetched
             vault (str): the id or name of the vault in which to get the item from
@@ -117,11 +255,42 @@ class Client:
         Returns:
             Item object: The found item
         """
+        cache = self.persistent_cache
+        if cache is None:
+            return self._resolve_item(item, vault)
 
-        vault_id = vault
-        if not is_valid_uuid(vault):
-            vault_id = self.get_vault_by_title(vault).id
-
+        stored = cache.get(vault, item)
+        if stored is not None:
+            return stored
+        try:
+            found = self._resolve_item(item, vault)
+        except Exception as e:
+            stored = cache.fallback(vault, item) if is_unavailable(e) else None
+            if stored is None:
+                raise
+            return stored
+        cache.set(vault, item, found)
+        return found
+
+    def _resolve_item(self, item: str, vault: str) -> Item:
+        if is_valid_uuid(vault):
+            return self._resolve_item_in_vault(item, vault)
+
+        cached_id = self._get_cached_vault_id(vault)
+        vault_id = cached_id or (self.get_vault_by_title(vault)).id
+        try:
+            return self._resolve_item_in_vault(item, vault_id)
+        except FailedToRetrieveItemException as exc:
+            if cached_id is None or exc.status_code != 404:
+                raise
+            # the vault may have been deleted, or recreated under the same name, since its id was cached
+            self._forget_vault_id(vault)
+            vault_id = (self.get_vault_by_title(vault)).id
+            if vault_id == cached_id:
+                raise
+        return self._resolve_item_in_vault(item, vault_id)
+
+    def _resolve_item_in_vault(self, item: str, vault_id: str) -> Item:
         if not is_valid_uuid(item):
             return self.get_item_by_title(item, vault_id)
         try:
@@ -145,17 +314,55 @@ class Client:
         Returns:
             Item object: The found item
         """
+        if self.item_cache is not None:
+            cached_item, refresh = self.item_cache.lookup(vault_id, item_id)
+            if refresh:
+                self._refresh_item(item_id, vault_id)
+            if cached_item is not None:
+                return cached_item
+
+        return self._fetch_item(item_id, vault_id)
+
+    def _fetch_item(self, item_id: str, vault_id: str) -> Item:
         url = PathBuilder().vaults(vault_id).items(item_id).build()
-        response = self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to retrieve item. Received {response.status_code}\
-                     for {url} with message: {response.json().get('message')}",
-                status_code=response.status_code,
-            )
-        return self.serializer.deserialize(response.content, "Item")
+        item = self._get(url, FailedToRetrieveItemException, "retrieve item", "Item")
+        if self.item_cache is not None:
+            self.item_cache.set(vault_id, item_id, item)
+        return item
+
+    def _refresh_item(self, item_id: str, vault_id: str) -> None:
+        """Fetches a fresh copy of a stale cached item on a background thread"""
+        def refresh() -> None:
+            error = None
+            try:
+                self._fetch_item(item_id, vault_id)
+            except Exception as e:
+                error = e
+            finally:
+                self.item_cache.finish_refresh(vault_id, item_id, error)
+
+        threading.Thread(target=refresh, name=f"refresh-item-{item_id}", daemon=True).start()
+
+    def get_items_by_ids(self, item_ids: List[str], vault_id: str, concurrency: int = 8) -> List[ItemResult]:
+        """Get several items by uuid, fetching at most `concurrency` of them at once
+
+        A failed fetch does not abort the batch; it is reported through the
+        `error` of that item's result.
+
+        Args:
+            item_ids (List[str]): The ids of the items to be fetched
+            vault_id (str): The id of the vault in which to get the items from
+            concurrency (int): The maximum number of simultaneous requests
+
+        Returns:
+            List[ItemResult]: The result for each id, in the order of item_ids
+        """
+        item_ids = list(item_ids)
+        futures = map_concurrently(self.get_item_by_id, ((item_id, vault_id) for item_id in item_ids), concurrency)
+        return [
+            ItemResult(item_id, error=future.exception()) if future.exception() else ItemResult(item_id, future.result())
+            for item_id, future in zip(item_ids, futures)
+        ]
 
     def get_item_by_title(self, title: str, vault_id: str) -> Item:
         """Get a specific item by title
@@ -171,24 +378,49 @@ class Client:
         Returns:
             Item object: The found item
         """
+        item_id = None
+        if self.title_cache is not None:
+            item_id = self.title_cache.get_item_id(vault_id, title)
+            if item_id is NOT_FOUND:
+                raise FailedToRetrieveItemException(
+                    f"Found 0 items in vault {vault_id} with \
+                    title {title}"
+                )
+        if item_id is None and self.item_cache is not None:
+            item_id = self.item_cache.get_item_id(vault_id, title)
+        if item_id is not None:
+            try:
+                item = self.get_item_by_id(item_id, vault_id)
+            except FailedToRetrieveItemException as exc:
+                if exc.status_code != 404:
+                    raise
+            else:
+                if item.title == title:
+                    if self.item_cache is not None:
+                        self.item_cache.set_item_id(vault_id, title, item_id)
+                    return item
+            if self.title_cache is not None:
+                self.title_cache.invalidate_item(vault_id, title)
+            if self.item_cache is not None:
+                self.item_cache.set_item_id(vault_id, title, None)
+
         filter_query = f'title eq "{title}"'
         url = PathBuilder().vaults(vault_id).items().query("filter", filter_query).build()
-        response = self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to retrieve items. Received {response.status_code} \
-                     for {url} with message: {response.json().get('message')}"
-            )
+        data = self._get(url, FailedToRetrieveItemException, "retrieve items")
 
-        if len(response.json()) != 1:
+        if len(data) != 1:
+            if self.title_cache is not None and len(data) == 0:
+                self.title_cache.set_item_id(vault_id, title, None)
             raise FailedToRetrieveItemException(
-                f"Found {len(response.json())} items in vault {vault_id} with \
+                f"Found {len(data)} items in vault {vault_id} with \
                     title {title}"
             )
 
-        item_summary = self.serializer.deserialize(response.content, "list[SummaryItem]")[0]
+        item_summary = self.serializer.to_model(data[0], "SummaryItem")
+        if self.title_cache is not None:
+            self.title_cache.set_item_id(vault_id, title, item_summary.id)
+        if self.item_cache is not None:
+            self.item_cache.set_item_id(vault_id, title, item_summary.id)
         return self.get_item_by_id(item_summary.id, vault_id)
 
     def get_items(self, vault_id: str, filter_query: str = None) -> List[SummaryItem]:
@@ -210,16 +442,38 @@ class Client:
         else:
             url = PathBuilder().vaults(vault_id).items().query("filter", filter_query).build()
 
-        response = self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to retrieve items. Received {response.status_code} \
-                     for {url} with message: {response.json().get('message')}"
-            )
+        return self._get(url, FailedToRetrieveItemException, "retrieve items", "list[SummaryItem]")
+
+    def iter_items(self, vault_id: str, filter_query: str = None) -> Iterator[SummaryItem]:
+        """Yields the item summaries for the specified vault while the response is received
 
-        return self.serializer.deserialize(response.content, "list[SummaryItem]")
+        Unlike get_items, the response is parsed incrementally and never held
+        in memory as a whole, which keeps memory bounded for very large vaults.
+
+        Args:
+            vault_id (str): The id of the vault in which to get the items from
+            filter_query (str): A optional query statement. `title eq "Example Item"`
+
+        Raises:
+            FailedToRetrieveItemException: Thrown when a HTTP error is returned
+            from the 1Password Connect API
+            FailedToDeserializeException: Thrown when the response is not a JSON array
+
+        Yields:
+            SummaryItem: The summarized items, in the order the API returns them
+        """
+        if filter_query is None:
+            url = PathBuilder().vaults(vault_id).items().build()
+        else:
+            url = PathBuilder().vaults(vault_id).items().query("filter", filter_query).build()
+
+        with self._stream_request("GET", url) as response:
+            if not response.is_success:
+                response.read()
+                decode_response(self.serializer, response, url, FailedToRetrieveItemException, "retrieve items")
+
+            for data in iter_json_array(response.iter_text()):
+                yield self.serializer.to_model(data, SummaryItem)
 
     def delete_item(self, item_id: str, vault_id: str) -> None:
         """Deletes a specified item from a specified vault
@@ -234,13 +488,13 @@ class Client:
         """
         url = PathBuilder().vaults(vault_id).items(item_id).build()
         response = self.build_request("DELETE", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to delete item. Received {response.status_code}\
-                     for {url} with message: {response.json().get('message')}"
-            )
+        if self.item_cache is not None:
+            self.item_cache.invalidate(vault_id, item_id)
+        if self.persistent_cache is not None:
+            self.persistent_cache.invalidate(vault_id, item_id)
+        if self.conditional_cache is not None:
+            self.conditional_cache.invalidate(url)
+        decode_response(self.serializer, response, url, FailedToRetrieveItemException, "delete item")
 
     def create_item(self, vault_id: str, item: Item) -> Item:
         """Creates an item at the specified vault
@@ -259,14 +513,10 @@ class Client:
 
         url = PathBuilder().vaults(vault_id).items().build()
         response = self.build_request("POST", url, item)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to post item. Received {response.status_code}\
-                    for {url} with message: {response.json().get('message')}"
-            )
-        return self.serializer.deserialize(response.content, "Item")
+        if self.title_cache is not None and item.title is not None:
+            self.title_cache.invalidate_item(vault_id, item.title)
+        data = decode_response(self.serializer, response, url, FailedToRetrieveItemException, "post item")
+        return self.serializer.to_model(data, "Item")
 
     def update_item(self, item_uuid: str, vault_id: str, item: Item) -> Item:
         """Update the specified item at the specified vault.
@@ -288,14 +538,103 @@ class Client:
         item.vault = ItemVault(id=vault_id)
 
         response = self.build_request("PUT", url, item)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveItemException(
-                f"Unable to post item. Received {response.status_code}\
-                    for {url} with message: {response.json().get('message')}"
-            )
-        return self.serializer.deserialize(response.content, "Item")
+        if self.conditional_cache is not None:
+            self.conditional_cache.invalidate(url)
+        if self.persistent_cache is not None:
+            self.persistent_cache.invalidate(vault_id, item_uuid)
+        if self.title_cache is not None and item.title is not None:
+            self.title_cache.invalidate_item(vault_id, item.title)
+        if not response.is_success and self.item_cache is not None:
+            self.item_cache.invalidate(vault_id, item_uuid)
+        data = decode_response(self.serializer, response, url, FailedToRetrieveItemException, "post item")
+        updated_item = self.serializer.to_model(data, "Item")
+        if self.item_cache is not None:
+            self.item_cache.set(vault_id, item_uuid, updated_item)
+        return updated_item
+
+    def create_items(
+        self, vault_id: str, items: List[Item], concurrency: int = 8, stop_on_error: bool = False
+    ) -> BulkReport:
+        """Creates several items at the specified vault, running at most `concurrency` requests at once
+
+        Args:
+            vault_id (str): The id of the vault in which add the items to
+            items (List[Item]): The items to create
+            concurrency (int): The maximum number of simultaneous requests
+            stop_on_error (bool): Whether to skip the operations that have not
+            started yet once one of them fails
+
+        Returns:
+            BulkReport: The result for each item, in the order of items. The
+            result of a created item holds the item returned by the API.
+        """
+        return self._run_bulk(
+            [(item.id, partial(self.create_item, vault_id, item)) for item in items], concurrency, stop_on_error
+        )
+
+    def update_items(
+        self, items: List[Item], vault_id: str, concurrency: int = 8, stop_on_error: bool = False
+    ) -> BulkReport:
+        """Updates several items at the specified vault, running at most `concurrency` requests at once
+
+        Args:
+            items (List[Item]): The updated items, each identified by its id
+            vault_id (str): The id of the vault in which to update the items
+            concurrency (int): The maximum number of simultaneous requests
+            stop_on_error (bool): Whether to skip the operations that have not
+            started yet once one of them fails
+
+        Returns:
+            BulkReport: The result for each item, in the order of items. The
+            result of an updated item holds the item returned by the API.
+        """
+        return self._run_bulk(
+            [(item.id, partial(self.update_item, item.id, vault_id, item)) for item in items],
+            concurrency,
+            stop_on_error,
+        )
+
+    def delete_items(
+        self, item_ids: List[str], vault_id: str, concurrency: int = 8, stop_on_error: bool = False
+    ) -> BulkReport:
+        """Deletes several items from the specified vault, running at most `concurrency` requests at once
+
+        Args:
+            item_ids (List[str]): The ids of the items to delete
+            vault_id (str): The id of the vault in which to delete the items
+            concurrency (int): The maximum number of simultaneous requests
+            stop_on_error (bool): Whether to skip the operations that have not
+            started yet once one of them fails
+
+        Returns:
+            BulkReport: The result for each id, in the order of item_ids
+        """
+        return self._run_bulk(
+            [(item_id, partial(self.delete_item, item_id, vault_id)) for item_id in item_ids],
+            concurrency,
+            stop_on_error,
+        )
+
+    def _run_bulk(
+        self, operations: List[Tuple[Optional[str], Callable[[], Any]]], concurrency: int, stop_on_error: bool
+    ) -> BulkReport:
+        start = time.perf_counter()
+        failed = threading.Event()
+
+        def run(item_id: Optional[str], operation: Callable[[], Any]) -> ItemResult:
+            if stop_on_error and failed.is_set():
+                return ItemResult(item_id, skipped=True)
+            try:
+                result = operation()
+            except Exception as e:
+                failed.set()
+                return ItemResult(item_id, error=e)
+            if isinstance(result, Item):
+                return ItemResult(result.id, result)
+            return ItemResult(item_id)
+
+        futures = map_concurrently(run, operations, concurrency)
+        return BulkReport([future.result() for future in futures], time.perf_counter() - start)
 
     def get_vault(self, vault_id: str) -> Vault:
         """Returns the vault with the given vault_id
@@ -311,16 +650,7 @@ class Client:
             Vault: The specified vault
         """
         url = PathBuilder().vaults(vault_id).build()
-        response = self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveVaultException(
-                f"Unable to retrieve vault. Received {response.status_code} \
-                     for {url} with message {response.json().get('message')}"
-            )
-
-        return self.serializer.deserialize(response.content, "Vault")
+        return self._get(url, FailedToRetrieveVaultException, "retrieve vault", "Vault")
 
     def get_vault_by_title(self, name: str) -> Vault:
         """Returns the vault with the given name
@@ -337,22 +667,42 @@ class Client:
         """
         filter_query = f'name eq "{name}"'
         url = PathBuilder().vaults().query("filter", filter_query).build()
-        response = self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveVaultException(
-                f"Unable to retrieve vaults. Received {response.status_code} \
-                     for {url} with message {response.json().get('message')}"
-            )
+        data = self._get(url, FailedToRetrieveVaultException, "retrieve vaults")
 
-        if len(response.json()) != 1:
+        if len(data) != 1:
+            if self.title_cache is not None and len(data) == 0:
+                self.title_cache.set_vault_id(name, None)
             raise FailedToRetrieveItemException(
-                f"Found {len(response.json())} vaults with \
+                f"Found {len(data)} vaults with \
                     name {name}"
             )
 
-        return self.serializer.deserialize(response.content, "list[Vault]")[0]
+        vault = self.serializer.to_model(data[0], "Vault")
+        if self.title_cache is not None:
+            self.title_cache.set_vault_id(name, vault.id)
+        if self.item_cache is not None:
+            self.item_cache.set_vault_id(name, vault.id)
+        return vault
+
+    def _get_cached_vault_id(self, name: str) -> Optional[str]:
+        if self.title_cache is not None:
+            vault_id = self.title_cache.get_vault_id(name)
+            if vault_id is NOT_FOUND:
+                raise FailedToRetrieveItemException(
+                    f"Found 0 vaults with \
+                    name {name}"
+                )
+            if vault_id is not None:
+                return vault_id
+        if self.item_cache is not None:
+            return self.item_cache.get_vault_id(name)
+        return None
+
+    def _forget_vault_id(self, name: str) -> None:
+        if self.title_cache is not None:
+            self.title_cache.invalidate_vault(name)
+        if self.item_cache is not None:
+            self.item_cache.set_vault_id(name, None)
 
     def get_vaults(self) -> List[Vault]:
         """Returns all vaults for service account set in client
@@ -365,34 +715,83 @@ class Client:
             List[Vault]: All vaults for the service account in use
         """
         url = PathBuilder().vaults().build()
-        response = self.build_request("GET", url)
-        try:
-            response.raise_for_status()
-        except HTTPError:
-            raise FailedToRetrieveVaultException(
-                f"Unable to retrieve vaults. Received {response.status_code} \
-                     for {url} with message {response.json().get('message')}"
-            )
+        return self._get(url, FailedToRetrieveVaultException, "retrieve vaults", "list[Vault]")
 
-        return self.serializer.deserialize(response.content, "list[Vault]")
+    def _get(self, url: str, exception: type, action: str, response_type=None):
+        """GETs url and returns its decoded body, converted to response_type when given
 
-    def build_request(self, method: str, path: str, body=None) -> httpx.Response:
+        With request coalescing enabled, concurrent identical calls share a
+        single request and receive the same result.
+        """
+        if self.coalescer is not None:
+            return self.coalescer.do((url, response_type), partial(self._fetch, url, exception, action, response_type))
+        return self._fetch(url, exception, action, response_type)
+
+    def _fetch(self, url: str, exception: type, action: str, response_type=None):
+        cache = self.conditional_cache
+        entry = cache.lookup(url, response_type) if cache is not None else None
+        response = self.build_request("GET", url, headers=entry.headers if entry is not None else None)
+        if entry is not None and cache.revalidate(url, response_type, entry, response):
+            return entry.value
+
+        data = decode_response(self.serializer, response, url, exception, action)
+        value = data if response_type is None else self.serializer.to_model(data, response_type)
+        if cache is not None:
+            cache.store(url, response_type, response, value)
+        return value
+
+    def build_request(self, method: str, path: str, body=None, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
         """Builds a http request
         Parameters:
         method (str): The rest method to be used
         path (str): The request path
         body (str): The request body
+        headers (dict): Additional request headers
 
         Returns:
         Response object: The request response
         """
 
         if body:
-            sanitized_body = self.serializer.sanitize_for_serialization(body)
-            response = self.session.request(method, path, json=sanitized_body)
+            content = self.serializer.serialize(body)
+            headers = {**JSON_CONTENT_TYPE, **headers} if headers else JSON_CONTENT_TYPE
+            request = self.session.build_request(method, path, content=content, headers=headers)
         else:
-            response = self.session.request(method, path)
-        return response
+            request = self.session.build_request(method, path, headers=headers)
+        return self._send(request)
+
+    @contextmanager
+    def _stream_request(self, method: str, path: str) -> Iterator[httpx.Response]:
+        """Sends a request without reading the response body, which is closed when the block exits"""
+        response = self._send(self.session.build_request(method, path), stream=True)
+        try:
+            yield response
+        finally:
+            response.close()
+
+    def _send(self, request: httpx.Request, stream: bool = False) -> httpx.Response:
+        """Sends a request once the rate limiter allows it, retrying it for as long as the retry policy allows"""
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self.session.send(request, stream=stream)
+            except httpx.TransportError as e:
+                if self.retry_policy is None:
+                    raise
+                delay = self.retry_policy.next_delay(request.method, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                if self.retry_policy is None:
+                    return response
+                delay = self.retry_policy.next_delay(request.method, attempt, response=response)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
 
     def deserialize(self, response, response_type):
         return self.serializer.deserialize(response, response_type)
@@ -401,7 +800,14 @@ class Client:
         return self.serializer.sanitize_for_serialization(obj)
 
 
-def new_client(url: str, token: str, is_async: bool = False, config: Optional[ClientConfig] = None) -> Union[AsyncClient, Client]:
+def new_client(
+    url: str,
+    token: str,
+    is_async: bool = False,
+    config: Optional[ClientConfig] = None,
+    shared: bool = False,
+    warm: bool = False,
+) -> Union[AsyncClient, Client]:
     """Builds a new client for interacting with 1Password Connect
 
     Args:
@@ -409,17 +815,33 @@ def new_client(url: str, token: str, is_async: bool = False, config: Optional[Cl
         token (str): The 1Password Service Account token
         is_async (bool): Initialize async or sync client
         config (Optional[ClientConfig]): Optional configuration for httpx client
+        shared (bool): Share the connection pool with the other shared clients
+            created with the same url, token and config
+        warm (bool): Call warmup() before returning the client. An async
+            client is warmed up in a task on the running event loop, which is
+            stored in its `warmup_task` attribute.
+
+    Raises:
+        FailedToRetrieveHealthException: Thrown when a sync client cannot be warmed up
+        RuntimeError: Thrown when warming up an async client without a running event loop
 
     Returns:
         Union[AsyncClient, Client]: The 1Password Connect client
     """
     if is_async:
-        return AsyncClient(url, token, config)
-    return Client(url, token, config)
+        loop = asyncio.get_running_loop() if warm else None
+        async_client = AsyncClient(url, token, config, shared)
+        if loop is not None:
+            async_client.warmup_task = loop.create_task(async_client.warmup())
+        return async_client
+    client = Client(url, token, config, shared)
+    if warm:
+        client.warmup()
+    return client
 
 
 def new_client_from_environment(
-    url: Optional[str] = None, token: Optional[str] = None
+    url: Optional[str] = None, token: Optional[str] = None, shared: bool = False
 ) -> Union[AsyncClient, Client]:
     """Builds a new client for interacting with 1Password Connect
     using OP_CONNECT_HOST and OP_CONNECT_TOKEN when url or token are omitted.
@@ -427,6 +849,7 @@ def new_client_from_environment(
     Parameters:
     url: The url of the 1Password Connect API; if omitted, read from OP_CONNECT_HOST.
     token: The Connect token; if omitted, read from OP_CONNECT_TOKEN.
+    shared: Share the connection pool with the other shared clients for the same host and token.
 
     Returns:
     Union[AsyncClient, Client]: The 1Password Connect client (async if OP_CONNECT_CLIENT_ASYNC is True).
@@ -448,5 +871,5 @@ def new_client_from_environment(
                 f"{ENV_SERVICE_ACCOUNT_JWT_VARIABLE} variable"
             )
 
-    return new_client(url, token, is_async)
+    return new_client(url, token, is_async, shared=shared)
 
@@ -2,14 +2,36 @@ import os
 import shlex
 from typing import List, Dict, Optional, TYPE_CHECKING
 import httpx
+from httpx._config import DEFAULT_LIMITS
+
+from onepasswordconnectsdk.cache import ConditionalCache, ItemCache, TitleCache
+from onepasswordconnectsdk.persistent_cache import PersistentItemCache
+from onepasswordconnectsdk.errors import InvalidClientConfigException
+from onepasswordconnectsdk.json_backend import AUTO
+from onepasswordconnectsdk.ratelimit import RateLimiter
+from onepasswordconnectsdk.retry import RetryPolicy
 
 if TYPE_CHECKING:
+    from onepasswordconnectsdk.async_client import AsyncClient
     from onepasswordconnectsdk.client import Client
 from onepasswordconnectsdk.models import (
+    Field,
+    FieldIndex,
     Item,
     ParsedField,
     ParsedItem,
-    Section,
+)
+from onepasswordconnectsdk.utils import (
+    ENV_CLIENT_CONNECT_TIMEOUT,
+    ENV_CLIENT_HTTP2,
+    ENV_CLIENT_KEEPALIVE_EXPIRY,
+    ENV_CLIENT_MAX_CONNECTIONS,
+    ENV_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+    ENV_CLIENT_POOL_TIMEOUT,
+    ENV_CLIENT_READ_TIMEOUT,
+    ENV_CLIENT_WRITE_TIMEOUT,
+    gather_concurrently,
+    map_concurrently,
 )
 from onepasswordconnectsdk.models.constants import (
     ITEM_TAG,
@@ -18,21 +40,105 @@ from onepasswordconnectsdk.models.constants import (
     VAULT_ID_ENV_VARIABLE,
 )
 
+# Connection pool options: (environment variable, type, minimum value)
+_LIMIT_OPTIONS = {
+    "max_connections": (ENV_CLIENT_MAX_CONNECTIONS, int, 1),
+    "max_keepalive_connections": (ENV_CLIENT_MAX_KEEPALIVE_CONNECTIONS, int, 0),
+    "keepalive_expiry": (ENV_CLIENT_KEEPALIVE_EXPIRY, float, 0),
+}
+# Per-phase timeouts, by httpx.Timeout argument: (option, environment variable)
+_TIMEOUT_OPTIONS = {
+    "connect": ("connect_timeout", ENV_CLIENT_CONNECT_TIMEOUT),
+    "read": ("read_timeout", ENV_CLIENT_READ_TIMEOUT),
+    "write": ("write_timeout", ENV_CLIENT_WRITE_TIMEOUT),
+    "pool": ("pool_timeout", ENV_CLIENT_POOL_TIMEOUT),
+}
+
 
 class ClientConfig:
     """Configuration class for 1Password Connect client.
     Inherits from httpx.BaseClient to support all httpx client options.
     """
-    def __init__(self, ca_file: Optional[str] = None, **kwargs):
+    def __init__(
+        self,
+        ca_file: Optional[str] = None,
+        item_cache: Optional[ItemCache] = None,
+        title_cache: Optional[TitleCache] = None,
+        conditional_cache: Optional[ConditionalCache] = None,
+        persistent_cache: Optional[PersistentItemCache] = None,
+        json_backend: str = AUTO,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        http2: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        **kwargs,
+    ):
         """Initialize client configuration
 
         Args:
             ca_file (Optional[str]): Path to CA certificate file for SSL verification
+            item_cache (Optional[ItemCache]): Cache consulted before fetching an item by id; a
+                StaleItemCache serves stale items while refreshing them in the background
+            title_cache (Optional[TitleCache]): Cache of the ids that vault names and item titles resolve to
+            conditional_cache (Optional[ConditionalCache]): Cache of GET responses revalidated with the
+                server, so unchanged responses are not deserialized again
+            persistent_cache (Optional[PersistentItemCache]): Encrypted on-disk cache used by get_item, and
+                so by load and load_dict, to start from stored items and to serve them while the server
+                is unavailable
+            json_backend (str): JSON library used for request and response bodies:
+                "orjson", "ujson", "json" or "auto" to pick the fastest one installed
+            retry (Optional[RetryPolicy]): Policy for retrying requests that failed with a transient error
+            rate_limiter (Optional[RateLimiter]): Token bucket every request, including retries, waits on
+            coalesce_requests (bool): Whether concurrent identical GET requests share a single request
+            http2 (Optional[bool]): Whether to use HTTP/2, which requires the `h2` package
+            max_connections (Optional[int]): The maximum number of open connections
+            max_keepalive_connections (Optional[int]): The maximum number of idle connections kept open
+            keepalive_expiry (Optional[float]): The number of seconds an idle connection is kept open
+            connect_timeout (Optional[float]): Seconds to wait for a connection to be established
+            read_timeout (Optional[float]): Seconds to wait for a chunk of the response
+            write_timeout (Optional[float]): Seconds to wait for a chunk of the request to be sent
+            pool_timeout (Optional[float]): Seconds to wait for a connection from the pool
             **kwargs: Additional httpx client options
+
+        Options left as None fall back to their OP_CONNECT_CLIENT_* environment
+        variable, then to the httpx defaults.
+
+        Raises:
+            InvalidClientConfigException: Thrown when an option has an invalid value
         """
         self.ca_file = ca_file
+        self.item_cache = item_cache
+        self.title_cache = title_cache
+        self.conditional_cache = conditional_cache
+        self.persistent_cache = persistent_cache
+        self.json_backend = json_backend
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.coalesce_requests = coalesce_requests
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.write_timeout = write_timeout
+        self.pool_timeout = pool_timeout
         self.httpx_options = kwargs
 
+        if http2:
+            _require_h2()
+        for name, (_, kind, minimum) in _LIMIT_OPTIONS.items():
+            _validate_number(name, getattr(self, name), kind, minimum)
+        for name, _ in _TIMEOUT_OPTIONS.values():
+            _validate_number(name, getattr(self, name), float, 0, inclusive=False)
+
     def get_client_args(self, base_url: str, headers: Dict[str, str], timeout: float) -> Dict:
         """Get arguments for httpx client initialization
 
@@ -56,11 +162,88 @@ class ClientConfig:
             
         # Allow httpx_options (including verify) to override
         args.update(self.httpx_options)
-            
-        return args
 
+        http2 = self._resolve("http2", ENV_CLIENT_HTTP2, _parse_bool)
+        if http2 is not None:
+            if http2:
+                _require_h2()
+            args['http2'] = http2
+
+        limits = {}
+        for name, (env_variable, kind, minimum) in _LIMIT_OPTIONS.items():
+            value = self._resolve(name, env_variable, kind)
+            if value is not None:
+                limits[name] = _validate_number(env_variable, value, kind, minimum)
+        if limits:
+            base = args.get('limits', DEFAULT_LIMITS)
+            args['limits'] = httpx.Limits(**{
+                "max_connections": base.max_connections,
+                "max_keepalive_connections": base.max_keepalive_connections,
+                "keepalive_expiry": base.keepalive_expiry,
+                **limits,
+            })
+
+        timeouts = {}
+        for phase, (name, env_variable) in _TIMEOUT_OPTIONS.items():
+            value = self._resolve(name, env_variable, float)
+            if value is not None:
+                timeouts[phase] = _validate_number(env_variable, value, float, 0, inclusive=False)
+        if timeouts:
+            base = httpx.Timeout(args['timeout'])
+            args['timeout'] = httpx.Timeout(**{
+                "connect": base.connect,
+                "read": base.read,
+                "write": base.write,
+                "pool": base.pool,
+                **timeouts,
+            })
 
-def load_dict(client: "Client", config: dict):
+        return args
+
+    def _resolve(self, name: str, env_variable: str, parse):
+        """Returns the option, falling back to its environment variable when it is not set"""
+        value = getattr(self, name)
+        if value is not None:
+            return value
+        raw_value = os.getenv(env_variable)
+        if not raw_value:
+            return None
+        try:
+            return parse(raw_value)
+        except ValueError:
+            raise InvalidClientConfigException(f"{env_variable} has an invalid value: {raw_value!r}") from None
+
+
+def _parse_bool(value: str) -> bool:
+    if value.lower() in ("true", "1", "yes"):
+        return True
+    if value.lower() in ("false", "0", "no"):
+        return False
+    raise ValueError(value)
+
+
+def _validate_number(name: str, value, kind: type, minimum: float, inclusive: bool = True):
+    """Raises InvalidClientConfigException unless value is None or a number of the given kind above minimum"""
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float) if kind is float else int):
+        raise InvalidClientConfigException(f"{name} must be {'a number' if kind is float else 'an integer'}, got {value!r}")
+    if value < minimum or (not inclusive and value == minimum):
+        comparison = "at least" if inclusive else "greater than"
+        raise InvalidClientConfigException(f"{name} must be {comparison} {minimum}, got {value!r}")
+    return value
+
+
+def _require_h2() -> None:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        raise InvalidClientConfigException(
+            "HTTP/2 requires the h2 package, install it with `pip install httpx[http2]`"
+        ) from None
+
+
+def load_dict(client: "Client", config: dict, concurrency: int = 1):
     """Load: Takes a dictionary with keys specifiying the user
     desired naming scheme of the values to return. Each key's
     value is a dictionary that includes information on where
@@ -94,40 +277,64 @@ def load_dict(client: "Client", config: dict):
         value is a dictionary that includes information on where to find
         the item field value in 1Password.
 
+        concurrency (int): The maximum number of items fetched at once.
+        Items are fetched one after another when set to 1.
+
+    Raises:
+        FailedToLoadItemsException: Thrown when more than one item could
+        not be fetched while loading concurrently
+
     Returns:
         dict: A dictionary of user specified keys with values retrieved
         from 1Password
     """
 
-    items: dict = {}
     config_values: Dict[str, str] = {}
 
-    for field, tags in config.items():
-        item_tag = tags.get(ITEM_TAG)
-        field_tag = tags.get(FIELD_TAG)
-        vault_tag = tags.get(VAULT_TAG)
-        item_vault = _vault_uuid_for_field(field=field, vault_tag=vault_tag)
-        key = f"{item_vault}/{item_tag}"
-        item: ParsedItem = items.get(key)  # type: ignore
+    parsed_items = _parse_items(config.items())
+    for parsed_item, item in zip(parsed_items, _fetch_items(client, parsed_items, concurrency)):
+        _set_values_for_item(item=item,
+                             parsed_item=parsed_item,
+                             config_dict=config_values)
 
-        if item:
-            item.fields.append(ParsedField(field, field_tag))
-        else:
-            item = ParsedItem(
-                vault_uuid=item_vault,
-                item_title=item_tag,
-                fields=[ParsedField(field, field_tag)],
-            )
-        items[key] = item
-    for item_key, item in items.items():
-        _set_values_for_item(client=client,
-                             parsed_item=item,
+    return config_values
+
+
+async def aload_dict(client: "AsyncClient", config: dict, concurrency: int = 10):
+    """Async counterpart of load_dict for use with an AsyncClient.
+
+    Items are fetched concurrently on the running event loop, with at
+    most `concurrency` requests in flight at once.
+
+    Args:
+        client (AsyncClient): An instantied 1Password Connect async client.
+
+        config (dict): A dict with user specfied names for keys. Each key's
+        value is a dictionary that includes information on where to find
+        the item field value in 1Password.
+
+        concurrency (int): The maximum number of items fetched at once.
+
+    Raises:
+        FailedToLoadItemsException: Thrown when more than one item could
+        not be fetched
+
+    Returns:
+        dict: A dictionary of user specified keys with values retrieved
+        from 1Password
+    """
+    config_values: Dict[str, str] = {}
+
+    parsed_items = _parse_items(config.items())
+    for parsed_item, item in zip(parsed_items, await _afetch_items(client, parsed_items, concurrency)):
+        _set_values_for_item(item=item,
+                             parsed_item=parsed_item,
                              config_dict=config_values)
 
     return config_values
 
 
-def load(client: "Client", config: object):
+def load(client: "Client", config: object, concurrency: int = 1):
     """Load: Takes a an object with class attributes annotated with tags
     describing where to find desired fields in 1Password. Manipulates given object
     and fills attributes in with 1Password item field values.
@@ -148,35 +355,73 @@ def load(client: "Client", config: object):
     Args:
         client (Client): An instantied 1Password Connect client.
         config (object): An object of a custom annoted class.
+        concurrency (int): The maximum number of items fetched at once.
+        Items are fetched one after another when set to 1.
+
+    Raises:
+        FailedToLoadItemsException: Thrown when more than one item could
+        not be fetched while loading concurrently
+    """
+    parsed_items = _parse_items(_annotated_tags(config))
+    for parsed_item, item in zip(parsed_items, _fetch_items(client, parsed_items, concurrency)):
+        _set_values_for_item(item=item,
+                             parsed_item=parsed_item,
+                             config_object=config)
+
+    return config
+
+
+async def aload(client: "AsyncClient", config: object, concurrency: int = 10):
+    """Async counterpart of load for use with an AsyncClient.
+
+    Items are fetched concurrently on the running event loop, with at
+    most `concurrency` requests in flight at once.
+
+    Args:
+        client (AsyncClient): An instantied 1Password Connect async client.
+        config (object): An object of a custom annoted class.
+        concurrency (int): The maximum number of items fetched at once.
+
+    Raises:
+        FailedToLoadItemsException: Thrown when more than one item could
+        not be fetched
     """
-    items: dict = {}
-    annotations = config.__class__.__annotations__
-
-    for field, tags in annotations.items():
-        parsed_tags = _parse_tags(tags)
-        item_tag = parsed_tags.get(ITEM_TAG)
-        field_tag = parsed_tags.get(FIELD_TAG)
-        vault_tag = parsed_tags.get(VAULT_TAG)
+    parsed_items = _parse_items(_annotated_tags(config))
+    for parsed_item, item in zip(parsed_items, await _afetch_items(client, parsed_items, concurrency)):
+        _set_values_for_item(item=item,
+                             parsed_item=parsed_item,
+                             config_object=config)
+
+    return config
+
+
+def _annotated_tags(config: object):
+    for field, tags in config.__class__.__annotations__.items():
+        yield field, _parse_tags(tags)
+
+
+def _parse_items(tagged_fields) -> List[ParsedItem]:
+    """Groups (field name, tags) pairs into one ParsedItem per vault and item"""
+    items: Dict[str, ParsedItem] = {}
+
+    for field, tags in tagged_fields:
+        item_tag = tags.get(ITEM_TAG)
+        field_tag = tags.get(FIELD_TAG)
+        vault_tag = tags.get(VAULT_TAG)
         item_vault = _vault_uuid_for_field(field=field, vault_tag=vault_tag)
         key = f"{item_vault}/{item_tag}"
-        item: ParsedItem = items.get(key)  # type: ignore
+        item = items.get(key)
 
         if item:
             item.fields.append(ParsedField(field, field_tag))
         else:
-            item = ParsedItem(
+            items[key] = ParsedItem(
                 vault_uuid=item_vault,
                 item_title=item_tag,
                 fields=[ParsedField(field, field_tag)],
             )
-        items[key] = item
-
-    for item_key, item in items.items():
-        _set_values_for_item(client=client,
-                             parsed_item=item,
-                             config_object=config)
 
-    return config
+    return list(items.values())
 
 
 def _parse_tags(tags: str):
@@ -205,16 +450,57 @@ def _vault_uuid_for_field(field: str, vault_tag: dict):
     )
 
 
+def _fetch_items(client: "Client", parsed_items: List[ParsedItem], concurrency: int) -> List[Item]:
+    """Fetches the full item for every parsed item, preserving their order.
+
+    When several items fail to load concurrently, the errors are reported
+    together in the order the items appear in the configuration.
+    """
+    if concurrency <= 1:
+        return [client.get_item(parsed_item.item_title, parsed_item.vault_uuid)
+                for parsed_item in parsed_items]
+
+    futures = map_concurrently(
+        client.get_item,
+        ((parsed_item.item_title, parsed_item.vault_uuid) for parsed_item in parsed_items),
+        concurrency,
+    )
+    _raise_for_failed_items(parsed_items, [future.exception() for future in futures])
+    return [future.result() for future in futures]
+
+
+async def _afetch_items(client: "AsyncClient", parsed_items: List[ParsedItem], concurrency: int) -> List[Item]:
+    """Fetches the full item for every parsed item on the event loop, preserving their order"""
+    results = await gather_concurrently(
+        (client.get_item(parsed_item.item_title, parsed_item.vault_uuid) for parsed_item in parsed_items),
+        concurrency,
+    )
+    _raise_for_failed_items(
+        parsed_items,
+        [result if isinstance(result, BaseException) else None for result in results],
+    )
+    return results
+
+
+def _raise_for_failed_items(parsed_items: List[ParsedItem], exceptions: List[Optional[BaseException]]):
+    errors = {
+        f"{parsed_item.vault_uuid}/{parsed_item.item_title}": exception
+        for parsed_item, exception in zip(parsed_items, exceptions)
+        if exception is not None
+    }
+    if len(errors) == 1:
+        raise next(iter(errors.values()))
+    if errors:
+        raise FailedToLoadItemsException(errors)
+
+
 def _set_values_for_item(
-    client: "Client",
+    item: Item,
     parsed_item: ParsedItem,
     config_dict={},
     config_object: object = None,
 ):
-    # Fetching the full item
-    item: Item = client.get_item(parsed_item.item_title, parsed_item.vault_uuid)
-
-    sections = _convert_sections_to_dict(item.sections)
+    field_index = item.field_index
 
     for parsed_field in parsed_item.fields:
         if parsed_field.tag is None:
@@ -230,39 +516,34 @@ def _set_values_for_item(
                 {parsed_field.name}"
             )
 
-        value_found = False
-        for field in item.fields:
-            try:
-                section_id = field.section.id
-            except AttributeError:
-                section_id = None
-                
-            if field.label == path_parts[1]:
-                if (
-                    section_id is None
-                    or (section_id == sections.get(path_parts[0]))
-                    or path_parts[0] in sections.values()
-                ):
-                    value_found = True
-
-                    if config_object:
-                        setattr(config_object, parsed_field.name, field.value)
-                    else:
-                        config_dict[parsed_field.name] = field.value
-                    break
-        if not value_found:
+        field = _find_field(field_index, path_parts[0], path_parts[1])
+        if field is None:
             raise UnknownSectionAndFieldTag(
                 f"There is no section {path_parts[0]} \
                 for field {path_parts[1]}"
             )
 
+        if config_object:
+            setattr(config_object, parsed_field.name, field.value)
+        else:
+            config_dict[parsed_field.name] = field.value
+
+
+def _find_field(field_index: FieldIndex, section: str, label: str) -> Optional[Field]:
+    """Returns the first field with the given label that either has no
+    section or sits in the section referenced by label or id"""
+    section_id = field_index.section_id(section)
+    section_is_id = field_index.has_section_id(section)
 
-def _convert_sections_to_dict(sections: List[Section]):
-    if not sections:
-        return {}
+    for field in field_index.with_label(label):
+        try:
+            field_section_id = field.section.id
+        except AttributeError:
+            field_section_id = None
 
-    section_dict = {section.label: section.id for section in sections}
-    return section_dict
+        if field_section_id is None or field_section_id == section_id or section_is_id:
+            return field
+    return None
 
 
 class ConfigurationError(RuntimeError):
@@ -283,3 +564,12 @@ class InvalidFieldPathException(ConfigurationError):
 
 class UnknownSectionAndFieldTag(ConfigurationError):
     pass
+
+
+class FailedToLoadItemsException(ConfigurationError):
+    def __init__(self, errors: Dict[str, BaseException]):
+        super().__init__(
+            f"Unable to load {len(errors)} items: "
+            + "; ".join(f"{key}: {error}" for key, error in errors.items())
+        )
+        self.errors = errors
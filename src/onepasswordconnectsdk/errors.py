@@ -10,6 +10,10 @@ class EnvironmentHostNotSetException(OnePasswordConnectSDKError, TypeError):
     pass
 
 
+class InvalidClientConfigException(OnePasswordConnectSDKError, ValueError):
+    pass
+
+
 class FailedToRetrieveItemException(OnePasswordConnectSDKError):
     def __init__(self, message, *, status_code=None):
         super().__init__(message)
@@ -17,7 +21,15 @@ class FailedToRetrieveItemException(OnePasswordConnectSDKError):
 
 
 class FailedToRetrieveVaultException(OnePasswordConnectSDKError):
-    pass
+    def __init__(self, message, *, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class FailedToRetrieveHealthException(OnePasswordConnectSDKError):
+    def __init__(self, message, *, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class FailedToDeserializeException(OnePasswordConnectSDKError, TypeError):
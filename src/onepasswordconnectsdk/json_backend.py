@@ -0,0 +1,88 @@
+"""JSON backends used to decode responses and encode request bodies"""
+import json
+from typing import Any, Callable, Dict
+
+AUTO = "auto"
+
+
+class JSONBackend:
+    """A pair of JSON functions.
+
+    `dumps` must produce the same bytes httpx produces for `json=` request
+    bodies: compact separators and UTF-8 text without ASCII escaping.
+    Backends still disagree on floats: the formatting of some values
+    differs (`1e+16` with the standard library, `1e16` with orjson), and
+    NaN and infinity are rejected by the standard library backend but
+    written as `null` by orjson.
+    """
+
+    def __init__(self, name: str, loads: Callable[[Any], Any], dumps: Callable[[Any], bytes]) -> None:
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f"JSONBackend({self.name!r})"
+
+
+def _stdlib_backend() -> JSONBackend:
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    return JSONBackend("json", json.loads, dumps)
+
+
+def _orjson_backend() -> JSONBackend:
+    import orjson
+
+    return JSONBackend("orjson", orjson.loads, orjson.dumps)
+
+
+def _ujson_backend() -> JSONBackend:
+    import ujson
+
+    def dumps(obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+    return JSONBackend("ujson", ujson.loads, dumps)
+
+
+_FACTORIES: Dict[str, Callable[[], JSONBackend]] = {
+    "orjson": _orjson_backend,
+    "ujson": _ujson_backend,
+    "json": _stdlib_backend,
+}
+_BACKENDS: Dict[str, JSONBackend] = {}
+
+
+def get_json_backend(name: str = AUTO) -> JSONBackend:
+    """Returns the JSON backend with the given name
+
+    Args:
+        name (str): One of "orjson", "ujson", "json" or "auto". "auto" picks
+            the fastest installed backend, falling back to the standard library.
+
+    Raises:
+        ValueError: Thrown when the name is not a known backend
+        ImportError: Thrown when the requested backend is not installed
+
+    Returns:
+        JSONBackend: The JSON backend
+    """
+    if name in _BACKENDS:
+        return _BACKENDS[name]
+
+    if name == AUTO:
+        for candidate in _FACTORIES:
+            try:
+                backend = get_json_backend(candidate)
+            except ImportError:
+                continue
+            _BACKENDS[AUTO] = backend
+            return backend
+
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown JSON backend {name!r}, must be one of {[AUTO, *_FACTORIES]}")
+    backend = _BACKENDS[name] = factory()
+    return backend
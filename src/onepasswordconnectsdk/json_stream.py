@@ -0,0 +1,148 @@
+"""Incremental parsing of JSON array response bodies"""
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List
+
+from onepasswordconnectsdk.errors import FailedToDeserializeException
+
+_WHITESPACE = " \t\n\r"
+
+_START = 0
+_FIRST_VALUE = 1
+_VALUE = 2
+_SEPARATOR = 3
+_DONE = 4
+
+
+class JSONArrayParser:
+    """Decodes the elements of a top-level JSON array as its text arrives.
+
+    Text is passed to `feed` in arbitrary chunks, which returns the elements
+    completed so far. Only the text of the element currently being received
+    is buffered, so memory use is bounded by the largest element rather than
+    the whole array. A `null` body is treated as an empty array.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._state = _START
+        self._ended = False
+
+    def feed(self, text: str) -> List[Any]:
+        """Adds text to the buffer and returns the elements it completed
+
+        Raises:
+            ValueError: Thrown when the text is not a JSON array
+        """
+        self._buffer += text
+        return self._parse()
+
+    def close(self) -> List[Any]:
+        """Signals the end of the text and returns any remaining element
+
+        Raises:
+            ValueError: Thrown when the text ended before the array did
+        """
+        self._ended = True
+        elements = self._parse()
+        if self._state != _DONE:
+            raise ValueError("Unexpected end of JSON array")
+        return elements
+
+    def _parse(self) -> List[Any]:
+        buffer = self._buffer
+        pos = 0
+        elements = []
+
+        while True:
+            pos = self._skip_whitespace(buffer, pos)
+            if pos == len(buffer):
+                break
+
+            if self._state == _START:
+                if buffer[pos] == "[":
+                    pos += 1
+                    self._state = _FIRST_VALUE
+                elif buffer.startswith("null", pos):
+                    pos += 4
+                    self._state = _DONE
+                elif "null".startswith(buffer[pos:]) and not self._ended:
+                    break
+                else:
+                    raise ValueError(f"Expected a JSON array at position {pos}")
+
+            elif self._state == _FIRST_VALUE and buffer[pos] == "]":
+                pos += 1
+                self._state = _DONE
+
+            elif self._state in (_VALUE, _FIRST_VALUE):
+                try:
+                    element, end = self._decoder.raw_decode(buffer, pos)
+                except ValueError:
+                    if self._ended:
+                        raise
+                    break
+                # A number may continue in the next chunk, so wait until the
+                # separator that follows it has been received
+                next_pos = self._skip_whitespace(buffer, end)
+                if not self._ended and (
+                    next_pos == len(buffer)
+                    or (type(element) in (int, float) and buffer[next_pos] not in ",]")
+                ):
+                    break
+                elements.append(element)
+                pos = end
+                self._state = _SEPARATOR
+
+            elif self._state == _SEPARATOR:
+                if buffer[pos] == ",":
+                    self._state = _VALUE
+                elif buffer[pos] == "]":
+                    self._state = _DONE
+                else:
+                    raise ValueError(f"Expected ',' or ']' at position {pos}")
+                pos += 1
+
+            else:
+                raise ValueError(f"Extra data after JSON array at position {pos}")
+
+        self._buffer = buffer[pos:]
+        return elements
+
+    @staticmethod
+    def _skip_whitespace(buffer: str, pos: int) -> int:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        return pos
+
+
+def iter_json_array(chunks: Iterable[str]) -> Iterator[Any]:
+    """Yields the elements of a JSON array received as chunks of text
+
+    Raises:
+        FailedToDeserializeException: Thrown when the text is not a JSON array
+    """
+    parser = JSONArrayParser()
+    try:
+        for chunk in chunks:
+            yield from parser.feed(chunk)
+        yield from parser.close()
+    except ValueError as e:
+        raise FailedToDeserializeException(f"Failed to parse JSON array: {e}") from e
+
+
+async def aiter_json_array(chunks: AsyncIterable[str]) -> AsyncIterator[Any]:
+    """Yields the elements of a JSON array received as chunks of text
+
+    Raises:
+        FailedToDeserializeException: Thrown when the text is not a JSON array
+    """
+    parser = JSONArrayParser()
+    try:
+        async for chunk in chunks:
+            for element in parser.feed(chunk):
+                yield element
+        for element in parser.close():
+            yield element
+    except ValueError as e:
+        raise FailedToDeserializeException(f"Failed to parse JSON array: {e}") from e
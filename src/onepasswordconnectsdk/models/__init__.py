@@ -1,10 +1,14 @@
 # import models into model package
 from onepasswordconnectsdk.models.error import Error
+from onepasswordconnectsdk.models.bulk_report import BulkReport
+from onepasswordconnectsdk.models.field_index import FieldIndex
 from onepasswordconnectsdk.models.item import Item
 from onepasswordconnectsdk.models.item_details import ItemDetails
+from onepasswordconnectsdk.models.item_result import ItemResult
 from onepasswordconnectsdk.models.field import Field
 from onepasswordconnectsdk.models.field_section import FieldSection
 from onepasswordconnectsdk.models.file import File
+from onepasswordconnectsdk.models.file_download import FileDownload
 from onepasswordconnectsdk.models.generator_recipe import GeneratorRecipe
 from onepasswordconnectsdk.models.section import Section
 from onepasswordconnectsdk.models.summary_item import SummaryItem
@@ -13,15 +17,20 @@ from onepasswordconnectsdk.models.item_vault import ItemVault
 from onepasswordconnectsdk.models.parsed_field import ParsedField
 from onepasswordconnectsdk.models.parsed_item import ParsedItem
 from onepasswordconnectsdk.models.vault import Vault
+from onepasswordconnectsdk.models.vault_change import VaultChange
 
 __all__ = [
+    "BulkReport",
     "Error",
     "Field",
+    "FieldIndex",
     "FieldSection",
     "File",
+    "FileDownload",
     "GeneratorRecipe",
     "Item",
     "ItemDetails",
+    "ItemResult",
     "ItemUrls",
     "ItemVault",
     "ParsedField",
@@ -29,4 +38,5 @@ __all__ = [
     "Section",
     "SummaryItem",
     "Vault",
+    "VaultChange",
 ]
\ No newline at end of file
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import List
+from onepasswordconnectsdk.models.item_result import ItemResult
+
+
+@dataclass
+class BulkReport:
+    """The per-item results of a bulk create, update or delete, in input order"""
+    results: List[ItemResult]
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.results)
+
+    @property
+    def succeeded(self) -> List[ItemResult]:
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[ItemResult]:
+        return [result for result in self.results if result.error is not None]
+
+    @property
+    def skipped(self) -> List[ItemResult]:
+        return [result for result in self.results if result.skipped]
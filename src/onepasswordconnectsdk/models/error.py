@@ -25,6 +25,13 @@ class Error:
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = (
+        '_status',
+        '_message',
+    )
+
+    discriminator = None
+
     openapi_types = {"status": "int", "message": "str"}
 
     attribute_map = {"status": "status", "message": "message"}
@@ -32,7 +39,6 @@ class Error:
     def __init__(self, status=None, message=None):  # noqa: E501
         self._status = None
         self._message = None
-        self.discriminator = None
 
         if status is not None:
             self.status = status
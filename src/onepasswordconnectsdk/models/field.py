@@ -25,6 +25,21 @@ class Field:
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = (
+        '_id',
+        '_section',
+        '_type',
+        '_purpose',
+        '_label',
+        '_value',
+        '_generate',
+        '_recipe',
+        '_entropy',
+        '_totp',
+    )
+
+    discriminator = None
+
     openapi_types = {
         'id': 'str',
         'section': 'FieldSection',
@@ -62,7 +77,6 @@ class Field:
         self._recipe = None
         self._entropy = None
         self._totp = None
-        self.discriminator = None
 
         self.id = id
         if section is not None:
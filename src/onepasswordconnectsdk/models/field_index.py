@@ -0,0 +1,82 @@
+from typing import Dict, List, Optional
+
+
+class FieldIndex:
+    """Lookup tables over the fields of an item.
+
+    Built once per item so that finding a field by id, purpose or label
+    does not require scanning every field. When several fields share a key,
+    lookups return the first one in item order.
+    """
+
+    def __init__(self, fields: Optional[list], sections: Optional[list]) -> None:
+        self._fields = fields
+        self._sections = sections
+        self._field_count = len(fields or ())
+        self._section_count = len(sections or ())
+
+        self._by_id: Dict[str, object] = {}
+        self._by_purpose: Dict[str, object] = {}
+        self._by_label: Dict[str, list] = {}
+        self._by_section_and_label: Dict[tuple, object] = {}
+        self._section_ids_by_label: Dict[str, str] = {
+            section.label: section.id for section in sections or ()
+        }
+        self._section_ids = set(self._section_ids_by_label.values())
+
+        for field in fields or ():
+            self._by_id.setdefault(field.id, field)
+            if field.purpose:
+                self._by_purpose.setdefault(field.purpose, field)
+            self._by_label.setdefault(field.label, []).append(field)
+            self._by_section_and_label.setdefault((_section_id_of(field), field.label), field)
+
+    def is_current(self, fields: Optional[list], sections: Optional[list]) -> bool:
+        """Returns whether the index was built from these lists at their current size"""
+        return (
+            fields is self._fields
+            and sections is self._sections
+            and len(fields or ()) == self._field_count
+            and len(sections or ()) == self._section_count
+        )
+
+    def by_id(self, field_id: str):
+        """Returns the field with the given id, or None"""
+        return self._by_id.get(field_id)
+
+    def by_purpose(self, purpose: str):
+        """Returns the first field with the given purpose (USERNAME, PASSWORD, NOTES), or None"""
+        return self._by_purpose.get(purpose)
+
+    def by_label(self, label: str, section: Optional[str] = None):
+        """Returns the first field with the given label, or None
+
+        Args:
+            label (str): The label of the field
+            section (Optional[str]): The label or id of the section holding
+                the field. When omitted, fields in any section match.
+        """
+        if section is None:
+            fields = self._by_label.get(label)
+            return fields[0] if fields else None
+        section_id = self._section_ids_by_label.get(section, section)
+        return self._by_section_and_label.get((section_id, label))
+
+    def with_label(self, label: str) -> List:
+        """Returns every field with the given label, in item order"""
+        return self._by_label.get(label, [])
+
+    def section_id(self, label: str) -> Optional[str]:
+        """Returns the id of the section with the given label, or None"""
+        return self._section_ids_by_label.get(label)
+
+    def has_section_id(self, section_id: str) -> bool:
+        """Returns whether the item has a section with the given id"""
+        return section_id in self._section_ids
+
+
+def _section_id_of(field) -> Optional[str]:
+    try:
+        return field.section.id
+    except AttributeError:
+        return None
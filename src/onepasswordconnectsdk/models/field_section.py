@@ -25,6 +25,12 @@ class FieldSection:
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = (
+        '_id',
+    )
+
+    discriminator = None
+
     openapi_types = {
         'id': 'str'
     }
@@ -35,7 +41,6 @@ class FieldSection:
 
     def __init__(self, id=None):  # noqa: E501
         self._id = None
-        self.discriminator = None
 
         if id is not None:
             self.id = id
@@ -2,6 +2,13 @@ import pprint
 
 
 class File:
+    __slots__ = (
+        '_id',
+        '_name',
+        '_size',
+        '_content_path',
+    )
+
     openapi_types = {
         'id': 'str',
         'name': 'str',
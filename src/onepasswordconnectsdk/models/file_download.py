@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Optional
+from onepasswordconnectsdk.models.file import File
+
+
+@dataclass
+class FileDownload:
+    """The outcome of downloading one file with download_files"""
+    file: File
+    path: str
+    bytes_written: int = 0
+    elapsed: float = 0.0
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -26,6 +26,14 @@ class GeneratorRecipe:
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = (
+        '_length',
+        '_character_sets',
+        '_exclude_characters',
+    )
+
+    discriminator = None
+
     openapi_types = {
         'length': 'int',
         'character_sets': 'list[str]',
@@ -44,7 +52,6 @@ class GeneratorRecipe:
         self._length = None
         self._character_sets = None
         self._exclude_characters = None
-        self.discriminator = None
 
         if length is not None:
             self.length = length
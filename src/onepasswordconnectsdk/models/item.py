@@ -10,6 +10,8 @@
 
 import pprint
 
+from onepasswordconnectsdk.models.field_index import FieldIndex
+
 
 class Item:
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -25,6 +27,26 @@ class Item:
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = (
+        '_id',
+        '_title',
+        '_vault',
+        '_category',
+        '_urls',
+        '_favorite',
+        '_tags',
+        '_version',
+        '_trashed',
+        '_created_at',
+        '_updated_at',
+        '_last_edited_by',
+        '_sections',
+        '_fields',
+        '_field_index',
+    )
+
+    discriminator = None
+
     openapi_types = {
         'id': 'str',
         'title': 'str',
@@ -74,7 +96,7 @@ class Item:
         self._last_edited_by = None
         self._sections = None
         self._fields = None
-        self.discriminator = None
+        self._field_index = None
 
         if id is not None:
             self.id = id
@@ -397,6 +419,21 @@ class Item:
 
         self._fields = fields
 
+    @property
+    def field_index(self):
+        """Gets the lookup index over the fields of this Item.
+
+        The index is built on first use and rebuilt whenever `fields` or
+        `sections` are replaced or change length. Edits made to individual
+        fields in place are not picked up.
+
+        :return: The field index of this Item.
+        :rtype: FieldIndex
+        """
+        if self._field_index is None or not self._field_index.is_current(self._fields, self._sections):
+            self._field_index = FieldIndex(self._fields, self._sections)
+        return self._field_index
+
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
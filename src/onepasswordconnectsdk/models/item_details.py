@@ -25,6 +25,13 @@ class ItemDetails:
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = (
+        '_sections',
+        '_fields',
+    )
+
+    discriminator = None
+
     openapi_types = {
         'sections': 'list[Section]',
         'fields': 'list[Field]'
@@ -38,7 +45,6 @@ class ItemDetails:
     def __init__(self, sections=None, fields=None):  # noqa: E501
         self._sections = None
         self._fields = None
-        self.discriminator = None
 
         if sections is not None:
             self.sections = sections
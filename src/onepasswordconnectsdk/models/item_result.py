@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Optional
+from onepasswordconnectsdk.models.item import Item
+
+
+@dataclass
+class ItemResult:
+    """The outcome for one item of a batch operation"""
+    item_id: Optional[str]
+    item: Optional[Item] = None
+    error: Optional[Exception] = None
+    # Set when a bulk operation stopped on an earlier error before running this one
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.skipped
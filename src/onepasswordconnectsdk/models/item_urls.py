@@ -25,6 +25,13 @@ class ItemUrls:
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = (
+        '_primary',
+        '_href',
+    )
+
+    discriminator = None
+
     openapi_types = {
         'primary': 'bool',
         'href': 'str'
@@ -39,7 +46,6 @@ class ItemUrls:
         """ItemUrls - a model defined in OpenAPI"""  # noqa: E501
         self._primary = None
         self._href = None
-        self.discriminator = None
 
         if primary is not None:
             self.primary = primary
@@ -25,6 +25,12 @@ class ItemVault:
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = (
+        '_id',
+    )
+
+    discriminator = None
+
     openapi_types = {
         'id': 'str'
     }
@@ -36,7 +42,6 @@ class ItemVault:
     def __init__(self, id=None):  # noqa: E501
         """ItemVault - a model defined in OpenAPI"""  # noqa: E501
         self._id = None
-        self.discriminator = None
 
         self.id = id
 
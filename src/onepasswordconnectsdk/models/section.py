@@ -25,6 +25,13 @@ class Section:
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = (
+        '_id',
+        '_label',
+    )
+
+    discriminator = None
+
     openapi_types = {
         'id': 'str',
         'label': 'str'
@@ -38,7 +45,6 @@ class Section:
     def __init__(self, id=None, label=None):  # noqa: E501
         self._id = None
         self._label = None
-        self.discriminator = None
 
         self.id = id
         if label is not None:
@@ -28,6 +28,23 @@ class SummaryItem:
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = (
+        '_id',
+        '_title',
+        '_vault',
+        '_category',
+        '_urls',
+        '_favorite',
+        '_tags',
+        '_version',
+        '_trashed',
+        '_created_at',
+        '_updated_at',
+        '_last_edited_by',
+    )
+
+    discriminator = None
+
     openapi_types = {
         'id': 'str',
         'title': 'str',
@@ -71,7 +88,6 @@ class SummaryItem:
         self._created_at = None
         self._updated_at = None
         self._last_edited_by = None
-        self.discriminator = None
 
         if id is not None:
             self.id = id
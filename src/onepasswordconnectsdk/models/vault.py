@@ -25,6 +25,20 @@ class Vault:
       attribute_map (dict): The key is attribute name
                             and the value is json key in definition.
     """
+    __slots__ = (
+        '_id',
+        '_name',
+        '_description',
+        '_attribute_version',
+        '_content_version',
+        '_items',
+        '_type',
+        '_created_at',
+        '_updated_at',
+    )
+
+    discriminator = None
+
     openapi_types = {
         'id': 'str',
         'name': 'str',
@@ -60,7 +74,6 @@ class Vault:
         self._type = None
         self._created_at = None
         self._updated_at = None
-        self.discriminator = None
 
         if id is not None:
             self.id = id
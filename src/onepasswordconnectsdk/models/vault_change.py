@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import ClassVar, Optional
+from onepasswordconnectsdk.models.item import Item
+
+
+@dataclass
+class VaultChange:
+    """An item added to, changed in or removed from a synchronized vault"""
+    ADDED: ClassVar[str] = "added"
+    CHANGED: ClassVar[str] = "changed"
+    REMOVED: ClassVar[str] = "removed"
+
+    kind: str
+    item_id: str
+    # The item as it is now, None when it was removed
+    item: Optional[Item] = None
+    # The item as it was before, None when it was added
+    previous: Optional[Item] = None
+    vault_id: Optional[str] = None
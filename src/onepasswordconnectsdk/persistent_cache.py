@@ -0,0 +1,350 @@
+"""An encrypted on-disk cache of items, shared by processes on the same host"""
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from onepasswordconnectsdk.cache import CacheStats
+from onepasswordconnectsdk.models import Item
+from onepasswordconnectsdk.serializer import Serializer
+from onepasswordconnectsdk.utils import atomic_write
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+_MAGIC = b"OPCACHE1"
+# key length, stored at (seconds since the epoch), payload length
+_RECORD = struct.Struct("<HdI")
+_NONCE_SIZE = 12
+# Compact once the file holds this many superseded records and more of them than live ones
+_COMPACT_THRESHOLD = 256
+# Seconds for which an unchanged item stored by this instance is not written again
+_REWRITE_INTERVAL = 60.0
+
+
+@dataclass
+class PersistentCacheStats(CacheStats):
+    """Counters of a PersistentItemCache"""
+    fallbacks: int = 0
+    decrypt_failures: int = 0
+    errors: int = 0
+
+
+class PersistentItemCache:
+    """Keeps the items returned by get_item in an encrypted file.
+
+    Every item is encrypted with AES-GCM under `key`, which is supplied at
+    runtime and never written to disk; the vault and item it was requested
+    as, and the time it was stored, are authenticated along with it. Items
+    are appended to the file under an exclusive `fcntl` lock on a
+    neighbouring `.lock` file, and read through a memory map under a shared
+    one, so processes on the same host can share the cache. The file is
+    rewritten without superseded records once they outnumber the live ones.
+
+    Items are keyed by the vault and item arguments of get_item, names or
+    ids alike. Updating or deleting an item through the client drops the
+    entry stored under its vault id and item id, but not the ones stored
+    under its title or the name of its vault. An item younger than `ttl`
+    seconds is returned without contacting Connect, which lets restarted
+    processes start from the cache. An item fetched again with the version
+    this instance stored less than a minute ago, or less than `ttl` seconds
+    ago when that is shorter, is not written again, so its stored time may
+    lag behind its last fetch by up to that long.
+    When Connect cannot be reached, or answers with a server error, items up
+    to `max_staleness` seconds old are returned instead of failing. A cache
+    file that cannot be read or written, because it is damaged or belongs
+    to something else, is treated as empty: the error is counted in
+    `stats.errors` and get_item carries on with Connect.
+
+    Requires the `cryptography` package.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        key: bytes,
+        ttl: float = 0.0,
+        max_staleness: float = 86400.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize persistent item cache
+
+        Args:
+            path (str): The path of the cache file, created when missing
+            key (bytes): A 16, 24 or 32 byte AES key
+            ttl (float): The age in seconds under which items are served without contacting Connect;
+                0 always contacts Connect first
+            max_staleness (float): The age in seconds under which items are served when Connect is unavailable
+            clock (Callable[[], float]): Wall clock time source, in seconds since the epoch
+
+        Raises:
+            ImportError: Thrown when the cryptography package is not installed
+            ValueError: Thrown when the key has the wrong length or an age is negative
+        """
+        try:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        except ImportError:
+            raise ImportError(
+                "PersistentItemCache requires the cryptography package, "
+                "install it with `pip install onepasswordconnectsdk[persistent-cache]`"
+            ) from None
+        if len(key) not in (16, 24, 32):
+            raise ValueError("key must be 16, 24 or 32 bytes long")
+        if ttl < 0 or max_staleness < 0:
+            raise ValueError("ttl and max_staleness must not be negative")
+
+        self.path = path
+        self.ttl = ttl
+        self.max_staleness = max_staleness
+        self._aead = AESGCM(key)
+        self._clock = clock
+        self._serializer = Serializer()
+        self._lock = threading.RLock()
+        self._stats = PersistentCacheStats()
+        self._map: Optional[mmap.mmap] = None
+        self._file_id: Optional[Tuple[int, int]] = None
+        # record key -> (payload offset, payload length, stored at)
+        self._index: Dict[bytes, Tuple[int, int, float]] = {}
+        self._end = 0
+        self._superseded = 0
+        # record key -> (stored at, version) of the items written by this instance
+        self._written: Dict[bytes, Tuple[float, int]] = {}
+
+    @property
+    def stats(self) -> PersistentCacheStats:
+        """A snapshot of the cache counters"""
+        with self._lock:
+            return replace(self._stats)
+
+    def get(self, vault: str, item: str) -> Optional[Item]:
+        """Returns the stored item when it is younger than ttl, otherwise None"""
+        if self.ttl <= 0:
+            return None
+        value = self._read(vault, item, self.ttl)
+        with self._lock:
+            if value is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+        return value
+
+    def fallback(self, vault: str, item: str) -> Optional[Item]:
+        """Returns the stored item when it is younger than max_staleness, for use while Connect is unavailable"""
+        value = self._read(vault, item, self.max_staleness)
+        if value is not None:
+            with self._lock:
+                self._stats.fallbacks += 1
+        return value
+
+    def set(self, vault: str, item: str, value: Item) -> None:
+        """Stores an item, replacing the one stored for the same vault and item"""
+        record_key = _record_key(vault, item)
+        stored_at = self._clock()
+        with self._lock:
+            written = self._written.get(record_key)
+        if (
+            written is not None
+            and value.version is not None
+            and written[1] == value.version
+            and stored_at - written[0] < self._rewrite_interval()
+        ):
+            return
+        nonce = os.urandom(_NONCE_SIZE)
+        plaintext = self._serializer.serialize(value)
+        payload = nonce + self._aead.encrypt(nonce, plaintext, record_key + _pack_time(stored_at))
+        record = _RECORD.pack(len(record_key), stored_at, len(payload)) + record_key + payload
+
+        with self._lock:
+            try:
+                with self._locked(exclusive=True):
+                    self._refresh()
+                    self._append(record)
+            except Exception:
+                self._failed()
+                return
+            if value.version is not None:
+                self._written[record_key] = (stored_at, value.version)
+
+    def invalidate(self, vault: str, item: str) -> None:
+        """Forgets the item stored for a vault and item
+
+        Only the entry stored under these exact arguments is dropped: an
+        item stored under its title, or under the name of its vault, is
+        kept until it ages out.
+        """
+        record_key = _record_key(vault, item)
+        with self._lock:
+            self._written.pop(record_key, None)
+            try:
+                with self._locked(exclusive=True):
+                    self._refresh()
+                    if record_key in self._index:
+                        self._append(_RECORD.pack(len(record_key), self._clock(), 0) + record_key)
+            except Exception:
+                self._failed()
+
+    def clear(self) -> None:
+        """Removes every stored item"""
+        with self._lock, self._locked(exclusive=True):
+            self._unmap()
+            self._written.clear()
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+    def close(self) -> None:
+        """Releases the memory map of the cache file"""
+        with self._lock:
+            self._unmap()
+
+    def __len__(self) -> int:
+        with self._lock, self._locked(exclusive=False):
+            self._refresh()
+            return len(self._index)
+
+    def _read(self, vault: str, item: str, max_age: float) -> Optional[Item]:
+        record_key = _record_key(vault, item)
+        with self._lock:
+            try:
+                with self._locked(exclusive=False):
+                    self._refresh()
+                    entry = self._index.get(record_key)
+                    if entry is None:
+                        return None
+                    offset, length, stored_at = entry
+                    if self._clock() - stored_at >= max_age:
+                        return None
+                    payload = self._map[offset:offset + length]
+            except Exception:
+                self._failed()
+                return None
+
+            try:
+                plaintext = self._aead.decrypt(payload[:_NONCE_SIZE], payload[_NONCE_SIZE:],
+                                               record_key + _pack_time(stored_at))
+            except Exception:
+                # written under another key, or tampered with
+                self._stats.decrypt_failures += 1
+                return None
+        try:
+            return self._serializer.deserialize(plaintext, "Item")
+        except Exception:
+            with self._lock:
+                self._stats.errors += 1
+            return None
+
+    def _rewrite_interval(self) -> float:
+        return min(self.ttl, _REWRITE_INTERVAL) if self.ttl > 0 else _REWRITE_INTERVAL
+
+    def _failed(self) -> None:
+        """Counts a cache file that could not be read or written, and forgets what was indexed from it"""
+        self._stats.errors += 1
+        self._unmap()
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """Holds the inter-process lock on the cache file"""
+        if fcntl is None:
+            yield
+            return
+        with open(self.path + ".lock", "a+b") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _refresh(self) -> None:
+        """Maps the current cache file and indexes the records added since the last call"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._unmap()
+            return
+
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self._file_id or stat.st_size < self._end:
+            self._unmap()
+        elif self._map is not None and stat.st_size == len(self._map):
+            return
+        if stat.st_size < len(_MAGIC):
+            return
+
+        with open(self.path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapped[:len(_MAGIC)] != _MAGIC:
+            mapped.close()
+            raise ValueError(f"{self.path} is not a 1Password Connect item cache")
+        if self._map is not None:
+            self._map.close()
+        self._map = mapped
+        self._file_id = file_id
+        self._index_records(max(self._end, len(_MAGIC)))
+
+    def _index_records(self, position: int) -> None:
+        size = len(self._map)
+        while position + _RECORD.size <= size:
+            key_length, stored_at, payload_length = _RECORD.unpack_from(self._map, position)
+            key_start = position + _RECORD.size
+            payload_start = key_start + key_length
+            end = payload_start + payload_length
+            if end > size:
+                break
+            record_key = bytes(self._map[key_start:payload_start])
+            if record_key in self._index:
+                self._superseded += 1
+            if payload_length == 0:
+                # a tombstone written by invalidate, itself dropped by the next compaction
+                self._index.pop(record_key, None)
+                self._superseded += 1
+            else:
+                self._index[record_key] = (payload_start, payload_length, stored_at)
+            position = end
+        self._end = position
+
+    def _append(self, record: bytes) -> None:
+        """Appends a record, holding the exclusive lock, and compacts the file when needed"""
+        with open(self.path, "ab") as file:
+            # drops whatever a writer interrupted mid-record, or mid-header, left behind
+            file.truncate(self._end)
+            if self._end == 0:
+                file.write(_MAGIC)
+            file.write(record)
+        self._refresh()
+        if self._superseded > max(_COMPACT_THRESHOLD, len(self._index)):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rewrites the cache file with only the latest record of each item"""
+        with atomic_write(self.path) as file:
+            file.write(_MAGIC)
+            for record_key, (offset, length, stored_at) in self._index.items():
+                file.write(_RECORD.pack(len(record_key), stored_at, length))
+                file.write(record_key)
+                file.write(self._map[offset:offset + length])
+        self._unmap()
+        self._refresh()
+
+    def _unmap(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._map = None
+        self._file_id = None
+        self._index = {}
+        self._end = 0
+        self._superseded = 0
+
+
+def _record_key(vault: str, item: str) -> bytes:
+    return f"{vault}\0{item}".encode("utf-8")
+
+
+def _pack_time(stored_at: float) -> bytes:
+    return struct.pack("<d", stored_at)
@@ -0,0 +1,86 @@
+"""Client-side rate limiting of the requests sent to 1Password Connect"""
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Callable
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters describing how long requests waited for the rate limiter"""
+    acquired: int = 0
+    delayed: int = 0
+    wait_time: float = 0.0
+    max_wait: float = 0.0
+
+
+class RateLimiter:
+    """A token bucket allowing `rate` requests per second on average.
+
+    The bucket holds up to `burst` tokens and every request takes one. A
+    request arriving at an empty bucket reserves the next token and waits
+    until it has been refilled, so waiting requests are served in arrival
+    order. Tokens are reserved under a lock and the wait happens outside
+    it, so one limiter can be shared by threads using a Client and by
+    coroutines using an AsyncClient, which then never block the event loop.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize rate limiter
+
+        Args:
+            rate (float): The number of requests allowed per second
+            burst (int): The number of requests that can be sent at once after a quiet period
+            clock (Callable[[], float]): Monotonic time source, in seconds
+
+        Raises:
+            ValueError: Thrown when rate or burst is not positive
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+        self._stats = RateLimiterStats()
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """A snapshot of the limiter counters"""
+        with self._lock:
+            return replace(self._stats)
+
+    def acquire(self) -> float:
+        """Blocks until a request may be sent, returning the number of seconds waited"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """Waits until a request may be sent, returning the number of seconds waited"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def _reserve(self) -> float:
+        """Takes a token, returning how long to wait until it is available"""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            delay = max(0.0, -self._tokens / self.rate)
+
+            self._stats.acquired += 1
+            if delay > 0:
+                self._stats.delayed += 1
+                self._stats.wait_time += delay
+                self._stats.max_wait = max(self._stats.max_wait, delay)
+            return delay
@@ -0,0 +1,127 @@
+"""Retrying requests that failed because of transient Connect server errors"""
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Collection, Optional
+
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+# Transport errors that may not happen again; a bad URL or proxy setting is not retried
+TRANSIENT_ERRORS = (
+    httpx.TimeoutException,
+    httpx.ConnectError,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is sent again.
+
+    A request is retried when the server answers with one of
+    `status_codes`, or when it fails with a transient transport error such
+    as a timeout, a refused connection or a dropped one, as long as its
+    method is one of `methods`. Errors that would happen again, like an
+    unsupported URL scheme or a failing proxy, are raised at once. Only idempotent methods are
+    retried by default, so creating an item is never sent twice.
+
+    The delay before attempt n + 1 is `backoff_factor * 2 ** (n - 1)`,
+    capped at `max_backoff`. With jitter, a random delay between 0 and
+    that value is used instead, which spreads out clients that failed at
+    the same time. A `Retry-After` header takes precedence over the
+    computed delay; when it asks for longer than `max_backoff` the
+    response is returned as is.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        status_codes: Collection[int] = RETRY_STATUS_CODES,
+        methods: Collection[str] = IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+    ) -> None:
+        """Initialize retry policy
+
+        Args:
+            max_attempts (int): The maximum number of times a request is sent, including the first one
+            backoff_factor (float): The delay in seconds before the first retry, doubled for each retry after it
+            max_backoff (float): The longest delay in seconds between two attempts
+            jitter (bool): Whether to randomize delays between 0 and the computed backoff
+            status_codes (Collection[int]): The response status codes that are retried
+            methods (Collection[str]): The HTTP methods that are retried
+            respect_retry_after (bool): Whether to wait as long as the Retry-After header asks
+
+        Raises:
+            ValueError: Thrown when max_attempts is lower than 1 or a delay is negative
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if backoff_factor < 0 or max_backoff < 0:
+            raise ValueError("backoff_factor and max_backoff must not be negative")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.respect_retry_after = respect_retry_after
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """Returns how long to wait before sending the request again, or None to stop
+
+        Args:
+            method (str): The method of the request
+            attempt (int): The number of times the request has been sent so far
+            response (Optional[httpx.Response]): The response to the last attempt
+            error (Optional[Exception]): The error raised by the last attempt instead of a response
+
+        Returns:
+            Optional[float]: The delay in seconds, or None when the request should not be retried
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.methods:
+            return None
+        if response is not None:
+            if response.status_code not in self.status_codes:
+                return None
+            retry_after = self._retry_after(response) if self.respect_retry_after else None
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_backoff else None
+        elif not isinstance(error, TRANSIENT_ERRORS):
+            return None
+        return self.backoff(attempt)
+
+    def backoff(self, attempt: int) -> float:
+        """Returns the delay after the given attempt, with jitter applied"""
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
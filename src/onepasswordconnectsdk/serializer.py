@@ -1,9 +1,9 @@
 from dateutil.parser import parse
-import json
 import re
 import datetime
 import onepasswordconnectsdk
 from onepasswordconnectsdk.errors import FailedToDeserializeException
+from onepasswordconnectsdk.json_backend import AUTO, get_json_backend
 
 
 class Serializer:
@@ -17,6 +17,16 @@ class Serializer:
         "datetime": datetime.datetime,
         "object": object,
     }
+    # Compiled converters, shared by all Serializer instances
+    _converters = {}
+
+    def __init__(self, json_backend: str = AUTO):
+        """Initialize serializer
+
+        :param json_backend: name of the JSON backend used to decode
+            responses and encode request bodies, see get_json_backend.
+        """
+        self.json_backend = get_json_backend(json_backend)
 
     def deserialize(self, response, response_type):
         """Deserializes response into an object.
@@ -27,13 +37,37 @@ class Serializer:
 
         :return: deserialized object.
         """
-        # fetch data from response object
+        return self.to_model(self.decode(response), response_type)
+
+    def decode(self, response):
+        """Decodes a JSON response body.
+
+        :param response: the raw response body.
+        :return: the decoded data, or the body itself if it is not JSON.
+        """
         try:
-            data = json.loads(response)
+            return self.json_backend.loads(response)
         except ValueError:
-            data = response
+            return response
+
+    def to_model(self, data, response_type):
+        """Converts already decoded JSON data into an object.
+
+        :param data: decoded JSON data.
+        :param response_type: class literal for
+            deserialized object, or string of class name.
 
-        return self.__deserialize(data, response_type)
+        :return: deserialized object.
+        """
+        return self._converter(response_type)(data)
+
+    def serialize(self, obj):
+        """Encodes an object as a JSON request body.
+
+        :param obj: The data to serialize.
+        :return: UTF-8 encoded JSON.
+        """
+        return self.json_backend.dumps(self.sanitize_for_serialization(obj))
 
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
@@ -79,133 +113,201 @@ class Serializer:
             for key, val in obj_dict.items()
         }
 
-    def __deserialize(self, data, klass):
-        """Deserializes dict, list, str into an object.
+    @classmethod
+    def _converter(cls, klass):
+        """Returns the cached converter for a type, compiling it on first use.
 
-        :param data: dict, list or str.
         :param klass: class literal, or string of class name.
-
-        :return: object.
+        :return: function turning decoded JSON data into the given type.
         """
-        if data is None:
-            return None
+        converter = cls._converters.get(klass)
+        if converter is None:
+            converter = cls._compile(klass, {})
+            cls._converters[klass] = converter
+        return converter
+
+    @classmethod
+    def _compile(cls, klass, building):
+        """Builds the converter for a type.
+
+        `building` holds the converters of models currently being compiled
+        so that self-referencing models resolve to the same converter.
+        """
+        if klass in cls._converters:
+            return cls._converters[klass]
+        if klass in building:
+            return building[klass]
 
         if type(klass) == str:
             if klass.startswith("list["):
                 sub_kls = re.match(r"list\[(.*)\]", klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls) for sub_data in data]  # noqa: E501
+                return cls._compile_list(cls._compile(sub_kls, building))
 
             if klass.startswith("dict("):
                 sub_kls = re.match(r"dict\(([^,]*), (.*)\)", klass).group(2)
-                return {
-                    k: self.__deserialize(v, sub_kls) for k, v in data.items()  # noqa: E501
-                }
+                return cls._compile_dict(cls._compile(sub_kls, building))
 
             # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
+            if klass in cls.NATIVE_TYPES_MAPPING:
+                klass = cls.NATIVE_TYPES_MAPPING[klass]
             else:
                 klass = getattr(onepasswordconnectsdk.models, klass)
+            return cls._compile(klass, building)
 
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+        if klass in cls.PRIMITIVE_TYPES:
+            return cls._compile_primitive(klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            return _deserialize_object
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            return _deserialize_date
         elif klass == datetime.datetime:
-            return self.__deserialize_datetime(data)
+            return _deserialize_datetime
         else:
-            return self.__deserialize_model(data, klass)
-
-    def __deserialize_primitive(self, data, klass):
-        """Deserializes string to primitive type.
-
-        :param data: str.
-        :param klass: class literal.
-
-        :return: int, long, float, str, bool.
-        """
-        try:
-            return klass(data)
-        except UnicodeEncodeError:
-            return str(data)
-        except TypeError:
-            return data
-
-    def __deserialize_object(self, value):
-        """Return an original value.
-
-        :return: object.
-        """
-        return value
-
-    def __deserialize_date(self, string):
-        """Deserializes string to date.
-
-        :param string: str.
-        :return: date.
-        """
-        try:
-            return parse(string).date()
-        except ImportError:
-            return string
-        except ValueError:
-            raise FailedToDeserializeException(
-                f'Failed to parse `{0}`\
-                 as date object".format(string)'
-            )
-
-    def __deserialize_datetime(self, string):
-        """Deserializes string to datetime.
-
-        The string should be in iso8601 datetime format.
-
-        :param string: str.
-        :return: datetime.
-        """
-        try:
-            return parse(string)
-        except ImportError:
-            return string
-        except ValueError:
-            raise FailedToDeserializeException(
-                f'Failed to parse `{0}`\
-                 as date object".format(string)'
-            )
-
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
+            return cls._compile_model(klass, building)
+
+    @staticmethod
+    def _compile_list(convert_item):
+        def convert(data):
+            if data is None:
+                return None
+            return [convert_item(sub_data) for sub_data in data]
+        return convert
+
+    @staticmethod
+    def _compile_dict(convert_value):
+        def convert(data):
+            if data is None:
+                return None
+            return {k: convert_value(v) for k, v in data.items()}
+        return convert
+
+    @staticmethod
+    def _compile_primitive(klass):
+        """Converts data to int, float, str, bool or bytes."""
+        def convert(data):
+            if data is None or type(data) is klass:
+                return data
+            try:
+                return klass(data)
+            except UnicodeEncodeError:
+                return str(data)
+            except TypeError:
+                return data
+        return convert
+
+    @classmethod
+    def _compile_model(cls, klass, building):
+        """Builds a converter creating model instances from dicts.
+
+        The model's attribute map is resolved into a list of
+        (json key, attribute name, converter) once, so deserializing an
+        object only walks that list.
         """
-        has_discriminator = False
-        if (
-                hasattr(klass, "get_real_child_model")
-                and klass.discriminator_value_class_map
-        ):
-            has_discriminator = True
+        has_discriminator = bool(
+            hasattr(klass, "get_real_child_model")
+            and klass.discriminator_value_class_map
+        )
 
         if not klass.openapi_types and has_discriminator is False:
-            return data
-
-        kwargs = {}
-        if (
-                data is not None
-                and klass.openapi_types is not None
-                and isinstance(data, (list, dict))
-        ):
-            for attr, attr_type in klass.openapi_types.items():
-                if klass.attribute_map[attr] in data:
-                    value = data[klass.attribute_map[attr]]
-                    kwargs[attr] = self.__deserialize(value, attr_type)
-
-        instance = klass(**kwargs)
-
-        if has_discriminator:
-            klass_name = instance.get_real_child_model(data)
-            if klass_name:
-                instance = self.__deserialize(data, klass_name)
-        return instance
+            return _deserialize_object
+
+        plan = []
+
+        def convert(data):
+            if data is None:
+                return None
+
+            kwargs = {}
+            if isinstance(data, (list, dict)):
+                for json_key, attr, convert_value in plan:
+                    if json_key in data:
+                        kwargs[attr] = convert_value(data[json_key])
+
+            instance = klass(**kwargs)
+
+            if has_discriminator:
+                klass_name = instance.get_real_child_model(data)
+                if klass_name:
+                    instance = cls._converter(klass_name)(data)
+            return instance
+
+        building[klass] = convert
+        plan.extend(
+            (klass.attribute_map[attr], attr, cls._compile(attr_type, building))
+            for attr, attr_type in klass.openapi_types.items()
+        )
+        cls._converters[klass] = convert
+        return convert
+
+
+def _deserialize_object(value):
+    """Return an original value.
+
+    :return: object.
+    """
+    return value
+
+
+def _deserialize_date(string):
+    """Deserializes string to date.
+
+    :param string: str.
+    :return: date.
+    """
+    if string is None:
+        return None
+    try:
+        return parse(string).date()
+    except ImportError:
+        return string
+    except ValueError:
+        raise FailedToDeserializeException(
+            f'Failed to parse `{string}` as date object'
+        )
+
+
+def _deserialize_datetime(string):
+    """Deserializes string to datetime.
+
+    The string should be in iso8601 datetime format. Strings that
+    datetime.fromisoformat understands skip the much slower dateutil
+    parser; their timezone is the one dateutil picks for the same offset,
+    so the result is identical either way.
+
+    :param string: str.
+    :return: datetime.
+    """
+    if string is None:
+        return None
+    try:
+        value = datetime.datetime.fromisoformat(
+            string[:-1] + "+00:00" if string.endswith("Z") else string
+        )
+    except (TypeError, ValueError):
+        pass
+    else:
+        if value.tzinfo is None:
+            return value
+        suffix_start = len(string) - 1 if string.endswith("Z") else max(string.rfind("+"), string.rfind("-"))
+        return value.replace(tzinfo=_tzinfo_for_offset(string[suffix_start:]))
+
+    try:
+        return parse(string)
+    except ImportError:
+        return string
+    except ValueError:
+        raise FailedToDeserializeException(
+            f'Failed to parse `{string}` as datetime object'
+        )
+
+
+def _tzinfo_for_offset(offset):
+    """Returns the tzinfo dateutil uses for an ISO 8601 offset such as `Z` or `+01:00`"""
+    tzinfo = _OFFSET_TZINFOS.get(offset)
+    if tzinfo is None:
+        tzinfo = parse("2000-01-01T00:00:00" + offset).tzinfo
+        _OFFSET_TZINFOS[offset] = tzinfo
+    return tzinfo
+
+
+_OFFSET_TZINFOS = {}
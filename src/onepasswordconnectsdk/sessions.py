@@ -0,0 +1,56 @@
+"""Sharing HTTP sessions between clients talking to the same Connect server"""
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class SessionRegistry:
+    """Reference-counted sessions shared by the clients created with the same key.
+
+    The first client acquiring a key creates the session; later clients
+    reuse it, and with it its pooled connections and TLS sessions. Releasing
+    the last reference hands the session back to the caller to be closed,
+    which keeps the registry independent of sync and async sessions.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sessions: Dict[Hashable, List[Any]] = {}
+
+    def acquire(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        """Returns the session for key, creating it when no client holds it"""
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                entry = self._sessions[key] = [create(), 0]
+            entry[1] += 1
+            return entry[0]
+
+    def release(self, key: Hashable) -> Optional[Any]:
+        """Drops a reference to the session for key
+
+        Returns:
+            Optional[Any]: The session once its last reference is released,
+            for the caller to close, otherwise None
+        """
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                return None
+            entry[1] -= 1
+            if entry[1] > 0:
+                return None
+            del self._sessions[key]
+            return entry[0]
+
+    def refcount(self, key: Hashable) -> int:
+        """Returns the number of clients holding the session for key"""
+        with self._lock:
+            entry = self._sessions.get(key)
+            return entry[1] if entry else 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+# Sessions shared by clients created with `shared=True`
+SHARED_SESSIONS = SessionRegistry()
@@ -0,0 +1,177 @@
+"""Keeping a local copy of a vault's items in sync with 1Password Connect"""
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from onepasswordconnectsdk.errors import FailedToRetrieveItemException
+from onepasswordconnectsdk.models import Item, ItemResult, SummaryItem, VaultChange
+
+if TYPE_CHECKING:
+    from onepasswordconnectsdk.async_client import AsyncClient
+    from onepasswordconnectsdk.client import Client
+
+
+class VaultSync:
+    """Mirrors the items of one vault, fetching only what changed.
+
+    Every call to sync fetches the vault first. When its `content_version`
+    is the one seen by the previous sync, nothing else is requested.
+    Otherwise the item summaries are listed and only the items whose
+    `version` differs from the mirrored copy are fetched in full.
+
+    The mirror is replaced at once when a sync succeeds and left untouched
+    when it fails, so `items` is always a consistent snapshot of the vault
+    at some point in time.
+    """
+
+    def __init__(self, client: "Client", vault_id: str, concurrency: int = 8) -> None:
+        """Initialize vault sync
+
+        Args:
+            client (Client): The client used to reach 1Password Connect
+            vault_id (str): The id of the vault to mirror
+            concurrency (int): The maximum number of items fetched at once
+        """
+        self.client = client
+        self.vault_id = vault_id
+        self.concurrency = concurrency
+        self.content_version: Optional[int] = None
+        self._items: Dict[str, Item] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def items(self) -> Dict[str, Item]:
+        """The mirrored items by id, as of the last successful sync"""
+        return dict(self._items)
+
+    def sync(self) -> List[VaultChange]:
+        """Brings the mirror up to date with the vault
+
+        Raises:
+            FailedToRetrieveVaultException: Thrown when the vault or its items cannot be listed
+            FailedToRetrieveItemException: Thrown when a changed item cannot be fetched
+
+        Returns:
+            List[VaultChange]: The items added, changed and removed since the last sync
+        """
+        with self._lock:
+            vault = self.client.get_vault(self.vault_id)
+            if _unchanged(vault.content_version, self.content_version):
+                return []
+
+            summaries = self.client.get_items(self.vault_id)
+            changed = _changed_ids(self._items, summaries)
+            _forget_cached(self.client, self.vault_id, changed)
+            results = self.client.get_items_by_ids(changed, self.vault_id, self.concurrency)
+
+            self._items, changes = _apply(self.vault_id, self._items, summaries, _collect(results))
+            self.content_version = vault.content_version
+            return changes
+
+
+class AsyncVaultSync:
+    """Mirrors the items of one vault through an AsyncClient, fetching only what changed.
+
+    See VaultSync for how changes are detected.
+    """
+
+    def __init__(self, client: "AsyncClient", vault_id: str, concurrency: int = 8) -> None:
+        """Initialize async vault sync
+
+        Args:
+            client (AsyncClient): The client used to reach 1Password Connect
+            vault_id (str): The id of the vault to mirror
+            concurrency (int): The maximum number of items fetched at once
+        """
+        self.client = client
+        self.vault_id = vault_id
+        self.concurrency = concurrency
+        self.content_version: Optional[int] = None
+        self._items: Dict[str, Item] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def items(self) -> Dict[str, Item]:
+        """The mirrored items by id, as of the last successful sync"""
+        return dict(self._items)
+
+    async def sync(self) -> List[VaultChange]:
+        """Brings the mirror up to date with the vault
+
+        Raises:
+            FailedToRetrieveVaultException: Thrown when the vault or its items cannot be listed
+            FailedToRetrieveItemException: Thrown when a changed item cannot be fetched
+
+        Returns:
+            List[VaultChange]: The items added, changed and removed since the last sync
+        """
+        async with self._lock:
+            vault = await self.client.get_vault(self.vault_id)
+            if _unchanged(vault.content_version, self.content_version):
+                return []
+
+            summaries = await self.client.get_items(self.vault_id)
+            changed = _changed_ids(self._items, summaries)
+            _forget_cached(self.client, self.vault_id, changed)
+            results = await self.client.get_items_by_ids(changed, self.vault_id, self.concurrency)
+
+            self._items, changes = _apply(self.vault_id, self._items, summaries, _collect(results))
+            self.content_version = vault.content_version
+            return changes
+
+
+def _unchanged(content_version: Optional[int], synced_version: Optional[int]) -> bool:
+    return content_version is not None and content_version == synced_version
+
+
+def _changed_ids(items: Dict[str, Item], summaries: List[SummaryItem]) -> List[str]:
+    """Returns the ids of the listed items missing from the mirror or at another version"""
+    return [
+        summary.id for summary in summaries
+        if summary.id not in items or summary.version is None or items[summary.id].version != summary.version
+    ]
+
+
+def _forget_cached(client, vault_id: str, item_ids: List[str]) -> None:
+    """Drops cached copies of changed items, so they are fetched from the server"""
+    if client.item_cache is not None:
+        for item_id in item_ids:
+            client.item_cache.invalidate(vault_id, item_id)
+
+
+def _collect(results: List[ItemResult]) -> Dict[str, Optional[Item]]:
+    """Returns the fetched items by id, with None for items deleted since they were listed"""
+    fetched = {}
+    for result in results:
+        if result.ok:
+            fetched[result.item_id] = result.item
+        elif isinstance(result.error, FailedToRetrieveItemException) and result.error.status_code == 404:
+            fetched[result.item_id] = None
+        else:
+            raise result.error
+    return fetched
+
+
+def _apply(vault_id: str, items: Dict[str, Item], summaries: List[SummaryItem], fetched: Dict[str, Optional[Item]]):
+    """Returns the new mirror and the changes that lead to it"""
+    synced: Dict[str, Item] = {}
+    changes: List[VaultChange] = []
+    for summary in summaries:
+        if summary.id not in fetched:
+            if summary.id in items:
+                synced[summary.id] = items[summary.id]
+            continue
+        item = fetched[summary.id]
+        if item is None:
+            continue
+        previous = items.get(summary.id)
+        synced[summary.id] = item
+        if previous is not None and item.version is not None and previous.version == item.version:
+            continue
+        kind = VaultChange.ADDED if previous is None else VaultChange.CHANGED
+        changes.append(VaultChange(kind, summary.id, item, previous, vault_id))
+
+    for item_id, previous in items.items():
+        if item_id not in synced:
+            changes.append(VaultChange(VaultChange.REMOVED, item_id, previous=previous, vault_id=vault_id))
+    return synced, changes
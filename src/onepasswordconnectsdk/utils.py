@@ -1,9 +1,37 @@
+import asyncio
 import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Awaitable, BinaryIO, Callable, Iterable, Iterator, List
 
+import httpx
 from httpx._client import DEFAULT_TIMEOUT_CONFIG, Timeout
 
+from onepasswordconnectsdk.errors import OnePasswordConnectSDKError
+
 UUIDLength = 26
 ENV_CLIENT_REQUEST_TIMEOUT = "OP_CONNECT_CLIENT_REQ_TIMEOUT"
+ENV_CLIENT_HTTP2 = "OP_CONNECT_CLIENT_HTTP2"
+ENV_CLIENT_MAX_CONNECTIONS = "OP_CONNECT_CLIENT_MAX_CONNECTIONS"
+ENV_CLIENT_MAX_KEEPALIVE_CONNECTIONS = "OP_CONNECT_CLIENT_MAX_KEEPALIVE_CONNECTIONS"
+ENV_CLIENT_KEEPALIVE_EXPIRY = "OP_CONNECT_CLIENT_KEEPALIVE_EXPIRY"
+ENV_CLIENT_CONNECT_TIMEOUT = "OP_CONNECT_CLIENT_CONNECT_TIMEOUT"
+ENV_CLIENT_READ_TIMEOUT = "OP_CONNECT_CLIENT_READ_TIMEOUT"
+ENV_CLIENT_WRITE_TIMEOUT = "OP_CONNECT_CLIENT_WRITE_TIMEOUT"
+ENV_CLIENT_POOL_TIMEOUT = "OP_CONNECT_CLIENT_POOL_TIMEOUT"
+JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+HEARTBEAT_PATH = "/heartbeat"
+HEALTH_PATH = "/health"
+
+
+def is_unavailable(error: BaseException) -> bool:
+    """Returns whether an error means the Connect server could not serve the request,
+    because it could not be reached or answered with a server error"""
+    if isinstance(error, httpx.TransportError):
+        return True
+    status_code = getattr(error, "status_code", None)
+    return isinstance(error, OnePasswordConnectSDKError) and status_code is not None and status_code >= 500
 
 
 def is_valid_uuid(uuid):
@@ -16,13 +44,64 @@ def is_valid_uuid(uuid):
     return True
 
 
+def decode_response(serializer, response, url: str, exception: type, action: str) -> Any:
+    """Decodes a response body exactly once, raising for unsuccessful responses
+
+    Args:
+        serializer (Serializer): The serializer used to decode the body
+        response (httpx.Response): The response to decode
+        url (str): The requested path, used in the error message
+        exception (type): The exception raised for unsuccessful responses
+        action (str): What the request did, used in the error message
+
+    Returns:
+        Any: The decoded body, ready to be passed to Serializer.to_model
+    """
+    data = serializer.decode(response.content)
+    if not response.is_success:
+        message = data.get("message") if isinstance(data, dict) else None
+        raise exception(
+            f"Unable to {action}. Received {response.status_code} for {url} with message: {message}",
+            status_code=response.status_code,
+        )
+    return data
+
+
+@contextmanager
+def atomic_write(destination: str) -> Iterator[BinaryIO]:
+    """Opens a temporary file that replaces destination once the block completes
+
+    The temporary file is created in the destination's directory so the
+    final rename is atomic. If the block raises, the temporary file is
+    removed and destination is left untouched.
+
+    Args:
+        destination (str): The path of the file to write
+
+    Yields:
+        BinaryIO: The temporary file, opened for binary writing
+    """
+    directory, filename = os.path.split(destination)
+    fd, temp_path = tempfile.mkstemp(dir=directory or None, prefix=f".{filename}.", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            yield file
+        os.replace(temp_path, destination)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 def build_headers(token: str):
     """Builds the headers needed to make a request to the server
 
     Returns:
         dict: The 1Password Connect API request headers
     """
-    return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    return {"Authorization": f"Bearer {token}", **JSON_CONTENT_TYPE}
 
 
 class PathBuilder:
@@ -76,3 +155,41 @@ def get_timeout() -> Timeout:
         return timeout if timeout else DEFAULT_TIMEOUT_CONFIG
     else:
         return DEFAULT_TIMEOUT_CONFIG
+
+
+def map_concurrently(func: Callable, arguments: Iterable[tuple], max_workers: int) -> List[Future]:
+    """Calls func with each argument tuple on a bounded thread pool
+
+    Args:
+        func (Callable): The function to call
+        arguments (Iterable[tuple]): Positional arguments for each call
+        max_workers (int): The maximum number of calls running at once
+
+    Returns:
+        List[Future]: The completed futures, in the same order as arguments
+    """
+    arguments = list(arguments)
+    if not arguments:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(arguments)))) as executor:
+        return [executor.submit(func, *args) for args in arguments]
+
+
+async def gather_concurrently(awaitables: Iterable[Awaitable], limit: int) -> List[Any]:
+    """Awaits every awaitable with at most limit of them running at once
+
+    Args:
+        awaitables (Iterable[Awaitable]): The awaitables to run
+        limit (int): The maximum number of awaitables running at once
+
+    Returns:
+        List[Any]: The results in the same order as awaitables. An awaitable
+        that raised is represented by its exception.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(awaitable: Awaitable) -> Any:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(*(run(awaitable) for awaitable in awaitables), return_exceptions=True)
@@ -0,0 +1,316 @@
+"""Watching items for changes made on the 1Password Connect server"""
+import asyncio
+import random
+import threading
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from onepasswordconnectsdk.errors import FailedToRetrieveItemException
+from onepasswordconnectsdk.models import Item, ItemResult, SummaryItem, VaultChange
+from onepasswordconnectsdk.sync import _forget_cached
+
+if TYPE_CHECKING:
+    from onepasswordconnectsdk.async_client import AsyncClient
+    from onepasswordconnectsdk.client import Client
+
+# State of a watched item that has not been polled yet
+_UNKNOWN = object()
+
+
+class _Watches:
+    """The watched items and the polling schedule shared by both watchers.
+
+    Each watched item maps to the copy seen by the last poll, None while
+    it does not exist, or _UNKNOWN until the first poll has seen it. The
+    first poll only records the items; changes are reported from the
+    second poll on.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float, jitter: float, concurrency: int,
+                 on_error: Optional[Callable[[Exception], None]]) -> None:
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("min_interval must be greater than 0 and not greater than max_interval")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be between 0 and 1")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.concurrency = concurrency
+        self.on_error = on_error
+        self.interval = min_interval
+        self.last_error: Optional[Exception] = None
+        self._items: Dict[str, Dict[str, object]] = {}
+        self._lock = threading.Lock()
+
+    def watch(self, vault_id: str, item_id: str) -> None:
+        """Starts watching an item"""
+        with self._lock:
+            self._items.setdefault(vault_id, {}).setdefault(item_id, _UNKNOWN)
+
+    def unwatch(self, vault_id: str, item_id: str) -> None:
+        """Stops watching an item"""
+        with self._lock:
+            items = self._items.get(vault_id, {})
+            items.pop(item_id, None)
+            if not items:
+                self._items.pop(vault_id, None)
+
+    def get(self, vault_id: str, item_id: str) -> Optional[Item]:
+        """Returns the copy of a watched item seen by the last poll, if any"""
+        with self._lock:
+            item = self._items.get(vault_id, {}).get(item_id)
+            return None if item is _UNKNOWN else item
+
+    def next_delay(self) -> float:
+        """Returns the time to wait before the next poll, with jitter applied"""
+        return self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _vaults(self) -> List[str]:
+        with self._lock:
+            return list(self._items)
+
+    def _plan(self, vault_id: str, summaries: List[SummaryItem]) -> Tuple[List[str], List[VaultChange]]:
+        """Returns the watched items that must be fetched, and the changes for those that disappeared"""
+        versions = {summary.id: summary.version for summary in summaries}
+        fetch, changes = [], []
+        with self._lock:
+            items = self._items.get(vault_id, {})
+            for item_id, seen in items.items():
+                if item_id not in versions:
+                    if isinstance(seen, Item):
+                        changes.append(VaultChange(VaultChange.REMOVED, item_id, previous=seen, vault_id=vault_id))
+                    items[item_id] = None
+                elif not isinstance(seen, Item) or versions[item_id] is None or seen.version != versions[item_id]:
+                    fetch.append(item_id)
+        return fetch, changes
+
+    def _update(self, vault_id: str, results: List[ItemResult]) -> List[VaultChange]:
+        """Records the fetched items, returning what changed about them"""
+        changes, errors = [], []
+        with self._lock:
+            items = self._items.get(vault_id, {})
+            for result in results:
+                if result.item_id not in items:
+                    continue
+                if not result.ok and not (
+                    isinstance(result.error, FailedToRetrieveItemException) and result.error.status_code == 404
+                ):
+                    errors.append(result.error)
+                    continue
+                seen, item = items[result.item_id], result.item
+                items[result.item_id] = item
+                if seen is _UNKNOWN:
+                    continue
+                if item is None:
+                    if seen is not None:
+                        changes.append(VaultChange(VaultChange.REMOVED, result.item_id, previous=seen,
+                                                   vault_id=vault_id))
+                elif seen is None:
+                    changes.append(VaultChange(VaultChange.ADDED, result.item_id, item, vault_id=vault_id))
+                elif item.version is None or item.version != seen.version:
+                    changes.append(VaultChange(VaultChange.CHANGED, result.item_id, item, seen, vault_id))
+        # reported once the lock is released, so on_error may watch or unwatch items
+        for error in errors:
+            self._report(error)
+        return changes
+
+    def _adapt(self, changed: bool) -> None:
+        """Polls again quickly after a change, and backs off while nothing changes"""
+        self.interval = self.min_interval if changed else min(self.interval * 2, self.max_interval)
+
+    def _report(self, error: Exception) -> None:
+        """Passes an error to on_error; an error raised by on_error itself is kept in last_error"""
+        self.last_error = error
+        if self.on_error is not None:
+            try:
+                self.on_error(error)
+            except Exception as e:
+                self.last_error = e
+
+
+class ItemWatcher(_Watches):
+    """Notifies callbacks when watched items change.
+
+    Every poll lists each vault holding watched items once, however many
+    of its items are watched, and compares the listed versions with the
+    copies seen before. Only the items whose version changed are fetched.
+
+    Polls start `min_interval` seconds apart and the interval doubles, up
+    to `max_interval`, for every poll without changes; a change brings it
+    back to `min_interval`. Each wait is randomized by up to `jitter`
+    times the interval so that watchers started together drift apart.
+
+    Polls run on a background thread between start and stop, or whenever
+    poll is called. Errors, including those raised by callbacks, are passed
+    to `on_error` and kept in `last_error`; items that could not be checked
+    are checked again by the next poll.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        min_interval: float = 5.0,
+        max_interval: float = 60.0,
+        jitter: float = 0.1,
+        concurrency: int = 8,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """Initialize item watcher
+
+        Args:
+            client (Client): The client used to reach 1Password Connect
+            min_interval (float): The shortest time in seconds between two polls
+            max_interval (float): The longest time in seconds between two polls
+            jitter (float): The fraction of the interval by which waits are randomized
+            concurrency (int): The maximum number of changed items fetched at once
+            on_error (Optional[Callable[[Exception], None]]): Called with the errors raised while polling
+
+        Raises:
+            ValueError: Thrown when the intervals or jitter are out of range
+        """
+        super().__init__(min_interval, max_interval, jitter, concurrency, on_error)
+        self.client = client
+        self._callbacks: List[Callable[[VaultChange], None]] = []
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, callback: Callable[[VaultChange], None]) -> None:
+        """Registers a callback called with every change found by a poll"""
+        self._callbacks.append(callback)
+
+    def poll(self) -> List[VaultChange]:
+        """Checks the watched items once and notifies the callbacks of the changes
+
+        Returns:
+            List[VaultChange]: The changes found
+        """
+        changes = []
+        for vault_id in self._vaults():
+            try:
+                summaries = self.client.get_items(vault_id)
+            except Exception as e:
+                self._report(e)
+                continue
+            fetch, removed = self._plan(vault_id, summaries)
+            changes.extend(removed)
+            _forget_cached(self.client, vault_id, fetch)
+            changes.extend(self._update(vault_id, self.client.get_items_by_ids(fetch, vault_id, self.concurrency)))
+
+        self._adapt(bool(changes))
+        for change in changes:
+            for callback in list(self._callbacks):
+                try:
+                    callback(change)
+                except Exception as e:
+                    self._report(e)
+        return changes
+
+    def start(self) -> None:
+        """Starts polling on a background thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="item-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops the background thread, waiting up to timeout seconds for it to finish"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> "ItemWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                self.last_error = e
+            self._stopped.wait(self.next_delay())
+
+
+class AsyncItemWatcher(_Watches):
+    """Yields the changes of watched items from an async iterator.
+
+    Polls the same way as ItemWatcher, through an AsyncClient, listing the
+    vaults concurrently. Iterating over the watcher polls until stop is
+    called; a stopped watcher, including one stopped before iterating,
+    yields nothing more:
+
+        async for change in watcher:
+            ...
+    """
+
+    def __init__(
+        self,
+        client: "AsyncClient",
+        min_interval: float = 5.0,
+        max_interval: float = 60.0,
+        jitter: float = 0.1,
+        concurrency: int = 8,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """Initialize async item watcher
+
+        Args:
+            client (AsyncClient): The client used to reach 1Password Connect
+            min_interval (float): The shortest time in seconds between two polls
+            max_interval (float): The longest time in seconds between two polls
+            jitter (float): The fraction of the interval by which waits are randomized
+            concurrency (int): The maximum number of changed items fetched at once
+            on_error (Optional[Callable[[Exception], None]]): Called with the errors raised while polling
+
+        Raises:
+            ValueError: Thrown when the intervals or jitter are out of range
+        """
+        super().__init__(min_interval, max_interval, jitter, concurrency, on_error)
+        self.client = client
+        self._stopped = False
+        self._wakeup: Optional[asyncio.Event] = None
+
+    async def poll(self) -> List[VaultChange]:
+        """Checks the watched items once
+
+        Returns:
+            List[VaultChange]: The changes found
+        """
+        per_vault = await asyncio.gather(*(self._poll_vault(vault_id) for vault_id in self._vaults()))
+        changes = [change for vault_changes in per_vault for change in vault_changes]
+        self._adapt(bool(changes))
+        return changes
+
+    def stop(self) -> None:
+        """Ends the iteration after the changes already found have been yielded"""
+        self._stopped = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def __aiter__(self) -> AsyncIterator[VaultChange]:
+        return self._changes()
+
+    async def _changes(self) -> AsyncIterator[VaultChange]:
+        self._wakeup = asyncio.Event()
+        while not self._stopped:
+            for change in await self.poll():
+                yield change
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.next_delay())
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll_vault(self, vault_id: str) -> List[VaultChange]:
+        try:
+            summaries = await self.client.get_items(vault_id)
+        except Exception as e:
+            self._report(e)
+            return []
+        fetch, changes = self._plan(vault_id, summaries)
+        _forget_cached(self.client, vault_id, fetch)
+        results = await self.client.get_items_by_ids(fetch, vault_id, self.concurrency)
+        return changes + self._update(vault_id, results)
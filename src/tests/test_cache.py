@@ -0,0 +1,485 @@
+import asyncio
+import threading
+from unittest import mock
+
+import pytest
+from httpx import Response
+
+import onepasswordconnectsdk
+from onepasswordconnectsdk import client
+from onepasswordconnectsdk.cache import NOT_FOUND, ConditionalCache, ItemCache, StaleItemCache, TitleCache
+from onepasswordconnectsdk.config import ClientConfig
+from onepasswordconnectsdk.errors import FailedToRetrieveItemException
+from onepasswordconnectsdk.models import Item
+
+VAULT_ID = "hfnjvi6aymbsnfc2xeeoheizda"
+VAULT_NAME = "VaultA"
+ITEM_ID = "wepiqdxdzncjtnvmv5fegud4qy"
+ITEM_TITLE = "Test Login"
+HOST = "https://mock_host"
+TOKEN = "jwt_token"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_item_cache_hit_and_miss():
+    cache = ItemCache()
+    assert cache.get(VAULT_ID, ITEM_ID) is None
+
+    item = Item(id=ITEM_ID, version=1)
+    cache.set(VAULT_ID, ITEM_ID, item)
+
+    assert cache.get(VAULT_ID, ITEM_ID) is item
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_item_cache_expires_entries():
+    clock = FakeClock()
+    cache = ItemCache(ttl=10, clock=clock)
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID))
+
+    clock.now = 10
+    assert cache.get(VAULT_ID, ITEM_ID) is None
+    assert cache.stats.expirations == 1
+
+
+def test_item_cache_evicts_least_recently_used():
+    cache = ItemCache(maxsize=2)
+    cache.set(VAULT_ID, "a", Item(id="a"))
+    cache.set(VAULT_ID, "b", Item(id="b"))
+    cache.get(VAULT_ID, "a")
+    cache.set(VAULT_ID, "c", Item(id="c"))
+
+    assert cache.get(VAULT_ID, "b") is None
+    assert cache.get(VAULT_ID, "a") is not None
+    assert cache.stats.evictions == 1
+
+
+def test_item_cache_keeps_newer_version():
+    cache = ItemCache()
+    newer = Item(id=ITEM_ID, version=3)
+    cache.set(VAULT_ID, ITEM_ID, newer)
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID, version=2))
+
+    assert cache.get(VAULT_ID, ITEM_ID) is newer
+
+
+def test_item_cache_rejects_invalid_bounds():
+    with pytest.raises(ValueError):
+        ItemCache(maxsize=0)
+    with pytest.raises(ValueError):
+        ItemCache(ttl=0)
+
+
+def test_get_item_by_id_uses_cache(respx_mock):
+    cache = ItemCache()
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(item_cache=cache))
+    mock = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        return_value=Response(200, json=get_item()))
+
+    first = ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+    second = ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+
+    assert first is second
+    assert mock.call_count == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_get_item_by_id_uses_cache_async(respx_mock):
+    cache = ItemCache()
+    ss_client = client.new_client(HOST, TOKEN, True, config=ClientConfig(item_cache=cache))
+    mock = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        return_value=Response(200, json=get_item()))
+
+    first = await ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+    second = await ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+
+    assert first is second
+    assert mock.call_count == 1
+
+
+def test_delete_item_invalidates_cache(respx_mock):
+    cache = ItemCache()
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(item_cache=cache))
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID))
+    respx_mock.delete(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(return_value=Response(204))
+
+    ss_client.delete_item(ITEM_ID, VAULT_ID)
+
+    assert cache.get(VAULT_ID, ITEM_ID) is None
+
+
+def test_update_item_refreshes_cache(respx_mock):
+    cache = ItemCache()
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(item_cache=cache))
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID, version=1))
+    updated = get_item()
+    updated["version"] = 2
+    respx_mock.put(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(return_value=Response(200, json=updated))
+
+    ss_client.update_item(ITEM_ID, VAULT_ID, Item(title="Test Login"))
+
+    assert cache.get(VAULT_ID, ITEM_ID).version == 2
+
+
+def test_stale_item_cache_requests_one_refresh():
+    clock = FakeClock()
+    cache = StaleItemCache(soft_ttl=10, ttl=60, clock=clock)
+    item = Item(id=ITEM_ID, version=1)
+    cache.set(VAULT_ID, ITEM_ID, item)
+
+    assert cache.lookup(VAULT_ID, ITEM_ID) == (item, False)
+    clock.now = 15
+    assert cache.lookup(VAULT_ID, ITEM_ID) == (item, True)
+    assert cache.lookup(VAULT_ID, ITEM_ID) == (item, False)
+
+    cache.finish_refresh(VAULT_ID, ITEM_ID, error=Exception("down"))
+    assert cache.lookup(VAULT_ID, ITEM_ID) == (item, True)
+    assert cache.stats.stale_hits == 3
+    assert cache.stats.refreshes == 2
+    assert cache.stats.refresh_failures == 1
+    assert cache.stats.max_staleness == 5
+    assert cache.age(VAULT_ID, ITEM_ID) == 15
+
+
+def test_stale_item_cache_drops_items_past_ttl():
+    clock = FakeClock()
+    cache = StaleItemCache(soft_ttl=10, ttl=60, clock=clock)
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID))
+
+    clock.now = 60
+    assert cache.lookup(VAULT_ID, ITEM_ID) == (None, False)
+    assert cache.stats.expirations == 1
+
+
+def test_stale_item_cache_rejects_invalid_ttls():
+    with pytest.raises(ValueError):
+        StaleItemCache(soft_ttl=0)
+    with pytest.raises(ValueError):
+        StaleItemCache(soft_ttl=120, ttl=60)
+
+
+def test_get_item_by_id_refreshes_stale_item_in_background(respx_mock):
+    clock = FakeClock()
+    cache = StaleItemCache(soft_ttl=10, ttl=60, clock=clock)
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(item_cache=cache))
+    updated = get_item()
+    updated["version"] = 2
+    mock = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        side_effect=[Response(200, json=get_item()), Response(200, json=updated)])
+
+    ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+    clock.now = 20
+    stale = ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+    assert stale.version == 1
+
+    for thread in threading.enumerate():
+        if thread.name == f"refresh-item-{ITEM_ID}":
+            thread.join(5)
+
+    assert mock.call_count == 2
+    assert ss_client.get_item_by_id(ITEM_ID, VAULT_ID).version == 2
+    assert cache.age(VAULT_ID, ITEM_ID) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_item_by_id_refreshes_stale_item_in_background_async(respx_mock):
+    clock = FakeClock()
+    cache = StaleItemCache(soft_ttl=10, ttl=60, clock=clock)
+    ss_client = client.new_client(HOST, TOKEN, True, config=ClientConfig(item_cache=cache))
+    updated = get_item()
+    updated["version"] = 2
+    mock = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        side_effect=[Response(200, json=get_item()), Response(200, json=updated)])
+
+    await ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+    clock.now = 20
+    stale = await ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+    assert stale.version == 1
+
+    await asyncio.gather(*ss_client._refresh_tasks)
+
+    assert mock.call_count == 2
+    assert (await ss_client.get_item_by_id(ITEM_ID, VAULT_ID)).version == 2
+
+
+def test_load_dict_serves_stale_titles_without_blocking(respx_mock):
+    clock = FakeClock()
+    cache = StaleItemCache(soft_ttl=10, ttl=60, clock=clock)
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(item_cache=cache))
+    callers = []
+
+    def respond(json):
+        def side_effect(request):
+            callers.append(threading.current_thread().name)
+            return Response(200, json=json)
+        return side_effect
+
+    respx_mock.get(f'/v1/vaults?filter=name eq "{VAULT_NAME}"').mock(
+        side_effect=respond([{"id": VAULT_ID, "name": VAULT_NAME}]))
+    respx_mock.get(f'/v1/vaults/{VAULT_ID}/items?filter=title eq "{ITEM_TITLE}"').mock(
+        side_effect=respond([get_item()]))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(side_effect=respond(get_item()))
+    config = {"username": {"opitem": ITEM_TITLE, "opfield": ".username", "opvault": VAULT_NAME}}
+
+    onepasswordconnectsdk.load_dict(ss_client, config)
+    assert len(callers) == 3
+    clock.now = 20
+    for _ in range(3):
+        assert onepasswordconnectsdk.load_dict(ss_client, config) == {"username": "new_user"}
+    for thread in threading.enumerate():
+        if thread.name == f"refresh-item-{ITEM_ID}":
+            thread.join(5)
+
+    assert callers[3:] == [f"refresh-item-{ITEM_ID}"]
+
+
+@pytest.mark.asyncio
+async def test_aload_dict_serves_stale_titles_without_blocking(respx_mock):
+    clock = FakeClock()
+    cache = StaleItemCache(soft_ttl=10, ttl=60, clock=clock)
+    ss_client = client.new_client(HOST, TOKEN, True, config=ClientConfig(item_cache=cache))
+    list_mock = respx_mock.get(f'/v1/vaults/{VAULT_ID}/items?filter=title eq "{ITEM_TITLE}"').mock(
+        return_value=Response(200, json=[get_item()]))
+    item_mock = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        return_value=Response(200, json=get_item()))
+    config = {"username": {"opitem": ITEM_TITLE, "opfield": ".username", "opvault": VAULT_ID}}
+
+    await onepasswordconnectsdk.aload_dict(ss_client, config)
+    clock.now = 20
+    for _ in range(3):
+        assert await onepasswordconnectsdk.aload_dict(ss_client, config) == {"username": "new_user"}
+    await asyncio.gather(*ss_client._refresh_tasks)
+
+    assert list_mock.call_count == 1
+    assert item_mock.call_count == 2
+
+
+def test_get_item_by_title_forgets_renamed_stale_item(respx_mock):
+    cache = StaleItemCache()
+    cache.set_item_id(VAULT_ID, "Old Title", ITEM_ID)
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(item_cache=cache))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        return_value=Response(200, json=get_item()))
+    respx_mock.get(f'/v1/vaults/{VAULT_ID}/items?filter=title eq "Old Title"').mock(
+        return_value=Response(200, json=[]))
+
+    with pytest.raises(FailedToRetrieveItemException):
+        ss_client.get_item_by_title("Old Title", VAULT_ID)
+
+    assert cache.get_item_id(VAULT_ID, "Old Title") is None
+
+
+def test_title_cache_remembers_missing_titles():
+    clock = FakeClock()
+    cache = TitleCache(ttl=100, negative_ttl=5, clock=clock)
+    assert cache.get_item_id(VAULT_ID, ITEM_TITLE) is None
+
+    cache.set_item_id(VAULT_ID, ITEM_TITLE, None)
+    assert cache.get_item_id(VAULT_ID, ITEM_TITLE) is NOT_FOUND
+
+    clock.now = 5
+    assert cache.get_item_id(VAULT_ID, ITEM_TITLE) is None
+
+
+def test_get_item_by_titles_resolves_once(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(title_cache=TitleCache()))
+    vaults_mock = respx_mock.get(f'/v1/vaults?filter=name eq "{VAULT_NAME}"').mock(
+        return_value=Response(200, json=[{"id": VAULT_ID, "name": VAULT_NAME}]))
+    items_mock = respx_mock.get(f'/v1/vaults/{VAULT_ID}/items?filter=title eq "{ITEM_TITLE}"').mock(
+        return_value=Response(200, json=[get_item()]))
+    item_mock = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        return_value=Response(200, json=get_item()))
+
+    ss_client.get_item(ITEM_TITLE, VAULT_NAME)
+    item = ss_client.get_item(ITEM_TITLE, VAULT_NAME)
+
+    assert item.id == ITEM_ID
+    assert vaults_mock.call_count == 1
+    assert items_mock.call_count == 1
+    assert item_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_item_by_titles_resolves_once_async(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, True, config=ClientConfig(title_cache=TitleCache()))
+    vaults_mock = respx_mock.get(f'/v1/vaults?filter=name eq "{VAULT_NAME}"').mock(
+        return_value=Response(200, json=[{"id": VAULT_ID, "name": VAULT_NAME}]))
+    items_mock = respx_mock.get(f'/v1/vaults/{VAULT_ID}/items?filter=title eq "{ITEM_TITLE}"').mock(
+        return_value=Response(200, json=[get_item()]))
+    item_mock = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        return_value=Response(200, json=get_item()))
+
+    await ss_client.get_item(ITEM_TITLE, VAULT_NAME)
+    item = await ss_client.get_item(ITEM_TITLE, VAULT_NAME)
+
+    assert item.id == ITEM_ID
+    assert vaults_mock.call_count == 1
+    assert items_mock.call_count == 1
+    assert item_mock.call_count == 2
+
+
+def test_get_item_by_title_caches_missing_item(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(title_cache=TitleCache()))
+    items_mock = respx_mock.get(f'/v1/vaults/{VAULT_ID}/items?filter=title eq "{ITEM_TITLE}"').mock(
+        return_value=Response(200, json=[]))
+
+    for _ in range(2):
+        with pytest.raises(FailedToRetrieveItemException):
+            ss_client.get_item_by_title(ITEM_TITLE, VAULT_ID)
+
+    assert items_mock.call_count == 1
+
+
+def test_get_item_by_title_refreshes_renamed_item(respx_mock):
+    title_cache = TitleCache()
+    title_cache.set_item_id(VAULT_ID, "Old Title", ITEM_ID)
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(title_cache=title_cache))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        return_value=Response(200, json=get_item()))
+    respx_mock.get(f'/v1/vaults/{VAULT_ID}/items?filter=title eq "Old Title"').mock(
+        return_value=Response(200, json=[]))
+
+    with pytest.raises(FailedToRetrieveItemException):
+        ss_client.get_item_by_title("Old Title", VAULT_ID)
+
+    assert title_cache.get_item_id(VAULT_ID, "Old Title") is NOT_FOUND
+
+
+def test_get_item_resolves_recreated_vault_again(respx_mock):
+    new_vault_id = "newvaultid0000000000000000"
+    title_cache = TitleCache()
+    title_cache.set_vault_id(VAULT_NAME, VAULT_ID)
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(title_cache=title_cache))
+    respx_mock.get(f'/v1/vaults/{VAULT_ID}/items?filter=title eq "{ITEM_TITLE}"').mock(
+        return_value=Response(404, json={"status": 404, "message": "vault not found"}))
+    vaults_mock = respx_mock.get(f'/v1/vaults?filter=name eq "{VAULT_NAME}"').mock(
+        return_value=Response(200, json=[{"id": new_vault_id, "name": VAULT_NAME}]))
+    respx_mock.get(f'/v1/vaults/{new_vault_id}/items?filter=title eq "{ITEM_TITLE}"').mock(
+        return_value=Response(200, json=[get_item()]))
+    respx_mock.get(f"/v1/vaults/{new_vault_id}/items/{ITEM_ID}").mock(return_value=Response(200, json=get_item()))
+
+    item = ss_client.get_item(ITEM_TITLE, VAULT_NAME)
+
+    assert item.id == ITEM_ID
+    assert vaults_mock.call_count == 1
+    assert title_cache.get_vault_id(VAULT_NAME) == new_vault_id
+
+
+@pytest.mark.asyncio
+async def test_get_item_does_not_retry_missing_item_in_same_vault_async(respx_mock):
+    title_cache = TitleCache()
+    title_cache.set_vault_id(VAULT_NAME, VAULT_ID)
+    ss_client = client.new_client(HOST, TOKEN, True, config=ClientConfig(title_cache=title_cache))
+    items_mock = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        return_value=Response(404, json={"status": 404, "message": "item not found"}))
+    respx_mock.get(f'/v1/vaults/{VAULT_ID}/items?filter=title eq "{ITEM_ID}"').mock(
+        return_value=Response(404, json={"status": 404, "message": "item not found"}))
+    vaults_mock = respx_mock.get(f'/v1/vaults?filter=name eq "{VAULT_NAME}"').mock(
+        return_value=Response(200, json=[{"id": VAULT_ID, "name": VAULT_NAME}]))
+
+    with pytest.raises(FailedToRetrieveItemException):
+        await ss_client.get_item(ITEM_ID, VAULT_NAME)
+
+    assert vaults_mock.call_count == 1
+    assert items_mock.call_count == 1
+
+
+def test_conditional_cache_reuses_not_modified_response(respx_mock):
+    cache = ConditionalCache()
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(conditional_cache=cache))
+    route = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}")
+    route.side_effect = [
+        Response(200, json=get_item(), headers={"ETag": '"v1"'}),
+        Response(304),
+    ]
+
+    first = ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+    second = ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+
+    assert first is second
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_conditional_cache_skips_decoding_identical_body(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(conditional_cache=ConditionalCache()))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(return_value=Response(200, json=get_item()))
+
+    first = ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+    with mock.patch.object(ss_client.serializer, "decode") as decode:
+        second = ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+
+    assert first is second
+    decode.assert_not_called()
+
+
+def test_conditional_cache_parses_changed_body(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(conditional_cache=ConditionalCache()))
+    updated = get_item()
+    updated["version"] = 2
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        side_effect=[Response(200, json=get_item()), Response(200, json=updated)])
+
+    first = ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+    second = ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+
+    assert first.version == 1
+    assert second.version == 2
+
+
+def test_conditional_cache_invalidated_by_delete(respx_mock):
+    cache = ConditionalCache()
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(conditional_cache=cache))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(return_value=Response(200, json=get_item()))
+    respx_mock.delete(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(return_value=Response(204))
+
+    ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+    ss_client.delete_item(ITEM_ID, VAULT_ID)
+
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_conditional_cache_reuses_not_modified_response_async(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, True, config=ClientConfig(conditional_cache=ConditionalCache()))
+    route = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}")
+    route.side_effect = [
+        Response(200, json=get_item(), headers={"ETag": '"v1"'}),
+        Response(304),
+    ]
+
+    first = await ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+    second = await ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+
+    assert first is second
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+
+def get_item():
+    return {
+        "id": ITEM_ID,
+        "title": "Test Login",
+        "version": 1,
+        "vault": {
+            "id": VAULT_ID
+        },
+        "category": "LOGIN",
+        "fields": [
+            {
+                "id": "username",
+                "label": "username",
+                "value": "new_user"
+            }
+        ]
+    }
@@ -1,5 +1,9 @@
+import sys
+
 import pytest
+from onepasswordconnectsdk import client
 from onepasswordconnectsdk.config import ClientConfig
+from onepasswordconnectsdk.errors import InvalidClientConfigException
 import httpx
 
 def test_client_config_with_ca_file():
@@ -42,3 +46,74 @@ def test_client_config_no_ca_file():
     assert args["base_url"] == "https://test.com"
     assert args["headers"] == {"Authorization": "Bearer token"}
     assert args["timeout"] == 30.0
+
+def test_client_config_pool_options():
+    config = ClientConfig(max_connections=50, max_keepalive_connections=10, keepalive_expiry=30.0)
+    args = config.get_client_args("https://test.com", {}, 30.0)
+
+    assert args["limits"] == httpx.Limits(max_connections=50, max_keepalive_connections=10, keepalive_expiry=30.0)
+    assert "http2" not in args
+
+def test_client_config_pool_options_keep_httpx_defaults():
+    args = ClientConfig(max_connections=50).get_client_args("https://test.com", {}, 30.0)
+
+    assert args["limits"] == httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=5.0)
+
+def test_client_config_phase_timeouts():
+    config = ClientConfig(connect_timeout=2.0, pool_timeout=1.0)
+    args = config.get_client_args("https://test.com", {}, 30.0)
+
+    assert args["timeout"] == httpx.Timeout(30.0, connect=2.0, pool=1.0)
+
+def test_client_config_phase_timeouts_override_httpx_timeout_option():
+    config = ClientConfig(timeout=60.0, read_timeout=120.0)
+    args = config.get_client_args("https://test.com", {}, 30.0)
+
+    assert args["timeout"] == httpx.Timeout(60.0, read=120.0)
+
+def test_client_config_from_environment(monkeypatch):
+    monkeypatch.setenv("OP_CONNECT_CLIENT_MAX_CONNECTIONS", "8")
+    monkeypatch.setenv("OP_CONNECT_CLIENT_KEEPALIVE_EXPIRY", "60")
+    monkeypatch.setenv("OP_CONNECT_CLIENT_CONNECT_TIMEOUT", "2.5")
+    monkeypatch.setenv("OP_CONNECT_CLIENT_HTTP2", "false")
+    args = ClientConfig(max_connections=4).get_client_args("https://test.com", {}, 30.0)
+
+    # explicit options take precedence over the environment
+    assert args["limits"] == httpx.Limits(max_connections=4, max_keepalive_connections=20, keepalive_expiry=60.0)
+    assert args["timeout"] == httpx.Timeout(30.0, connect=2.5)
+    assert args["http2"] is False
+
+@pytest.mark.parametrize("option", [
+    {"max_connections": 0},
+    {"max_connections": 2.5},
+    {"max_keepalive_connections": -1},
+    {"keepalive_expiry": -1.0},
+    {"read_timeout": 0},
+    {"connect_timeout": "5"},
+])
+def test_client_config_invalid_options(option):
+    with pytest.raises(InvalidClientConfigException):
+        ClientConfig(**option)
+
+@pytest.mark.parametrize("variable, value", [
+    ("OP_CONNECT_CLIENT_MAX_CONNECTIONS", "many"),
+    ("OP_CONNECT_CLIENT_MAX_CONNECTIONS", "0"),
+    ("OP_CONNECT_CLIENT_READ_TIMEOUT", "-1"),
+    ("OP_CONNECT_CLIENT_HTTP2", "maybe"),
+])
+def test_client_config_invalid_environment(monkeypatch, variable, value):
+    monkeypatch.setenv(variable, value)
+    with pytest.raises(InvalidClientConfigException) as exc_info:
+        ClientConfig().get_client_args("https://test.com", {}, 30.0)
+    assert variable in str(exc_info.value)
+
+def test_client_config_http2_requires_h2(monkeypatch):
+    monkeypatch.setitem(sys.modules, "h2", None)
+    with pytest.raises(InvalidClientConfigException):
+        ClientConfig(http2=True)
+
+def test_client_uses_environment_without_config(monkeypatch):
+    monkeypatch.setenv("OP_CONNECT_CLIENT_CONNECT_TIMEOUT", "1.5")
+    ss_client = client.new_client("https://test.com", "token")
+
+    assert ss_client.session.timeout.connect == 1.5
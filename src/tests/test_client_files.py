@@ -0,0 +1,166 @@
+import asyncio
+import os
+import threading
+from unittest import mock
+
+import pytest
+from httpx import Response
+
+from onepasswordconnectsdk import client
+from onepasswordconnectsdk.errors import FailedToRetrieveItemException
+
+VAULT_ID = "hfnjvi6aymbsnfc2xeeoheizda"
+ITEM_ID = "wepiqdxdzncjtnvmv5fegud4qy"
+FILE_ID = "fileqdxdzncjtnvmv5fegud4qy"
+HOST = "https://mock_host"
+TOKEN = "jwt_token"
+SS_CLIENT = client.new_client(HOST, TOKEN)
+SS_CLIENT_ASYNC = client.new_client(HOST, TOKEN, True)
+CONTENT_PATH = f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files/{FILE_ID}/content"
+CONTENT = os.urandom(256 * 1024)
+
+
+def test_download_file(respx_mock, tmp_path):
+    file_mock = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files/{FILE_ID}").mock(
+        return_value=Response(200, json=get_file()))
+    content_mock = respx_mock.get(CONTENT_PATH).mock(return_value=Response(200, content=CONTENT))
+
+    SS_CLIENT.download_file(FILE_ID, ITEM_ID, VAULT_ID, str(tmp_path))
+
+    assert (tmp_path / "cert.pem").read_bytes() == CONTENT
+    assert os.listdir(tmp_path) == ["cert.pem"]
+    assert file_mock.called
+    assert content_mock.called
+
+
+@pytest.mark.asyncio
+async def test_download_file_async(respx_mock, tmp_path):
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files/{FILE_ID}").mock(
+        return_value=Response(200, json=get_file()))
+    respx_mock.get(CONTENT_PATH).mock(return_value=Response(200, content=CONTENT))
+
+    await SS_CLIENT_ASYNC.download_file(FILE_ID, ITEM_ID, VAULT_ID, str(tmp_path))
+
+    assert (tmp_path / "cert.pem").read_bytes() == CONTENT
+    assert os.listdir(tmp_path) == ["cert.pem"]
+
+
+@pytest.mark.asyncio
+async def test_download_file_writes_off_the_event_loop_async(respx_mock, tmp_path):
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files/{FILE_ID}").mock(
+        return_value=Response(200, json=get_file()))
+    respx_mock.get(CONTENT_PATH).mock(return_value=Response(200, content=CONTENT))
+    replaced_on = []
+    replace = os.replace
+
+    def spy(*args):
+        replaced_on.append(threading.current_thread())
+        replace(*args)
+
+    with mock.patch("onepasswordconnectsdk.utils.os.replace", spy):
+        await SS_CLIENT_ASYNC.download_file(FILE_ID, ITEM_ID, VAULT_ID, str(tmp_path))
+
+    assert replaced_on and replaced_on[0] is not threading.main_thread()
+    assert (tmp_path / "cert.pem").read_bytes() == CONTENT
+
+
+def test_download_file_error_keeps_existing_file(respx_mock, tmp_path):
+    (tmp_path / "cert.pem").write_bytes(b"previous")
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files/{FILE_ID}").mock(
+        return_value=Response(200, json=get_file()))
+    respx_mock.get(CONTENT_PATH).mock(return_value=Response(500, json={"status": 500, "message": "failed"}))
+
+    with pytest.raises(FailedToRetrieveItemException) as exc_info:
+        SS_CLIENT.download_file(FILE_ID, ITEM_ID, VAULT_ID, str(tmp_path))
+
+    assert exc_info.value.status_code == 500
+    assert (tmp_path / "cert.pem").read_bytes() == b"previous"
+    assert os.listdir(tmp_path) == ["cert.pem"]
+
+
+def test_download_files(respx_mock, tmp_path):
+    files_mock = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files").mock(
+        return_value=Response(200, json=get_files()))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files/file1/content").mock(
+        return_value=Response(200, content=CONTENT))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files/file2/content").mock(
+        return_value=Response(404, json={"status": 404, "message": "file not found"}))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files/file3/content").mock(
+        return_value=Response(200, content=b"key"))
+
+    results = SS_CLIENT.download_files(ITEM_ID, VAULT_ID, str(tmp_path), concurrency=3)
+
+    assert files_mock.call_count == 1
+    assert [result.file.id for result in results] == ["file1", "file2", "file3"]
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[0].bytes_written == len(CONTENT)
+    assert results[0].path == str(tmp_path / "cert.pem")
+    assert results[0].elapsed >= 0
+    assert isinstance(results[1].error, FailedToRetrieveItemException)
+    assert results[1].error.status_code == 404
+    assert sorted(os.listdir(tmp_path)) == ["cert.pem", "key.pem"]
+    assert (tmp_path / "key.pem").read_bytes() == b"key"
+
+
+@pytest.mark.asyncio
+async def test_download_files_async(respx_mock, tmp_path):
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files").mock(
+        return_value=Response(200, json=get_files()))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files/file1/content").mock(
+        return_value=Response(200, content=CONTENT))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files/file2/content").mock(
+        return_value=Response(404, json={"status": 404, "message": "file not found"}))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files/file3/content").mock(
+        return_value=Response(200, content=b"key"))
+
+    results = await SS_CLIENT_ASYNC.download_files(ITEM_ID, VAULT_ID, str(tmp_path), concurrency=2)
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert [result.bytes_written for result in results] == [len(CONTENT), 0, 3]
+    assert isinstance(results[1].error, FailedToRetrieveItemException)
+    assert sorted(os.listdir(tmp_path)) == ["cert.pem", "key.pem"]
+
+
+def test_download_files_gives_files_with_same_name_distinct_paths(respx_mock, tmp_path):
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files").mock(return_value=Response(200, json=[
+        get_file("file1", "cert.pem"), get_file("file2", "cert.pem"), get_file("file3", None), get_file("file4", None)]))
+    for file_id in ("file1", "file2", "file3", "file4"):
+        respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files/{file_id}/content").mock(
+            return_value=Response(200, content=file_id.encode()))
+
+    results = SS_CLIENT.download_files(ITEM_ID, VAULT_ID, str(tmp_path))
+
+    assert all(result.ok for result in results)
+    assert sorted(os.listdir(tmp_path)) == [
+        "1password_item_file-file3.txt", "1password_item_file-file4.txt", "cert-file1.pem", "cert-file2.pem"]
+    assert (tmp_path / "cert-file2.pem").read_bytes() == b"file2"
+
+
+@pytest.mark.asyncio
+async def test_download_files_reports_cancelled_download_async(respx_mock, tmp_path):
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files").mock(
+        return_value=Response(200, json=[get_file("file1", "cert.pem")]))
+    ss_client = client.new_client(HOST, TOKEN, True)
+
+    async def cancelled(*args):
+        raise asyncio.CancelledError()
+
+    with mock.patch.object(ss_client, "_download", cancelled):
+        results = await ss_client.download_files(ITEM_ID, VAULT_ID, str(tmp_path))
+
+    assert not results[0].ok
+    assert isinstance(results[0].error, asyncio.CancelledError)
+    assert results[0].path == str(tmp_path / "cert.pem")
+
+
+def get_files():
+    return [get_file("file1", "cert.pem"), get_file("file2", "missing.pem"), get_file("file3", "key.pem")]
+
+
+def get_file(file_id=FILE_ID, name="cert.pem"):
+    return {
+        "id": file_id,
+        "name": name,
+        "size": len(CONTENT),
+        "content_path": f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files/{file_id}/content",
+    }
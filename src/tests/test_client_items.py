@@ -1,3 +1,4 @@
+import asyncio
 import os
 import pytest
 from unittest import mock
@@ -5,6 +6,7 @@ from unittest import mock
 from httpx import Response
 from httpx._client import DEFAULT_TIMEOUT_CONFIG
 from onepasswordconnectsdk import client, models
+from onepasswordconnectsdk.errors import FailedToRetrieveItemException
 from onepasswordconnectsdk.utils import ENV_CLIENT_REQUEST_TIMEOUT
 
 VAULT_ID = "hfnjvi6aymbsnfc2xeeoheizda"
@@ -71,6 +73,77 @@ async def test_get_item_by_title_async(respx_mock):
     assert item_mock.called
 
 
+def test_get_item_by_title_decodes_each_response_once(respx_mock):
+    expected_path_item_title = f"/v1/vaults/{VAULT_ID}/items?filter=title eq \"{ITEM_TITLE}\""
+    expected_path_item = f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}"
+    respx_mock.get(expected_path_item_title).mock(return_value=Response(200, json=get_items()))
+    respx_mock.get(expected_path_item).mock(return_value=Response(200, json=get_item()))
+
+    with mock.patch.object(SS_CLIENT.serializer, "decode", wraps=SS_CLIENT.serializer.decode) as decode:
+        SS_CLIENT.get_item_by_title(ITEM_TITLE, VAULT_ID)
+
+    assert decode.call_count == 2
+
+
+def test_get_item_by_id_non_json_error(respx_mock):
+    expected_path = f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}"
+    respx_mock.get(expected_path).mock(return_value=Response(502, text="<html>Bad Gateway</html>"))
+
+    with pytest.raises(FailedToRetrieveItemException) as exc_info:
+        SS_CLIENT.get_item_by_id(ITEM_ID, VAULT_ID)
+
+    assert exc_info.value.status_code == 502
+
+
+def test_get_items_by_ids(respx_mock):
+    other_id = "otheritemid000000000000000"
+    missing_id = "missingitemid0000000000000"
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(return_value=Response(200, json=get_item()))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{missing_id}").mock(
+        return_value=Response(404, json={"status": 404, "message": "item not found"}))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{other_id}").mock(
+        return_value=Response(200, json={**get_item(), "id": other_id}))
+
+    results = SS_CLIENT.get_items_by_ids([ITEM_ID, missing_id, other_id], VAULT_ID, concurrency=2)
+
+    assert [result.item_id for result in results] == [ITEM_ID, missing_id, other_id]
+    assert [result.ok for result in results] == [True, False, True]
+    compare_items(get_item(), results[0].item)
+    assert results[2].item.id == other_id
+    assert results[1].item is None
+    assert isinstance(results[1].error, FailedToRetrieveItemException)
+    assert results[1].error.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_items_by_ids_async(respx_mock):
+    missing_id = "missingitemid0000000000000"
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(return_value=Response(200, json=get_item()))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{missing_id}").mock(
+        return_value=Response(404, json={"status": 404, "message": "item not found"}))
+
+    results = await SS_CLIENT_ASYNC.get_items_by_ids([missing_id, ITEM_ID], VAULT_ID, concurrency=2)
+
+    assert [result.ok for result in results] == [False, True]
+    assert isinstance(results[0].error, FailedToRetrieveItemException)
+    compare_items(get_item(), results[1].item)
+
+
+@pytest.mark.asyncio
+async def test_get_items_by_ids_reports_cancelled_fetch_async(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, True)
+
+    async def cancelled(*args):
+        raise asyncio.CancelledError()
+
+    with mock.patch.object(ss_client, "get_item_by_id", cancelled):
+        results = await ss_client.get_items_by_ids([ITEM_ID], VAULT_ID)
+
+    assert not results[0].ok
+    assert results[0].item is None
+    assert isinstance(results[0].error, asyncio.CancelledError)
+
+
 def test_get_item_by_item_id_vault_id(respx_mock):
     expected_item = get_item()
     expected_path = f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}"
@@ -272,6 +345,44 @@ async def test_get_items_async(respx_mock):
     assert mock.called
 
 
+def test_iter_items(respx_mock):
+    expected_items = get_items() + get_items_with_title("Other Login")
+    expected_path = f"/v1/vaults/{VAULT_ID}/items"
+
+    mock = respx_mock.get(expected_path).mock(return_value=Response(200, json=expected_items))
+
+    items = list(SS_CLIENT.iter_items(VAULT_ID))
+    assert len(expected_items) == len(items)
+    compare_summary_items(expected_items[0], items[0])
+    compare_summary_items(expected_items[1], items[1])
+    assert mock.called
+
+
+@pytest.mark.asyncio
+async def test_aiter_items(respx_mock):
+    expected_items = get_items() + get_items_with_title("Other Login")
+    expected_path = f"/v1/vaults/{VAULT_ID}/items"
+
+    mock = respx_mock.get(expected_path).mock(return_value=Response(200, json=expected_items))
+
+    items = [item async for item in SS_CLIENT_ASYNC.aiter_items(VAULT_ID)]
+    assert len(expected_items) == len(items)
+    compare_summary_items(expected_items[0], items[0])
+    compare_summary_items(expected_items[1], items[1])
+    assert mock.called
+
+
+def test_iter_items_error(respx_mock):
+    expected_path = f"/v1/vaults/{VAULT_ID}/items"
+    respx_mock.get(expected_path).mock(return_value=Response(404, json={"status": 404, "message": "vault not found"}))
+
+    with pytest.raises(FailedToRetrieveItemException) as exc_info:
+        list(SS_CLIENT.iter_items(VAULT_ID))
+
+    assert exc_info.value.status_code == 404
+    assert "vault not found" in str(exc_info.value)
+
+
 def test_delete_item(respx_mock):
     expected_items = get_items()
     expected_path = f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}"
@@ -332,6 +443,100 @@ async def test_update_item_async(respx_mock):
     compare_full_items(item, updated_item)
 
 
+def test_create_items(respx_mock):
+    item = generate_full_item()
+    mock = respx_mock.post(f"/v1/vaults/{item.vault.id}/items").mock(return_value=Response(201, json=item.to_dict()))
+
+    report = SS_CLIENT.create_items(item.vault.id, [generate_full_item(), generate_full_item()], concurrency=2)
+
+    assert mock.call_count == 2
+    assert report.ok
+    assert [result.item_id for result in report.results] == [item.id, item.id]
+    compare_full_items(item, report.results[0].item)
+
+
+def test_update_items_reports_failures(respx_mock):
+    failing = generate_full_item()
+    failing.id = "failingitemid0000000000000"
+    item = generate_full_item()
+    respx_mock.put(f"/v1/vaults/{VAULT_ID}/items/{failing.id}").mock(
+        return_value=Response(400, json={"status": 400, "message": "invalid item"}))
+    respx_mock.put(f"/v1/vaults/{VAULT_ID}/items/{item.id}").mock(return_value=Response(200, json=item.to_dict()))
+
+    report = SS_CLIENT.update_items([failing, item], VAULT_ID)
+
+    assert not report.ok
+    assert [result.item_id for result in report.failed] == [failing.id]
+    assert report.failed[0].error.status_code == 400
+    assert [result.item_id for result in report.succeeded] == [item.id]
+    assert report.skipped == []
+
+
+def test_delete_items_stop_on_error(respx_mock):
+    item_ids = ["item" + str(i).zfill(22) for i in range(4)]
+    first_mock = respx_mock.delete(f"/v1/vaults/{VAULT_ID}/items/{item_ids[0]}").mock(return_value=Response(204))
+    respx_mock.delete(f"/v1/vaults/{VAULT_ID}/items/{item_ids[1]}").mock(
+        return_value=Response(403, json={"status": 403, "message": "forbidden"}))
+    rest_mock = respx_mock.delete(url__regex=rf"/v1/vaults/{VAULT_ID}/items/item0+[23]$").mock(
+        return_value=Response(204))
+
+    report = SS_CLIENT.delete_items(item_ids, VAULT_ID, concurrency=1, stop_on_error=True)
+
+    assert first_mock.called
+    assert not rest_mock.called
+    assert [result.ok for result in report.results] == [True, False, False, False]
+    assert [result.item_id for result in report.skipped] == item_ids[2:]
+    assert isinstance(report.failed[0].error, FailedToRetrieveItemException)
+
+
+@pytest.mark.asyncio
+async def test_delete_items_stop_on_error_async(respx_mock):
+    item_ids = ["item" + str(i).zfill(22) for i in range(3)]
+    respx_mock.delete(f"/v1/vaults/{VAULT_ID}/items/{item_ids[0]}").mock(
+        return_value=Response(403, json={"status": 403, "message": "forbidden"}))
+    rest_mock = respx_mock.delete(url__regex=rf"/v1/vaults/{VAULT_ID}/items/item0+[12]$").mock(
+        return_value=Response(204))
+
+    report = await SS_CLIENT_ASYNC.delete_items(item_ids, VAULT_ID, concurrency=1, stop_on_error=True)
+
+    assert not rest_mock.called
+    assert [result.item_id for result in report.failed] == item_ids[:1]
+    assert [result.item_id for result in report.skipped] == item_ids[1:]
+
+
+@pytest.mark.asyncio
+async def test_delete_items_reports_cancelled_operation_async(respx_mock):
+    item_ids = ["item" + str(i).zfill(22) for i in range(2)]
+    respx_mock.delete(f"/v1/vaults/{VAULT_ID}/items/{item_ids[1]}").mock(return_value=Response(204))
+    ss_client = client.new_client(HOST, TOKEN, True)
+    delete_item = ss_client.delete_item
+
+    async def cancel_first(item_id, vault_id):
+        if item_id == item_ids[0]:
+            raise asyncio.CancelledError()
+        await delete_item(item_id, vault_id)
+
+    with mock.patch.object(ss_client, "delete_item", cancel_first):
+        report = await ss_client.delete_items(item_ids, VAULT_ID)
+
+    assert not report.ok
+    assert [result.item_id for result in report.failed] == item_ids[:1]
+    assert isinstance(report.failed[0].error, asyncio.CancelledError)
+    assert [result.item_id for result in report.succeeded] == item_ids[1:]
+
+
+@pytest.mark.asyncio
+async def test_create_items_async(respx_mock):
+    item = generate_full_item()
+    mock = respx_mock.post(f"/v1/vaults/{item.vault.id}/items").mock(return_value=Response(201, json=item.to_dict()))
+
+    report = await SS_CLIENT_ASYNC.create_items(item.vault.id, [generate_full_item()])
+
+    assert mock.called
+    assert report.ok
+    compare_full_items(item, report.results[0].item)
+
+
 def compare_full_items(expected_item, returned_item):
     assert expected_item.id == returned_item.id
     assert expected_item.title == returned_item.title
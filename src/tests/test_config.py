@@ -1,6 +1,9 @@
+import pytest
 from httpx import Response
 import onepasswordconnectsdk
 from onepasswordconnectsdk import client
+from onepasswordconnectsdk.config import FailedToLoadItemsException
+from onepasswordconnectsdk.errors import FailedToRetrieveItemException
 
 VAULT_ID = "abcdefghijklmnopqrstuvwxyz"
 ITEM_NAME1 = "TEST USER"
@@ -10,6 +13,7 @@ ITEM_ID2 = "wepiqdxdzncjtnvmv5fegud4q2"
 HOST = "https://mock_host"
 TOKEN = "jwt_token"
 SS_CLIENT = client.new_client(HOST, TOKEN)
+SS_CLIENT_ASYNC = client.new_client(HOST, TOKEN, True)
 
 USERNAME_VALUE = "new_user"
 PASSWORD_VALUE = "password"
@@ -73,6 +77,109 @@ def test_load_dict(respx_mock):
     assert config_with_values['password'] == PASSWORD_VALUE
 
 
+def test_load_concurrently(respx_mock):
+    mock_items_list1 = respx_mock.get(f"v1/vaults/{VAULT_ID}/items?filter=title eq \"{ITEM_NAME1}\"").mock(
+        return_value=Response(200, json=[item])
+    )
+    mock_item1 = respx_mock.get(f"v1/vaults/{VAULT_ID}/items/{ITEM_ID1}").mock(return_value=Response(200, json=item))
+    mock_items_list2 = respx_mock.get(f"v1/vaults/{VAULT_ID}/items?filter=title eq \"{ITEM_NAME2}\"").mock(
+        return_value=Response(200, json=[item2])
+    )
+    mock_item2 = respx_mock.get(f"v1/vaults/{VAULT_ID}/items/{ITEM_ID2}").mock(return_value=Response(200, json=item2))
+
+    config_with_values = onepasswordconnectsdk.load(SS_CLIENT, Config(), concurrency=4)
+
+    assert mock_items_list1.called
+    assert mock_item1.called
+    assert mock_items_list2.called
+    assert mock_item2.called
+
+    assert config_with_values.username == USERNAME_VALUE
+    assert config_with_values.password == PASSWORD_VALUE
+    assert config_with_values.host == HOST_VALUE
+
+
+def test_load_dict_concurrently_reports_single_failure(respx_mock):
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items?filter=title eq \"{ITEM_NAME1}\"").mock(
+        return_value=Response(200, json=[item]))
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items/{ITEM_ID1}").mock(return_value=Response(200, json=item))
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items?filter=title eq \"{ITEM_NAME2}\"").mock(
+        return_value=Response(200, json=[]))
+
+    with pytest.raises(FailedToRetrieveItemException):
+        onepasswordconnectsdk.load_dict(SS_CLIENT, get_two_item_config(), concurrency=2)
+
+
+def test_load_dict_concurrently_aggregates_failures(respx_mock):
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items?filter=title eq \"{ITEM_NAME1}\"").mock(
+        return_value=Response(500, json={"message": "internal error"}))
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items?filter=title eq \"{ITEM_NAME2}\"").mock(
+        return_value=Response(200, json=[]))
+
+    with pytest.raises(FailedToLoadItemsException) as exc_info:
+        onepasswordconnectsdk.load_dict(SS_CLIENT, get_two_item_config(), concurrency=2)
+
+    assert list(exc_info.value.errors) == [f"{VAULT_ID}/{ITEM_NAME1}", f"{VAULT_ID}/{ITEM_NAME2}"]
+
+
+@pytest.mark.asyncio
+async def test_aload(respx_mock):
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items?filter=title eq \"{ITEM_NAME1}\"").mock(
+        return_value=Response(200, json=[item]))
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items/{ITEM_ID1}").mock(return_value=Response(200, json=item))
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items?filter=title eq \"{ITEM_NAME2}\"").mock(
+        return_value=Response(200, json=[item2]))
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items/{ITEM_ID2}").mock(return_value=Response(200, json=item2))
+
+    config_with_values = await onepasswordconnectsdk.aload(SS_CLIENT_ASYNC, Config())
+
+    assert config_with_values.username == USERNAME_VALUE
+    assert config_with_values.password == PASSWORD_VALUE
+    assert config_with_values.host == HOST_VALUE
+
+
+@pytest.mark.asyncio
+async def test_aload_dict(respx_mock):
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items?filter=title eq \"{ITEM_NAME1}\"").mock(
+        return_value=Response(200, json=[item]))
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items/{ITEM_ID1}").mock(return_value=Response(200, json=item))
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items?filter=title eq \"{ITEM_NAME2}\"").mock(
+        return_value=Response(200, json=[item2]))
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items/{ITEM_ID2}").mock(return_value=Response(200, json=item2))
+
+    config_with_values = await onepasswordconnectsdk.aload_dict(SS_CLIENT_ASYNC, get_two_item_config())
+
+    assert config_with_values == {"username": USERNAME_VALUE, "host": HOST_VALUE}
+
+
+@pytest.mark.asyncio
+async def test_aload_dict_aggregates_failures(respx_mock):
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items?filter=title eq \"{ITEM_NAME1}\"").mock(
+        return_value=Response(200, json=[]))
+    respx_mock.get(f"v1/vaults/{VAULT_ID}/items?filter=title eq \"{ITEM_NAME2}\"").mock(
+        return_value=Response(200, json=[]))
+
+    with pytest.raises(FailedToLoadItemsException) as exc_info:
+        await onepasswordconnectsdk.aload_dict(SS_CLIENT_ASYNC, get_two_item_config())
+
+    assert len(exc_info.value.errors) == 2
+
+
+def get_two_item_config():
+    return {
+        "username": {
+            "opitem": ITEM_NAME1,
+            "opfield": ".username",
+            "opvault": VAULT_ID
+        },
+        "host": {
+            "opitem": ITEM_NAME2,
+            "opfield": ".host",
+            "opvault": VAULT_ID
+        }
+    }
+
+
 item = {
     "id": ITEM_ID1,
     "title": ITEM_NAME1,
@@ -0,0 +1,47 @@
+from onepasswordconnectsdk.models import Field, FieldSection, Item, Section
+
+
+def test_field_index_lookups():
+    item = generate_item()
+    index = item.field_index
+
+    assert index.by_id("password").label == "password"
+    assert index.by_purpose("USERNAME").id == "username"
+    assert index.by_label("host").id == "host-default"
+    assert index.by_label("host", section="Database").id == "host-db"
+    assert index.by_label("host", section="db_section").id == "host-db"
+    assert index.by_label("missing") is None
+    assert [field.id for field in index.with_label("host")] == ["host-default", "host-db"]
+
+
+def test_field_index_is_reused_until_fields_change():
+    item = generate_item()
+    index = item.field_index
+    assert item.field_index is index
+
+    item.fields.append(Field(id="port", label="port", value="5432"))
+    assert item.field_index is not index
+    assert item.field_index.by_label("port").value == "5432"
+
+    item.fields = [Field(id="other", label="other")]
+    assert item.field_index.by_label("host") is None
+
+
+def test_field_index_does_not_change_equality():
+    item = generate_item()
+    item.field_index
+    assert item == generate_item()
+
+
+def generate_item():
+    return Item(
+        id="wepiqdxdzncjtnvmv5fegud4qy",
+        title="Database",
+        sections=[Section(id="db_section", label="Database")],
+        fields=[
+            Field(id="username", label="username", purpose="USERNAME", value="user"),
+            Field(id="password", label="password", purpose="PASSWORD", value="secret"),
+            Field(id="host-default", label="host", value="localhost"),
+            Field(id="host-db", label="host", value="db.internal", section=FieldSection(id="db_section")),
+        ],
+    )
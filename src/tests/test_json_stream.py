@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from onepasswordconnectsdk.errors import FailedToDeserializeException
+from onepasswordconnectsdk.json_stream import JSONArrayParser, aiter_json_array, iter_json_array
+
+DOCUMENT = json.dumps([
+    {"id": "a", "title": "Quoted \"]\" and ,commas,"},
+    {"id": "b", "tags": [1, {"nested": None}]},
+    -1.5e3,
+    True,
+    "ünïcode",
+])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, len(DOCUMENT)])
+def test_parser_handles_any_chunk_boundary(chunk_size):
+    chunks = [DOCUMENT[i:i + chunk_size] for i in range(0, len(DOCUMENT), chunk_size)]
+
+    assert list(iter_json_array(chunks)) == json.loads(DOCUMENT)
+
+
+def test_parser_yields_elements_as_they_complete():
+    parser = JSONArrayParser()
+
+    assert parser.feed('[{"id": "a"}, {"id"') == [{"id": "a"}]
+    assert parser.feed(': "b"}, 12') == [{"id": "b"}]
+    assert parser.feed('3]') == [123]
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize("document", ["[]", " [ ] ", "null"])
+def test_parser_empty_arrays(document):
+    assert list(iter_json_array([document])) == []
+
+
+@pytest.mark.parametrize("document", ["", "[1, 2", '{"id": "a"}', "[1 2]", "[1]x", "[1.5e]"])
+def test_parser_invalid_arrays(document):
+    with pytest.raises(FailedToDeserializeException):
+        list(iter_json_array([document]))
+
+
+@pytest.mark.asyncio
+async def test_aiter_json_array():
+    async def chunks():
+        for i in range(0, len(DOCUMENT), 5):
+            yield DOCUMENT[i:i + 5]
+
+    assert [element async for element in aiter_json_array(chunks())] == json.loads(DOCUMENT)
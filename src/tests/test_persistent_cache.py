@@ -0,0 +1,295 @@
+import os
+
+import httpx
+import pytest
+from httpx import Response
+
+pytest.importorskip("cryptography")
+
+from onepasswordconnectsdk import client  # noqa: E402
+from onepasswordconnectsdk.config import ClientConfig, load_dict  # noqa: E402
+from onepasswordconnectsdk.errors import FailedToRetrieveItemException  # noqa: E402
+from onepasswordconnectsdk.models import Item  # noqa: E402
+from onepasswordconnectsdk.persistent_cache import PersistentItemCache  # noqa: E402
+
+VAULT_ID = "hfnjvi6aymbsnfc2xeeoheizda"
+ITEM_ID = "wepiqdxdzncjtnvmv5fegud4qy"
+HOST = "https://mock_host"
+TOKEN = "jwt_token"
+KEY = bytes(range(32))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "items.cache")
+
+
+def test_items_round_trip_encrypted(cache_path):
+    cache = PersistentItemCache(cache_path, KEY, ttl=60)
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID, title="Database", version=3))
+
+    item = PersistentItemCache(cache_path, KEY, ttl=60).get(VAULT_ID, ITEM_ID)
+
+    assert item.id == ITEM_ID
+    assert item.version == 3
+    with open(cache_path, "rb") as file:
+        assert b"Database" not in file.read()
+
+
+def test_wrong_key_reads_nothing(cache_path):
+    PersistentItemCache(cache_path, KEY, ttl=60).set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID))
+
+    cache = PersistentItemCache(cache_path, os.urandom(32), ttl=60)
+
+    assert cache.get(VAULT_ID, ITEM_ID) is None
+    assert cache.stats.decrypt_failures == 1
+
+
+def test_ttl_and_max_staleness(cache_path):
+    clock = FakeClock()
+    cache = PersistentItemCache(cache_path, KEY, ttl=10, max_staleness=100, clock=clock)
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID))
+
+    clock.now += 50
+    assert cache.get(VAULT_ID, ITEM_ID) is None
+    assert cache.fallback(VAULT_ID, ITEM_ID) is not None
+
+    clock.now += 50
+    assert cache.fallback(VAULT_ID, ITEM_ID) is None
+
+
+def test_latest_record_wins_and_file_is_compacted(cache_path):
+    cache = PersistentItemCache(cache_path, KEY, ttl=60)
+    for version in range(600):
+        cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID, version=version))
+
+    assert cache.get(VAULT_ID, ITEM_ID).version == 599
+    assert len(cache) == 1
+    assert os.path.getsize(cache_path) < 300 * 100
+
+
+def test_sees_items_written_by_another_instance(cache_path):
+    reader = PersistentItemCache(cache_path, KEY, ttl=60)
+    writer = PersistentItemCache(cache_path, KEY, ttl=60)
+    writer.set(VAULT_ID, "a", Item(id="a"))
+    assert reader.get(VAULT_ID, "a").id == "a"
+
+    writer.set(VAULT_ID, "b", Item(id="b"))
+    assert reader.get(VAULT_ID, "b").id == "b"
+
+
+def test_ignores_partially_written_record(cache_path):
+    cache = PersistentItemCache(cache_path, KEY, ttl=60)
+    cache.set(VAULT_ID, "a", Item(id="a"))
+    with open(cache_path, "ab") as file:
+        file.write(b"\x05\x00partial")
+
+    cache.set(VAULT_ID, "b", Item(id="b"))
+
+    fresh = PersistentItemCache(cache_path, KEY, ttl=60)
+    assert fresh.get(VAULT_ID, "a").id == "a"
+    assert fresh.get(VAULT_ID, "b").id == "b"
+
+
+def test_unchanged_item_is_not_rewritten(cache_path):
+    clock = FakeClock()
+    cache = PersistentItemCache(cache_path, KEY, clock=clock)
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID, version=1))
+    size = os.path.getsize(cache_path)
+
+    clock.now += 30
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID, version=1))
+    assert os.path.getsize(cache_path) == size
+
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID, version=2))
+    assert os.path.getsize(cache_path) > size
+    size = os.path.getsize(cache_path)
+
+    clock.now += 60
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID, version=2))
+    assert os.path.getsize(cache_path) > size
+
+
+def test_unchanged_item_is_rewritten_once_ttl_passed(cache_path):
+    clock = FakeClock()
+    cache = PersistentItemCache(cache_path, KEY, ttl=10, clock=clock)
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID, version=1))
+
+    clock.now += 10
+    assert cache.get(VAULT_ID, ITEM_ID) is None
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID, version=1))
+    assert cache.get(VAULT_ID, ITEM_ID).version == 1
+
+
+def test_invalidate_drops_item_across_instances(cache_path):
+    cache = PersistentItemCache(cache_path, KEY, ttl=60)
+    cache.set(VAULT_ID, "a", Item(id="a"))
+    cache.set(VAULT_ID, "b", Item(id="b"))
+
+    cache.invalidate(VAULT_ID, "a")
+
+    fresh = PersistentItemCache(cache_path, KEY, ttl=60)
+    assert fresh.get(VAULT_ID, "a") is None
+    assert fresh.fallback(VAULT_ID, "a") is None
+    assert fresh.get(VAULT_ID, "b").id == "b"
+    assert len(fresh) == 1
+
+
+def test_get_item_ignores_foreign_cache_file(respx_mock, cache_path):
+    with open(cache_path, "wb") as file:
+        file.write(b"not an item cache at all")
+    route = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        return_value=Response(200, json=get_item()))
+    cache = PersistentItemCache(cache_path, KEY, ttl=300)
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(persistent_cache=cache))
+
+    assert ss_client.get_item(ITEM_ID, VAULT_ID).id == ITEM_ID
+    assert ss_client.get_item(ITEM_ID, VAULT_ID).id == ITEM_ID
+    assert route.call_count == 2
+    assert cache.stats.errors == 4
+    with open(cache_path, "rb") as file:
+        assert file.read() == b"not an item cache at all"
+
+
+def test_rewrites_truncated_header(respx_mock, cache_path):
+    with open(cache_path, "wb") as file:
+        file.write(b"OPCA")
+    route = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        return_value=Response(200, json=get_item()))
+    cache = PersistentItemCache(cache_path, KEY, ttl=300)
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(persistent_cache=cache))
+
+    ss_client.get_item(ITEM_ID, VAULT_ID)
+    assert ss_client.get_item(ITEM_ID, VAULT_ID).id == ITEM_ID
+    assert route.call_count == 1
+    assert cache.stats.errors == 0
+
+
+@pytest.mark.asyncio
+async def test_get_item_ignores_unusable_lock_file_async(respx_mock, tmp_path):
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(return_value=Response(200, json=get_item()))
+    cache = PersistentItemCache(str(tmp_path / "missing" / "items.cache"), KEY, ttl=300)
+    ss_client = client.new_client(HOST, TOKEN, True, config=ClientConfig(persistent_cache=cache))
+
+    item = await ss_client.get_item(ITEM_ID, VAULT_ID)
+
+    assert item.id == ITEM_ID
+    assert cache.stats.errors == 2
+    assert cache.stats.misses == 1
+
+
+def test_rejects_invalid_key(cache_path):
+    with pytest.raises(ValueError):
+        PersistentItemCache(cache_path, b"short")
+
+
+def test_get_item_serves_stored_item_without_request(respx_mock, cache_path):
+    route = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        return_value=Response(200, json=get_item()))
+    config = ClientConfig(persistent_cache=PersistentItemCache(cache_path, KEY, ttl=300))
+    client.new_client(HOST, TOKEN, config=config).get_item(ITEM_ID, VAULT_ID)
+
+    restarted = ClientConfig(persistent_cache=PersistentItemCache(cache_path, KEY, ttl=300))
+    item = client.new_client(HOST, TOKEN, config=restarted).get_item(ITEM_ID, VAULT_ID)
+
+    assert item.title == "Test Login"
+    assert route.call_count == 1
+
+
+def test_load_dict_falls_back_when_connect_is_unreachable(respx_mock, cache_path):
+    route = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}")
+    route.side_effect = [Response(200, json=get_item()), httpx.ConnectError("connection refused")]
+    cache = PersistentItemCache(cache_path, KEY)
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(persistent_cache=cache))
+    config = {"username": {"opitem": ITEM_ID, "opfield": ".username", "opvault": VAULT_ID}}
+
+    assert load_dict(ss_client, config) == {"username": "new_user"}
+    assert load_dict(ss_client, config) == {"username": "new_user"}
+    assert cache.stats.fallbacks == 1
+
+
+def test_update_and_delete_invalidate_stored_item(respx_mock, cache_path):
+    updated = get_item()
+    updated["version"] = 2
+    route = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}")
+    route.side_effect = [Response(200, json=get_item()), Response(200, json=updated)]
+    respx_mock.put(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(return_value=Response(200, json=updated))
+    respx_mock.delete(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(return_value=Response(204))
+    cache = PersistentItemCache(cache_path, KEY, ttl=300)
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(persistent_cache=cache))
+
+    ss_client.get_item(ITEM_ID, VAULT_ID)
+    ss_client.update_item(ITEM_ID, VAULT_ID, Item(title="Test Login"))
+    assert ss_client.get_item(ITEM_ID, VAULT_ID).version == 2
+
+    ss_client.delete_item(ITEM_ID, VAULT_ID)
+    assert cache.fallback(VAULT_ID, ITEM_ID) is None
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_items_invalidates_stored_items_async(respx_mock, cache_path):
+    respx_mock.delete(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(return_value=Response(204))
+    cache = PersistentItemCache(cache_path, KEY, ttl=300)
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID))
+    ss_client = client.new_client(HOST, TOKEN, True, config=ClientConfig(persistent_cache=cache))
+
+    report = await ss_client.delete_items([ITEM_ID], VAULT_ID)
+
+    assert report.ok
+    assert cache.get(VAULT_ID, ITEM_ID) is None
+
+
+def test_get_item_does_not_fall_back_on_client_errors(respx_mock, cache_path):
+    cache = PersistentItemCache(cache_path, KEY)
+    cache.set(VAULT_ID, ITEM_ID, Item(id=ITEM_ID))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}").mock(
+        return_value=Response(403, json={"status": 403, "message": "forbidden"}))
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(persistent_cache=cache))
+
+    with pytest.raises(FailedToRetrieveItemException):
+        ss_client.get_item(ITEM_ID, VAULT_ID)
+
+
+@pytest.mark.asyncio
+async def test_get_item_falls_back_on_server_error_async(respx_mock, cache_path):
+    route = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}")
+    route.side_effect = [
+        Response(200, json=get_item()),
+        Response(503, json={"status": 503, "message": "unavailable"}),
+    ]
+    cache = PersistentItemCache(cache_path, KEY)
+    ss_client = client.new_client(HOST, TOKEN, True, config=ClientConfig(persistent_cache=cache))
+
+    await ss_client.get_item(ITEM_ID, VAULT_ID)
+    item = await ss_client.get_item(ITEM_ID, VAULT_ID)
+
+    assert item.id == ITEM_ID
+    assert cache.stats.fallbacks == 1
+
+
+def get_item():
+    return {
+        "id": ITEM_ID,
+        "title": "Test Login",
+        "version": 1,
+        "vault": {
+            "id": VAULT_ID
+        },
+        "category": "LOGIN",
+        "fields": [
+            {
+                "id": "username",
+                "label": "username",
+                "value": "new_user"
+            }
+        ]
+    }
@@ -0,0 +1,93 @@
+import threading
+import time
+
+import pytest
+from httpx import Response
+
+from onepasswordconnectsdk import client
+from onepasswordconnectsdk.config import ClientConfig
+from onepasswordconnectsdk.ratelimit import RateLimiter
+
+VAULT_ID = "hfnjvi6aymbsnfc2xeeoheizda"
+HOST = "https://mock_host"
+TOKEN = "jwt_token"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rate_limiter_allows_bursts_then_spaces_requests():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=10, burst=3, clock=clock)
+
+    assert [limiter._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter._reserve() == pytest.approx(0.1)
+    assert limiter._reserve() == pytest.approx(0.2)
+
+    clock.now = 10.0
+    assert [limiter._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter._reserve() == pytest.approx(0.1)
+
+
+def test_rate_limiter_stats():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=10, burst=1, clock=clock)
+    for _ in range(3):
+        limiter._reserve()
+
+    stats = limiter.stats
+    assert stats.acquired == 3
+    assert stats.delayed == 2
+    assert stats.wait_time == pytest.approx(0.3)
+    assert stats.max_wait == pytest.approx(0.2)
+
+
+def test_rate_limiter_is_thread_safe():
+    limiter = RateLimiter(rate=1000, burst=1, clock=FakeClock())
+    threads = [threading.Thread(target=lambda: [limiter._reserve() for _ in range(100)]) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert limiter.stats.acquired == 800
+    assert limiter.stats.max_wait == pytest.approx(0.799)
+
+
+def test_invalid_rate_limiter():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, burst=0)
+
+
+def test_client_waits_for_rate_limiter(respx_mock):
+    limiter = RateLimiter(rate=50, burst=1)
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(rate_limiter=limiter))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}").mock(return_value=Response(200, json={"id": VAULT_ID}))
+
+    start = time.monotonic()
+    for _ in range(3):
+        ss_client.get_vault(VAULT_ID)
+
+    assert time.monotonic() - start >= 0.035
+    assert limiter.stats.acquired == 3
+    assert limiter.stats.delayed == 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_waits_for_rate_limiter(respx_mock):
+    limiter = RateLimiter(rate=50, burst=2)
+    ss_client = client.new_client(HOST, TOKEN, True, config=ClientConfig(rate_limiter=limiter))
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items").mock(return_value=Response(200, json=[]))
+
+    for _ in range(3):
+        await ss_client.get_items(VAULT_ID)
+
+    assert limiter.stats.acquired == 3
+    assert limiter.stats.delayed == 1
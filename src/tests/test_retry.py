@@ -0,0 +1,158 @@
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from httpx import Response
+
+from onepasswordconnectsdk import client
+from onepasswordconnectsdk.config import ClientConfig
+from onepasswordconnectsdk.errors import FailedToRetrieveItemException
+from onepasswordconnectsdk.models import Item
+from onepasswordconnectsdk.retry import RetryPolicy
+
+VAULT_ID = "hfnjvi6aymbsnfc2xeeoheizda"
+ITEM_ID = "wepiqdxdzncjtnvmv5fegud4qy"
+ITEM_PATH = f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}"
+HOST = "https://mock_host"
+TOKEN = "jwt_token"
+NO_WAIT = RetryPolicy(max_attempts=3, backoff_factor=0, jitter=False)
+
+
+def test_backoff_grows_exponentially_up_to_the_maximum():
+    policy = RetryPolicy(max_attempts=10, backoff_factor=0.5, max_backoff=3.0, jitter=False)
+
+    assert [policy.backoff(attempt) for attempt in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_backoff_jitter_stays_below_the_backoff():
+    policy = RetryPolicy(max_attempts=10, backoff_factor=1.0, jitter=True)
+
+    assert all(0 <= policy.backoff(3) <= 4.0 for _ in range(100))
+
+
+def test_next_delay():
+    policy = RetryPolicy(max_attempts=3, backoff_factor=1.0, jitter=False)
+
+    assert policy.next_delay("GET", 1, response=Response(503)) == 1.0
+    assert policy.next_delay("GET", 2, error=httpx.ConnectError("reset")) == 2.0
+    assert policy.next_delay("GET", 3, response=Response(503)) is None
+    assert policy.next_delay("GET", 1, response=Response(404)) is None
+    assert policy.next_delay("POST", 1, response=Response(503)) is None
+    assert policy.next_delay("GET", 1, error=ValueError()) is None
+
+
+def test_next_delay_only_retries_transient_transport_errors():
+    policy = RetryPolicy(jitter=False)
+
+    assert policy.next_delay("GET", 1, error=httpx.ReadTimeout("timed out")) is not None
+    assert policy.next_delay("GET", 1, error=httpx.RemoteProtocolError("disconnected")) is not None
+    assert policy.next_delay("GET", 1, error=httpx.UnsupportedProtocol("bad scheme")) is None
+    assert policy.next_delay("GET", 1, error=httpx.LocalProtocolError("bad request")) is None
+    assert policy.next_delay("GET", 1, error=httpx.ProxyError("proxy failed")) is None
+
+
+def test_next_delay_honors_retry_after():
+    policy = RetryPolicy(max_attempts=3, backoff_factor=1.0, max_backoff=10.0, jitter=False)
+    retry_date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=5), usegmt=True)
+
+    assert policy.next_delay("GET", 1, response=Response(429, headers={"Retry-After": "7"})) == 7.0
+    assert 3.0 < policy.next_delay("GET", 1, response=Response(429, headers={"Retry-After": retry_date})) <= 5.0
+    assert policy.next_delay("GET", 1, response=Response(429, headers={"Retry-After": "60"})) is None
+    assert policy.next_delay("GET", 1, response=Response(429, headers={"Retry-After": "soon"})) == 1.0
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_client_retries_transient_errors(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(retry=NO_WAIT))
+    route = respx_mock.get(ITEM_PATH).mock(side_effect=[
+        httpx.ConnectError("connection reset"),
+        Response(503),
+        Response(200, json={"id": ITEM_ID, "title": "Test Login"}),
+    ])
+
+    item = ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+
+    assert item.id == ITEM_ID
+    assert route.call_count == 3
+
+
+def test_client_gives_up_after_max_attempts(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(retry=NO_WAIT))
+    route = respx_mock.get(ITEM_PATH).mock(return_value=Response(502))
+
+    with pytest.raises(FailedToRetrieveItemException) as exc_info:
+        ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+
+    assert exc_info.value.status_code == 502
+    assert route.call_count == 3
+
+
+def test_client_does_not_retry_permanent_transport_errors(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(retry=NO_WAIT))
+    route = respx_mock.get(ITEM_PATH).mock(side_effect=httpx.UnsupportedProtocol("unsupported scheme"))
+
+    with pytest.raises(httpx.UnsupportedProtocol):
+        ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+
+    assert route.call_count == 1
+
+
+def test_client_does_not_retry_post(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(retry=NO_WAIT))
+    route = respx_mock.post(f"/v1/vaults/{VAULT_ID}/items").mock(return_value=Response(503))
+
+    with pytest.raises(FailedToRetrieveItemException):
+        ss_client.create_item(VAULT_ID, Item(title="Test Login"))
+
+    assert route.call_count == 1
+
+
+def test_client_without_retry_policy(respx_mock):
+    route = respx_mock.get(ITEM_PATH).mock(return_value=Response(503))
+
+    with pytest.raises(FailedToRetrieveItemException):
+        client.new_client(HOST, TOKEN).get_item_by_id(ITEM_ID, VAULT_ID)
+
+    assert route.call_count == 1
+
+
+def test_client_retries_streamed_requests(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(retry=NO_WAIT))
+    route = respx_mock.get(f"/v1/vaults/{VAULT_ID}/items").mock(side_effect=[
+        Response(429, headers={"Retry-After": "0"}),
+        Response(200, json=[{"id": ITEM_ID}]),
+    ])
+
+    assert [item.id for item in ss_client.iter_items(VAULT_ID)] == [ITEM_ID]
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_retries_transient_errors(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, True, config=ClientConfig(retry=NO_WAIT))
+    route = respx_mock.get(ITEM_PATH).mock(side_effect=[
+        httpx.ReadError("connection reset"),
+        Response(503),
+        Response(200, json={"id": ITEM_ID, "title": "Test Login"}),
+    ])
+
+    item = await ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+
+    assert item.id == ITEM_ID
+    assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_async_client_raises_connection_errors_after_max_attempts(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, True, config=ClientConfig(retry=NO_WAIT))
+    route = respx_mock.get(ITEM_PATH).mock(side_effect=httpx.ConnectError("connection refused"))
+
+    with pytest.raises(httpx.ConnectError):
+        await ss_client.get_item_by_id(ITEM_ID, VAULT_ID)
+
+    assert route.call_count == 3
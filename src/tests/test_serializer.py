@@ -0,0 +1,113 @@
+import json
+
+import httpx
+import pytest
+from dateutil.parser import parse
+
+from onepasswordconnectsdk.errors import FailedToDeserializeException
+from onepasswordconnectsdk.json_backend import get_json_backend
+from onepasswordconnectsdk.models import Field, Item, ItemVault, SummaryItem
+from onepasswordconnectsdk.serializer import Serializer
+
+SERIALIZER = Serializer()
+
+
+@pytest.mark.parametrize("value", [
+    "2020-10-29T17:52:17Z",
+    "2020-10-29T17:52:17.123Z",
+    "2020-10-29T17:52:17.123456789Z",
+    "2020-10-29T17:52:17+01:00",
+    "2020-10-29T17:52:17-05:30",
+    "2020-10-29T17:52:17",
+])
+def test_deserialize_datetime_matches_dateutil(value):
+    result = SERIALIZER.deserialize(json.dumps(value), "datetime")
+    expected = parse(value)
+
+    assert result == expected
+    assert repr(result.tzinfo) == repr(expected.tzinfo)
+
+
+def test_deserialize_invalid_datetime():
+    with pytest.raises(FailedToDeserializeException):
+        SERIALIZER.deserialize(json.dumps("not a date"), "datetime")
+
+
+def test_deserialize_nested_models():
+    payload = {
+        "id": "wepiqdxdzncjtnvmv5fegud4qy",
+        "title": "Test Login",
+        "version": "3",
+        "vault": {"id": "hfnjvi6aymbsnfc2xeeoheizda"},
+        "sections": [{"id": "section1", "label": "Section 1"}],
+        "fields": [{"id": "username", "label": "username", "value": "user", "section": {"id": "section1"}}],
+        "unknown": "ignored",
+    }
+
+    item = SERIALIZER.deserialize(json.dumps(payload), "Item")
+
+    assert isinstance(item, Item)
+    assert item.version == 3
+    assert item.vault.id == "hfnjvi6aymbsnfc2xeeoheizda"
+    assert item.sections[0].label == "Section 1"
+    assert item.fields[0].section.id == "section1"
+
+
+def test_deserialize_list_and_none():
+    items = SERIALIZER.deserialize(json.dumps([{"id": "a"}, None]), "list[SummaryItem]")
+
+    assert isinstance(items[0], SummaryItem)
+    assert items[1] is None
+    assert SERIALIZER.deserialize(json.dumps(None), "list[SummaryItem]") is None
+
+
+def test_converters_are_compiled_once():
+    assert Serializer._converter("list[Item]") is Serializer._converter("list[Item]")
+    assert Serializer._converter("Item") is Serializer._converter(Item)
+
+
+def installed_backends():
+    names = []
+    for name in ("json", "orjson", "ujson"):
+        try:
+            get_json_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+@pytest.mark.parametrize("backend", installed_backends())
+def test_serialize_matches_httpx_json_encoding(backend):
+    item = Item(
+        title="Ünïcode / \"quoted\"",
+        vault=ItemVault(id="hfnjvi6aymbsnfc2xeeoheizda"),
+        category="LOGIN",
+        tags=["a", "b"],
+        fields=[Field(value="pässword", purpose="PASSWORD", entropy=130.0688473607018)],
+    )
+    serializer = Serializer(backend)
+    expected = httpx.Request("POST", "https://mock_host", json=serializer.sanitize_for_serialization(item)).content
+
+    assert serializer.serialize(item) == expected
+
+
+@pytest.mark.parametrize("backend", installed_backends())
+def test_deserialize_with_backend(backend):
+    item = Serializer(backend).deserialize(b'{"id": "a", "title": "\\u00fcber"}', "Item")
+
+    assert item.title == "\u00fcber"
+
+
+def test_unknown_json_backend():
+    with pytest.raises(ValueError):
+        Serializer("simplejson")
+
+
+def test_models_are_slotted():
+    item = SERIALIZER.deserialize(json.dumps({"id": "a", "vault": {"id": "b"}, "fields": [{"id": "c"}]}), "Item")
+
+    assert not hasattr(item, "__dict__")
+    assert not hasattr(item.fields[0], "__dict__")
+    assert item.discriminator is None
+    assert item.to_dict()["vault"] == {"id": "b"}
@@ -0,0 +1,103 @@
+import pytest
+from httpx import Response
+
+from onepasswordconnectsdk import client
+from onepasswordconnectsdk.config import ClientConfig
+from onepasswordconnectsdk.sessions import SHARED_SESSIONS, SessionRegistry
+
+VAULT_ID = "hfnjvi6aymbsnfc2xeeoheizda"
+HOST = "https://mock_host"
+TOKEN = "jwt_token"
+
+
+class FakeSession:
+    def __init__(self):
+        self.closed = False
+
+
+def test_session_registry_reference_counting():
+    registry = SessionRegistry()
+    first = registry.acquire("key", FakeSession)
+    second = registry.acquire("key", FakeSession)
+
+    assert first is second
+    assert registry.refcount("key") == 2
+    assert registry.release("key") is None
+    assert registry.release("key") is first
+    assert registry.refcount("key") == 0
+    assert len(registry) == 0
+    assert registry.release("key") is None
+
+
+def test_shared_clients_share_one_session(respx_mock):
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}").mock(return_value=Response(200, json={"id": VAULT_ID}))
+    first = client.new_client(HOST, TOKEN, shared=True)
+    second = client.new_client(HOST, TOKEN, shared=True)
+    unshared = client.new_client(HOST, TOKEN)
+    other_token = client.new_client(HOST, "other_token", shared=True)
+
+    assert first.session is second.session
+    assert unshared.session is not first.session
+    assert other_token.session is not first.session
+
+    first.close()
+    first.close()
+    assert not second.session.is_closed
+    assert second.get_vault(VAULT_ID).id == VAULT_ID
+
+    second.close()
+    assert second.session.is_closed
+    other_token.close()
+    assert len(SHARED_SESSIONS) == 0
+
+
+def test_shared_clients_with_different_configs():
+    config = ClientConfig(max_connections=10)
+    first = client.new_client(HOST, TOKEN, config=config, shared=True)
+    second = client.new_client(HOST, TOKEN, config=config, shared=True)
+    other = client.new_client(HOST, TOKEN, config=ClientConfig(max_connections=10), shared=True)
+
+    assert first.session is second.session
+    assert other.session is not first.session
+    for shared_client in (first, second, other):
+        shared_client.close()
+
+
+def test_deleting_a_shared_client_releases_its_session():
+    first = client.new_client(HOST, TOKEN, shared=True)
+    session = first.session
+    second = client.new_client(HOST, TOKEN, shared=True)
+
+    del first
+    assert not session.is_closed
+
+    del second
+    assert session.is_closed
+
+
+def test_new_client_from_environment_shared(monkeypatch):
+    monkeypatch.setenv("OP_CONNECT_HOST", HOST)
+    monkeypatch.setenv("OP_CONNECT_TOKEN", TOKEN)
+    first = client.new_client_from_environment(shared=True)
+    second = client.new_client_from_environment(shared=True)
+
+    assert first.session is second.session
+    first.close()
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_async_clients(respx_mock):
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}").mock(return_value=Response(200, json={"id": VAULT_ID}))
+    first = client.new_client(HOST, TOKEN, True, shared=True)
+    second = client.new_client(HOST, TOKEN, True, shared=True)
+    sync_client = client.new_client(HOST, TOKEN, shared=True)
+
+    assert first.session is second.session
+    assert sync_client.session is not first.session
+
+    await first.aclose()
+    assert (await second.get_vault(VAULT_ID)).id == VAULT_ID
+    await second.aclose()
+    assert second.session.is_closed
+    sync_client.close()
@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from httpx import Response
+
+from onepasswordconnectsdk import client
+from onepasswordconnectsdk.config import ClientConfig
+from onepasswordconnectsdk.errors import FailedToRetrieveItemException
+from onepasswordconnectsdk.singleflight import AsyncSingleFlight, SingleFlight
+
+VAULT_ID = "hfnjvi6aymbsnfc2xeeoheizda"
+ITEM_ID = "wepiqdxdzncjtnvmv5fegud4qy"
+ITEM_PATH = f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}"
+HOST = "https://mock_host"
+TOKEN = "jwt_token"
+
+
+def test_single_flight_shares_concurrent_calls():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def func():
+        calls.append(1)
+        release.wait(1)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(flight.do, "key", func) for _ in range(5)]
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.do("key", lambda: "next") == "next"
+
+
+def test_single_flight_shares_errors():
+    flight = SingleFlight()
+
+    with pytest.raises(KeyError):
+        flight.do("key", lambda: {}["missing"])
+    assert flight.do("key", lambda: "recovered") == "recovered"
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_survives_cancelled_leader():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    leader = asyncio.ensure_future(flight.do("key", func))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.do("key", func))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "result"
+    assert len(calls) == 1
+
+
+def test_client_coalesces_concurrent_gets(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(coalesce_requests=True))
+
+    def respond(request):
+        time.sleep(0.05)
+        return Response(200, json={"id": ITEM_ID, "title": "Test Login"})
+
+    route = respx_mock.get(ITEM_PATH).mock(side_effect=respond)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        items = list(executor.map(lambda _: ss_client.get_item_by_id(ITEM_ID, VAULT_ID), range(8)))
+
+    assert route.call_count == 1
+    assert all(item is items[0] for item in items)
+
+
+@pytest.mark.asyncio
+async def test_async_client_coalesces_concurrent_gets(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, True, config=ClientConfig(coalesce_requests=True))
+
+    async def respond(request):
+        await asyncio.sleep(0.01)
+        return Response(200, json={"id": ITEM_ID, "title": "Test Login"})
+
+    route = respx_mock.get(ITEM_PATH).mock(side_effect=respond)
+
+    items = await asyncio.gather(*(ss_client.get_item(ITEM_ID, VAULT_ID) for _ in range(50)))
+
+    assert route.call_count == 1
+    assert all(item is items[0] for item in items)
+
+    await ss_client.get_item(ITEM_ID, VAULT_ID)
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_coalesced_errors(respx_mock):
+    ss_client = client.new_client(HOST, TOKEN, True, config=ClientConfig(coalesce_requests=True))
+
+    async def respond(request):
+        await asyncio.sleep(0.01)
+        return Response(404, json={"status": 404, "message": "item not found"})
+
+    route = respx_mock.get(ITEM_PATH).mock(side_effect=respond)
+
+    results = await asyncio.gather(
+        *(ss_client.get_item_by_id(ITEM_ID, VAULT_ID) for _ in range(5)), return_exceptions=True
+    )
+
+    assert route.call_count == 1
+    assert all(isinstance(result, FailedToRetrieveItemException) for result in results)
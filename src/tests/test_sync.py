@@ -0,0 +1,139 @@
+import pytest
+from httpx import Response
+
+from onepasswordconnectsdk import client
+from onepasswordconnectsdk.cache import ItemCache
+from onepasswordconnectsdk.config import ClientConfig
+from onepasswordconnectsdk.errors import FailedToRetrieveItemException
+from onepasswordconnectsdk.models import VaultChange
+from onepasswordconnectsdk.sync import AsyncVaultSync, VaultSync
+
+VAULT_ID = "hfnjvi6aymbsnfc2xeeoheizda"
+HOST = "https://mock_host"
+TOKEN = "jwt_token"
+
+
+def mock_vault(respx_mock, *content_versions):
+    return respx_mock.get(f"/v1/vaults/{VAULT_ID}").mock(
+        side_effect=[Response(200, json={"id": VAULT_ID, "contentVersion": v}) for v in content_versions])
+
+
+def mock_listing(respx_mock, *listings):
+    return respx_mock.get(f"/v1/vaults/{VAULT_ID}/items").mock(
+        side_effect=[Response(200, json=[summary(i, v) for i, v in listing]) for listing in listings])
+
+
+def mock_item(respx_mock, item_id, *versions):
+    return respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/{item_id}").mock(
+        side_effect=[Response(200, json=item(item_id, v)) for v in versions])
+
+
+def test_sync_mirrors_vault(respx_mock):
+    mock_vault(respx_mock, 1)
+    mock_listing(respx_mock, [("a", 1), ("b", 1)])
+    mock_item(respx_mock, "a", 1)
+    mock_item(respx_mock, "b", 1)
+    vault_sync = VaultSync(client.new_client(HOST, TOKEN), VAULT_ID)
+
+    changes = vault_sync.sync()
+
+    assert [(c.kind, c.item_id) for c in changes] == [(VaultChange.ADDED, "a"), (VaultChange.ADDED, "b")]
+    assert sorted(vault_sync.items) == ["a", "b"]
+    assert vault_sync.content_version == 1
+
+
+def test_sync_skips_listing_when_content_version_unchanged(respx_mock):
+    mock_vault(respx_mock, 1, 1)
+    listing = mock_listing(respx_mock, [("a", 1)])
+    mock_item(respx_mock, "a", 1)
+    vault_sync = VaultSync(client.new_client(HOST, TOKEN), VAULT_ID)
+
+    vault_sync.sync()
+    assert vault_sync.sync() == []
+    assert listing.call_count == 1
+
+
+def test_sync_fetches_only_changed_items(respx_mock):
+    mock_vault(respx_mock, 1, 2)
+    mock_listing(respx_mock, [("a", 1), ("b", 1)], [("a", 2), ("c", 1)])
+    a = mock_item(respx_mock, "a", 1, 2)
+    mock_item(respx_mock, "b", 1)
+    mock_item(respx_mock, "c", 1)
+    vault_sync = VaultSync(client.new_client(HOST, TOKEN), VAULT_ID)
+    vault_sync.sync()
+
+    changes = vault_sync.sync()
+
+    assert [(c.kind, c.item_id) for c in changes] == [
+        (VaultChange.CHANGED, "a"), (VaultChange.ADDED, "c"), (VaultChange.REMOVED, "b")]
+    assert changes[0].previous.version == 1
+    assert changes[0].item.version == 2
+    assert changes[2].item is None
+    assert sorted(vault_sync.items) == ["a", "c"]
+    assert a.call_count == 2
+
+
+def test_sync_bypasses_item_cache_for_changed_items(respx_mock):
+    mock_vault(respx_mock, 1, 2)
+    mock_listing(respx_mock, [("a", 1)], [("a", 2)])
+    mock_item(respx_mock, "a", 1, 2)
+    ss_client = client.new_client(HOST, TOKEN, config=ClientConfig(item_cache=ItemCache()))
+    vault_sync = VaultSync(ss_client, VAULT_ID)
+    vault_sync.sync()
+
+    vault_sync.sync()
+
+    assert vault_sync.items["a"].version == 2
+
+
+def test_sync_treats_item_deleted_after_listing_as_removed(respx_mock):
+    mock_vault(respx_mock, 1)
+    mock_listing(respx_mock, [("a", 1)])
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/a").mock(
+        return_value=Response(404, json={"status": 404, "message": "item not found"}))
+    vault_sync = VaultSync(client.new_client(HOST, TOKEN), VAULT_ID)
+
+    assert vault_sync.sync() == []
+    assert vault_sync.items == {}
+
+
+def test_failed_sync_leaves_mirror_untouched(respx_mock):
+    mock_vault(respx_mock, 1, 2)
+    mock_listing(respx_mock, [("a", 1)], [("a", 2)])
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/a").mock(side_effect=[
+        Response(200, json=item("a", 1)),
+        Response(500, json={"status": 500, "message": "internal error"}),
+    ])
+    vault_sync = VaultSync(client.new_client(HOST, TOKEN), VAULT_ID)
+    vault_sync.sync()
+
+    with pytest.raises(FailedToRetrieveItemException):
+        vault_sync.sync()
+
+    assert vault_sync.items["a"].version == 1
+    assert vault_sync.content_version == 1
+
+
+@pytest.mark.asyncio
+async def test_async_sync_fetches_only_changed_items(respx_mock):
+    mock_vault(respx_mock, 1, 1, 2)
+    listing = mock_listing(respx_mock, [("a", 1), ("b", 1)], [("a", 1)])
+    a = mock_item(respx_mock, "a", 1)
+    mock_item(respx_mock, "b", 1)
+    vault_sync = AsyncVaultSync(client.new_client(HOST, TOKEN, True), VAULT_ID)
+
+    await vault_sync.sync()
+    assert await vault_sync.sync() == []
+    changes = await vault_sync.sync()
+
+    assert [(c.kind, c.item_id) for c in changes] == [(VaultChange.REMOVED, "b")]
+    assert listing.call_count == 2
+    assert a.call_count == 1
+
+
+def summary(item_id, version):
+    return {"id": item_id, "title": item_id, "version": version, "vault": {"id": VAULT_ID}, "category": "LOGIN"}
+
+
+def item(item_id, version):
+    return {**summary(item_id, version), "fields": []}
@@ -1,4 +1,8 @@
-from onepasswordconnectsdk.utils import PathBuilder
+import os
+
+import pytest
+
+from onepasswordconnectsdk.utils import PathBuilder, atomic_write
 
 VAULT_ID = "hfnjvi6aymbsnfc2xeeoheizda"
 ITEM_ID = "wepiqdxdzncjtnvmv5fegud4qy"
@@ -43,3 +47,18 @@ def test_single_file_path():
 def test_file_conten_path():
     path = PathBuilder().vaults(VAULT_ID).items(ITEM_ID).files(FILE_ID).content().build()
     assert path == f"/v1/vaults/{VAULT_ID}/items/{ITEM_ID}/files/{FILE_ID}/content"
+
+
+def test_atomic_write(tmp_path):
+    destination = tmp_path / "file.txt"
+    with atomic_write(str(destination)) as file:
+        file.write(b"content")
+        assert not destination.exists()
+    assert destination.read_bytes() == b"content"
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(str(destination)) as file:
+            file.write(b"partial")
+            raise RuntimeError()
+    assert destination.read_bytes() == b"content"
+    assert os.listdir(tmp_path) == ["file.txt"]
@@ -0,0 +1,88 @@
+import pytest
+from httpx import Response
+
+from onepasswordconnectsdk import client
+from onepasswordconnectsdk.errors import FailedToRetrieveHealthException
+
+HOST = "https://mock_host"
+TOKEN = "jwt_token"
+HEALTH = {
+    "name": "1Password Connect API",
+    "version": "1.7.3",
+    "dependencies": [{"service": "sqlite", "status": "ACTIVE", "message": "Connected to database"}],
+}
+
+
+def mock_server(respx_mock):
+    heartbeat = respx_mock.get(f"{HOST}/heartbeat").mock(return_value=Response(200, text="."))
+    health = respx_mock.get(f"{HOST}/health").mock(return_value=Response(200, json=HEALTH))
+    return heartbeat, health
+
+
+def test_warmup(respx_mock):
+    heartbeat, health = mock_server(respx_mock)
+
+    result = client.new_client(HOST, TOKEN).warmup(connections=4)
+
+    assert heartbeat.call_count == 4
+    assert health.call_count == 1
+    assert result == HEALTH
+
+
+def test_warmup_without_health(respx_mock):
+    heartbeat, health = mock_server(respx_mock)
+
+    assert client.new_client(HOST, TOKEN).warmup(health=False) is None
+    assert heartbeat.call_count == 1
+    assert not health.called
+
+
+def test_warmup_failure(respx_mock):
+    respx_mock.get(f"{HOST}/heartbeat").mock(return_value=Response(503, text="unavailable"))
+
+    with pytest.raises(FailedToRetrieveHealthException) as exc_info:
+        client.new_client(HOST, TOKEN).warmup(connections=2)
+
+    assert exc_info.value.status_code == 503
+
+
+def test_new_client_warm(respx_mock):
+    heartbeat, health = mock_server(respx_mock)
+
+    client.new_client(HOST, TOKEN, warm=True)
+
+    assert heartbeat.called
+    assert health.called
+
+
+def test_new_async_client_warm_requires_event_loop():
+    with pytest.raises(RuntimeError):
+        client.new_client(HOST, TOKEN, True, warm=True)
+
+
+@pytest.mark.asyncio
+async def test_async_warmup(respx_mock):
+    heartbeat, health = mock_server(respx_mock)
+
+    result = await client.new_client(HOST, TOKEN, True).warmup(connections=3)
+
+    assert heartbeat.call_count == 3
+    assert result == HEALTH
+
+
+@pytest.mark.asyncio
+async def test_new_async_client_warm(respx_mock):
+    heartbeat, health = mock_server(respx_mock)
+
+    async_client = client.new_client(HOST, TOKEN, True, warm=True)
+
+    assert await async_client.warmup_task == HEALTH
+    assert heartbeat.called
+
+
+@pytest.mark.asyncio
+async def test_async_warmup_failure(respx_mock):
+    respx_mock.get(f"{HOST}/heartbeat").mock(return_value=Response(502, json={"status": 502, "message": "bad gateway"}))
+
+    with pytest.raises(FailedToRetrieveHealthException):
+        await client.new_client(HOST, TOKEN, True).warmup()
@@ -0,0 +1,184 @@
+import threading
+
+import pytest
+from httpx import Response
+
+from onepasswordconnectsdk import client
+from onepasswordconnectsdk.models import VaultChange
+from onepasswordconnectsdk.watch import AsyncItemWatcher, ItemWatcher
+
+VAULT_ID = "hfnjvi6aymbsnfc2xeeoheizda"
+OTHER_VAULT_ID = "av223f76ydutdngislnkbz6z5u"
+HOST = "https://mock_host"
+TOKEN = "jwt_token"
+
+
+def mock_listing(respx_mock, vault_id, *listings):
+    return respx_mock.get(f"/v1/vaults/{vault_id}/items").mock(
+        side_effect=[Response(200, json=[summary(vault_id, i, v) for i, v in listing]) for listing in listings])
+
+
+def mock_item(respx_mock, vault_id, item_id, *versions):
+    return respx_mock.get(f"/v1/vaults/{vault_id}/items/{item_id}").mock(
+        side_effect=[Response(200, json=item(vault_id, item_id, v)) for v in versions])
+
+
+def test_first_poll_records_items_without_changes(respx_mock):
+    mock_listing(respx_mock, VAULT_ID, [("a", 1)])
+    mock_item(respx_mock, VAULT_ID, "a", 1)
+    watcher = ItemWatcher(client.new_client(HOST, TOKEN))
+    watcher.watch(VAULT_ID, "a")
+
+    assert watcher.poll() == []
+    assert watcher.get(VAULT_ID, "a").version == 1
+
+
+def test_poll_lists_each_vault_once_and_fetches_changed_items(respx_mock):
+    listing = mock_listing(respx_mock, VAULT_ID, [("a", 1), ("b", 1)], [("a", 2), ("b", 1)])
+    a = mock_item(respx_mock, VAULT_ID, "a", 1, 2)
+    b = mock_item(respx_mock, VAULT_ID, "b", 1)
+    watcher = ItemWatcher(client.new_client(HOST, TOKEN))
+    watcher.watch(VAULT_ID, "a")
+    watcher.watch(VAULT_ID, "b")
+    seen = []
+    watcher.subscribe(seen.append)
+    watcher.poll()
+
+    changes = watcher.poll()
+
+    assert [(c.kind, c.vault_id, c.item_id) for c in changes] == [(VaultChange.CHANGED, VAULT_ID, "a")]
+    assert changes[0].previous.version == 1
+    assert changes[0].item.version == 2
+    assert seen == changes
+    assert listing.call_count == 2
+    assert a.call_count == 2
+    assert b.call_count == 1
+
+
+def test_poll_reports_removed_and_added_items(respx_mock):
+    mock_listing(respx_mock, VAULT_ID, [("a", 1)], [], [("a", 3)])
+    mock_item(respx_mock, VAULT_ID, "a", 1, 3)
+    watcher = ItemWatcher(client.new_client(HOST, TOKEN))
+    watcher.watch(VAULT_ID, "a")
+    watcher.poll()
+
+    assert [c.kind for c in watcher.poll()] == [VaultChange.REMOVED]
+    assert [c.kind for c in watcher.poll()] == [VaultChange.ADDED]
+
+
+def test_interval_backs_off_and_resets_on_change(respx_mock):
+    mock_listing(respx_mock, VAULT_ID, [("a", 1)], [("a", 1)], [("a", 1)], [("a", 2)])
+    mock_item(respx_mock, VAULT_ID, "a", 1, 2)
+    watcher = ItemWatcher(client.new_client(HOST, TOKEN), min_interval=1, max_interval=3, jitter=0)
+    watcher.watch(VAULT_ID, "a")
+
+    intervals = []
+    for _ in range(4):
+        watcher.poll()
+        intervals.append(watcher.next_delay())
+
+    assert intervals == [2, 3, 3, 1]
+
+
+def test_poll_errors_are_reported_and_retried(respx_mock):
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items").mock(
+        return_value=Response(500, json={"status": 500, "message": "internal error"}))
+    errors = []
+    watcher = ItemWatcher(client.new_client(HOST, TOKEN), on_error=errors.append)
+    watcher.watch(VAULT_ID, "a")
+
+    assert watcher.poll() == []
+    assert len(errors) == 1
+    assert watcher.last_error is errors[0]
+
+
+def test_background_thread_notifies_callbacks(respx_mock):
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items").mock(
+        side_effect=[Response(200, json=[summary(VAULT_ID, "a", 1)])]
+        + [Response(200, json=[summary(VAULT_ID, "a", 2)])] * 10)
+    mock_item(respx_mock, VAULT_ID, "a", 1, 2)
+    changed = threading.Event()
+    watcher = ItemWatcher(client.new_client(HOST, TOKEN), min_interval=0.01, max_interval=0.01)
+    watcher.watch(VAULT_ID, "a")
+    watcher.subscribe(lambda change: changed.set())
+
+    with watcher:
+        assert changed.wait(5)
+
+    assert watcher.get(VAULT_ID, "a").version == 2
+
+
+def test_on_error_can_unwatch_failing_item(respx_mock):
+    mock_listing(respx_mock, VAULT_ID, [("a", 1)], [("a", 1)])
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items/a").mock(
+        return_value=Response(403, json={"status": 403, "message": "forbidden"}))
+    watcher = ItemWatcher(client.new_client(HOST, TOKEN), on_error=lambda error: watcher.unwatch(VAULT_ID, "a"))
+    watcher.watch(VAULT_ID, "a")
+
+    done = threading.Thread(target=watcher.poll, daemon=True)
+    done.start()
+    done.join(5)
+
+    assert not done.is_alive()
+    assert watcher.poll() == []
+
+
+def test_failing_on_error_does_not_escape_poll(respx_mock):
+    respx_mock.get(f"/v1/vaults/{VAULT_ID}/items").mock(
+        return_value=Response(500, json={"status": 500, "message": "internal error"}))
+
+    def on_error(error):
+        raise RuntimeError("handler failed")
+
+    watcher = ItemWatcher(client.new_client(HOST, TOKEN), on_error=on_error)
+    watcher.watch(VAULT_ID, "a")
+
+    assert watcher.poll() == []
+    assert isinstance(watcher.last_error, RuntimeError)
+
+
+def test_rejects_invalid_intervals():
+    with pytest.raises(ValueError):
+        ItemWatcher(client.new_client(HOST, TOKEN), min_interval=10, max_interval=5)
+    with pytest.raises(ValueError):
+        ItemWatcher(client.new_client(HOST, TOKEN), jitter=1)
+
+
+@pytest.mark.asyncio
+async def test_async_watcher_yields_changes_across_vaults(respx_mock):
+    mock_listing(respx_mock, VAULT_ID, [("a", 1)], [("a", 2)])
+    mock_listing(respx_mock, OTHER_VAULT_ID, [("b", 1)], [])
+    mock_item(respx_mock, VAULT_ID, "a", 1, 2)
+    mock_item(respx_mock, OTHER_VAULT_ID, "b", 1)
+    watcher = AsyncItemWatcher(client.new_client(HOST, TOKEN, True), min_interval=0.01, max_interval=0.01)
+    watcher.watch(VAULT_ID, "a")
+    watcher.watch(OTHER_VAULT_ID, "b")
+
+    changes = []
+    async for change in watcher:
+        changes.append(change)
+        if len(changes) == 2:
+            watcher.stop()
+
+    assert sorted((c.kind, c.item_id) for c in changes) == [(VaultChange.CHANGED, "a"), (VaultChange.REMOVED, "b")]
+
+
+@pytest.mark.asyncio
+async def test_async_watcher_stopped_before_iterating_does_not_poll(respx_mock):
+    listing = mock_listing(respx_mock, VAULT_ID, [("a", 1)])
+    watcher = AsyncItemWatcher(client.new_client(HOST, TOKEN, True), min_interval=0.01, max_interval=0.01)
+    watcher.watch(VAULT_ID, "a")
+
+    watcher.stop()
+    changes = [change async for change in watcher]
+
+    assert changes == []
+    assert not listing.called
+
+
+def summary(vault_id, item_id, version):
+    return {"id": item_id, "title": item_id, "version": version, "vault": {"id": vault_id}, "category": "LOGIN"}
+
+
+def item(vault_id, item_id, version):
+    return {**summary(vault_id, item_id, version), "fields": []}